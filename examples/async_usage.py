@@ -1,55 +1,40 @@
-# Example of using procyclingstats package asynchronously. Third party
-# "requests_futures" package is needed to run the example.
+# Example of using procyclingstats package asynchronously. Requests are made
+# natively with asyncio when "aiohttp" package is installed, otherwise they
+# are made in the event loop's thread pool.
+import asyncio
 import time
-from concurrent.futures import as_completed
 from pprint import pprint
 
-from requests_futures.sessions import FuturesSession
-
 from procyclingstats import Ranking, Rider
 
 
 def main():
     ranking = Ranking("rankings/me/individual-season").individual_ranking()
     # get heights of first 50 riders from the ranking asynchronously
-    futures_heights = ranking_heights_future(ranking)
+    async_heights = asyncio.run(ranking_heights_async(ranking))
     # get heights of first 50 riders from the ranking synchronously
     heights = ranking_heights(ranking)
-    pprint(futures_heights)
+    pprint(async_heights)
 
-def ranking_heights_future(ranking):
+async def ranking_heights_async(ranking):
     t1 = time.time()
-    session = FuturesSession()
-    # initialize list with future sessions
-    future_sessions = []
-    # make requests to all stage pages asynchronously and store them in a list
-    for row in ranking[:50]:
-        # create absolute URL from stage_url in the table
-        # start making request to the URL
-        url = "https://www.procyclingstats.com/" + row['rider_url']
-        future_session = session.get(url)
-        future_sessions.append(future_session)
-
-    # create rider objects from obtained HTMLs and store heights in 
-    # riders_heights dict, make sure you don't use
-    # concurrent.futures.as_completed(future_sessions)
-    # in the for loop, because in that case the order of riders won't be
-    # preserved
+    urls = [row['rider_url'] for row in ranking[:50]]
+    # at most 8 requests are made at once, order of returned riders is the
+    # same as the order of given URLs
+    riders = await Rider.create_many_async(urls, concurrency=8)
     riders_heights = {}
-    for i, future_session in enumerate(future_sessions):
-        html = future_session.result().text
-        rider = Rider(ranking[i]['rider_url'], html=html, update_html=False)
+    for rider in riders:
         riders_heights[rider.relative_url()] = rider.height()
-    print("With requests_futures package:", time.time() - t1)
+    print("Asynchronously:", time.time() - t1)
     return riders_heights
-    
+
 def ranking_heights(ranking):
     t1 = time.time()
     riders_heights = {}
     for row in ranking[:50]:
         rider = Rider(row['rider_url'])
         riders_heights[rider.relative_url()] = rider.height()
-    print("Without requests_futures package:", time.time() - t1)
+    print("Synchronously:", time.time() - t1)
     return riders_heights
 
 if __name__ == "__main__":
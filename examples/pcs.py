@@ -14,8 +14,8 @@ def print_parsed_data(scraper_instance, label):
     Helper function to print parsed data from a scraper instance.
     """
     print(f'{label} CLASS')
-    for method in scraper_instance.parse().keys():
-        print(f"{method}: {scraper_instance.parse()[method]}")
+    for method, parsed_data in scraper_instance.parse().items():
+        print(f"{method}: {parsed_data}")
 
 def main():
     # Race class
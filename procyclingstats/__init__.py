@@ -1,20 +1,41 @@
 import os
 import sys
 
+from .cache import HTMLTreeCache, ResponseCache
+from .classifications import ClassificationsEngine
+from .entities import EntityIndex
+from .instrumentation import Instrumentation
 from .race_climbs_scraper import RaceClimbs
 from .race_combative_riders_scraper import RaceCombativeRiders
 from .race_scraper import Race
 from .race_startlist_scraper import RaceStartlist
 from .ranking_scraper import Ranking
+from .rate_limiter import RateLimiter
+from .refresh import IncrementalRefresher, RefreshReport
 from .rider_results_scraper import RiderResults
 from .rider_scraper import Rider
 from .scraper import Scraper
 from .stage_scraper import Stage
 from .team_scraper import Team
 from .today_races_scraper import TodayRaces
+from .transport import (DictTransport, DirectoryTransport, HTTPTransport,
+                        Transport, WARCTransport)
 
 __all__ = [
     "Scraper",
+    "ResponseCache",
+    "HTMLTreeCache",
+    "RateLimiter",
+    "Instrumentation",
+    "IncrementalRefresher",
+    "RefreshReport",
+    "Transport",
+    "DictTransport",
+    "DirectoryTransport",
+    "WARCTransport",
+    "HTTPTransport",
+    "ClassificationsEngine",
+    "EntityIndex",
     "RaceClimbs",
     "RaceCombativeRiders",
     "Race",
@@ -10,6 +10,7 @@ from tabulate import tabulate
 from .__init__ import (Race, RaceClimbs, RaceStartlist, Ranking, Rider,
                        RiderResults, Scraper, Stage, Team, RaceCombativeRiders,
                        TodayRaces)
+from .dispatch import get_corresponding_scraping_class
 
 scraper_classes = (
     Race,
@@ -32,7 +33,9 @@ def configure_parser():
         "given URL is evaluated automatically. When no scraper object is " +
         "able to parse given URL ValueError is raised. When ran in " +
         "interactive mode, nothing is printed and scraper object ready " +
-        "for parsing is available as `obj`.")
+        "for parsing is available as `obj`. Run with `ingest` as the " +
+        "first argument to ingest a directory with saved pages, see " +
+        "`python -m procyclingstats ingest --help`.")
     )
     parser.add_argument("url", metavar="url", type=str,
                         help="Absolute or relative URL of PCS page to parse.")
@@ -41,39 +44,6 @@ def configure_parser():
             help="Whether to print full or shortened tables in output.")
     return parser
 
-def get_corresponding_scraping_class(relative_url: str) -> Any:
-    """
-    Returns scraping class for given URL (!!!does not work 100% of times!!!).
-
-    :param relative_url: Relative URL of some PCS page.
-    :return: Scraping class for the URL. None when not found.
-    """
-    splitted_url = relative_url.split("/")
-    if relative_url == "" or relative_url == "index.php" or relative_url == "index.php/":
-        return TodayRaces
-    if "comative-riders" in splitted_url or "combative-riders" in splitted_url:
-        return RaceCombativeRiders
-    if (splitted_url[0] == "rider" and "results" in splitted_url) or \
-        (relative_url[:9] == "rider.php"):  
-        return RiderResults
-    elif splitted_url[0] == "rider":
-        return Rider
-    elif len(splitted_url) >= 4 and splitted_url[0] == "race" and \
-        ("stage" in splitted_url[3] or "gc" in splitted_url[3] or "prologue" \
-        in splitted_url[3] or "result" in splitted_url):
-        return Stage
-    elif "rankings" in relative_url:
-        return Ranking
-    elif splitted_url[0] == "race" and "startlist" in splitted_url:
-        return RaceStartlist
-    elif "team" == splitted_url[0]:
-        return Team
-    elif splitted_url[0] == "race" and "climbs" in splitted_url:
-        return RaceClimbs
-    elif splitted_url[0] == "race":
-        return Race
-    return None
-
 def run(args: argparse.Namespace) -> Scraper:
     """
     Runs CLI script with given arguments.
@@ -126,5 +96,8 @@ def tab(table: List[Dict[str, Any]]) -> None:
     print(tabulate(table, headers="keys"))
 
 if __name__ == "__main__":
+    if sys.argv[1:2] == ["ingest"]:
+        from .ingest import main as ingest_main
+        sys.exit(ingest_main(sys.argv[2:]))
     arguments = configure_parser().parse_args()
     obj = run(arguments)
@@ -0,0 +1,258 @@
+"""
+Benchmark of HTML parsing over saved pages (by default the HTML fixtures).
+
+Usage::
+
+    python -m procyclingstats.bench --save baseline.json
+    python -m procyclingstats.bench --compare baseline.json
+"""
+import argparse
+import glob
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from selectolax.parser import HTMLParser
+from tabulate import tabulate
+
+from .bulk import path_to_url
+from .errors import ExpectedParsingError
+from .scraper import Scraper
+
+Results = Dict[str, Dict[str, Dict[str, float]]]
+"""Fixture names mapped to operations mapped to measured values
+(``seconds``, ``ops_per_sec`` and ``peak_bytes``)."""
+
+FIXTURES_PATH: str = "tests/fixtures/"
+"""Default directory with HTML files to benchmark."""
+REPEAT: int = 5
+"""Default count of measured runs of every operation."""
+THRESHOLD: float = 0.2
+"""Default relative slowdown reported as a regression."""
+NOISE_FLOOR: float = 2e-5
+"""Slowdowns smaller than this count of seconds aren't regressions."""
+
+
+def benchmark_file(path: str, url: Optional[str] = None,
+                   repeat: int = REPEAT) -> Dict[str, Dict[str, float]]:
+    """
+    Benchmarks parsing of one HTML file. Measured operations are
+    ``HTMLParser`` (creating the tree), ``_html_valid``, ``_set_up_html``,
+    ``construct`` (whole object creation from HTML), every parsing method
+    and ``parse``.
+    Every run uses a new scraper object, so memoized values aren't reused.
+
+    :param path: Path to HTML file named like HTML fixtures.
+    :param url: Relative URL of the page, defaults to URL made from path by
+        `path_to_url`.
+    :param repeat: Count of measured runs of every operation, defaults to
+        `REPEAT`.
+    :raises ValueError: When scraping class for the URL wasn't found or HTML
+        is invalid.
+    :raises RuntimeError: When an operation raised unexpected exception.
+    :return: Operations mapped to median time in seconds, operations per
+        second and peak of memory allocated by the operation in bytes.
+        Parsing methods that raised `ExpectedParsingError` (data isn't
+        available on the page) are skipped.
+    """
+    url = url if url is not None else path_to_url(path)
+    with open(path, "r", encoding="utf-8") as html_file:
+        html = html_file.read()
+    scraping_class = Scraper._scraping_class_for(url)
+
+    def unfetched() -> Scraper:
+        scraper_obj = scraping_class._create_unfetched(url)
+        scraper_obj._html = HTMLParser(html)
+        return scraper_obj
+
+    def ready() -> Scraper:
+        scraper_obj = unfetched()
+        scraper_obj._prepare_fetched_html()
+        return scraper_obj
+
+    operations: List[Tuple[str, Callable[[], Any], Callable[[Any], Any]]] = [
+        ("HTMLParser", lambda: html, HTMLParser),
+        ("_html_valid", unfetched,
+         lambda scraper_obj: scraper_obj._html_valid()),
+        ("_set_up_html", unfetched,
+         lambda scraper_obj: scraper_obj._set_up_html()),
+        # works for classes with different constructor signature too
+        ("construct", lambda: None, lambda _: ready()),
+    ]
+    for method_name in scraping_class._parsing_method_names():
+        operations.append((method_name, ready, _method_caller(method_name)))
+    operations.append(("parse", ready,
+                       lambda scraper_obj: scraper_obj.parse()))
+
+    ready()
+    results = {}
+    for name, setup, operation in operations:
+        try:
+            seconds, peak_bytes = _measure(setup, operation, repeat)
+        except ExpectedParsingError:
+            continue
+        except Exception as e:
+            raise RuntimeError(
+                f"Benchmark of '{name}' failed on '{path}': {e}") from e
+        results[name] = {
+            "seconds": seconds,
+            "ops_per_sec": 1 / seconds if seconds else float("inf"),
+            "peak_bytes": peak_bytes
+        }
+    return results
+
+def benchmark(paths: Iterable[str], repeat: int = REPEAT) -> Results:
+    """
+    Benchmarks parsing of given HTML files, see `benchmark_file`.
+
+    :param paths: Paths to HTML files named like HTML fixtures.
+    :param repeat: Count of measured runs of every operation, defaults to
+        `REPEAT`.
+    :raises RuntimeError: When an operation raised unexpected exception.
+    :return: Fixture names (filenames without file type) mapped to results of
+        `benchmark_file`. Files that couldn't be parsed are skipped.
+    """
+    results = {}
+    for path in paths:
+        name = os.path.splitext(os.path.basename(path))[0]
+        try:
+            results[name] = benchmark_file(path, repeat=repeat)
+        except ValueError:
+            continue
+    return results
+
+def compare(results: Results, baseline: Results,
+            threshold: float = THRESHOLD
+            ) -> List[Tuple[str, str, float, float]]:
+    """
+    Finds operations that are slower than in baseline.
+
+    :param results: Current results from `benchmark`.
+    :param baseline: Baseline results from `benchmark`.
+    :param threshold: Relative slowdown reported as a regression, defaults to
+        `THRESHOLD`.
+    :return: List of tuples of fixture name, operation, baseline seconds and
+        current seconds.
+    """
+    regressions = []
+    for fixture, operations in results.items():
+        for operation, values in operations.items():
+            base = baseline.get(fixture, {}).get(operation)
+            if base is None:
+                continue
+            slowdown = values["seconds"] - base["seconds"]
+            if (slowdown > NOISE_FLOOR and
+                    slowdown > base["seconds"] * threshold):
+                regressions.append((fixture, operation, base["seconds"],
+                                    values["seconds"]))
+    return regressions
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Runs the benchmark from command line.
+
+    :param argv: Command line arguments, defaults to `sys.argv`.
+    :return: Exit code, 1 when regressions were found, otherwise 0.
+    """
+    args = _configure_parser().parse_args(argv)
+    paths = sorted(glob.glob(os.path.join(args.fixtures, "*.txt")) +
+                   glob.glob(os.path.join(args.fixtures, "*.html")))
+    if args.filter:
+        paths = [path for path in paths
+                 if args.filter in os.path.basename(path)]
+    results = benchmark(paths, args.repeat)
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as baseline_file:
+            json.dump(results, baseline_file, indent=2)
+
+    table = []
+    for fixture, operations in results.items():
+        for operation, values in operations.items():
+            table.append([fixture, operation,
+                          f"{values['seconds'] * 1000:.3f}",
+                          f"{values['ops_per_sec']:.1f}",
+                          f"{values['peak_bytes'] / 1024:.1f}"])
+    print(tabulate(table, headers=["fixture", "operation", "ms", "ops/sec",
+                                   "peak KiB"]))
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)
+        regressions = compare(results, baseline, args.threshold)
+        print()
+        if not regressions:
+            print("No regressions found.")
+            return 0
+        print(tabulate(
+            [[fixture, operation, f"{base * 1000:.3f}",
+              f"{current * 1000:.3f}", f"{current / base - 1:+.0%}"]
+             for fixture, operation, base, current in regressions],
+            headers=["fixture", "operation", "baseline ms", "ms", "change"]))
+        return 1
+    return 0
+
+def _measure(setup: Callable[[], Any], operation: Callable[[Any], Any],
+             repeat: int) -> Tuple[float, int]:
+    """
+    Measures given operation. Setup isn't measured and is called before
+    every run.
+
+    :param setup: Function returning argument of the operation.
+    :param operation: Function to measure.
+    :param repeat: Count of measured runs.
+    :return: Tuple of median time in seconds and peak of memory allocated by
+        the operation in bytes (measured in separate run, because tracing
+        slows the operation down).
+    """
+    times = []
+    for _ in range(repeat):
+        arg = setup()
+        start = time.perf_counter()
+        operation(arg)
+        times.append(time.perf_counter() - start)
+
+    arg = setup()
+    tracemalloc.start()
+    try:
+        operation(arg)
+        peak_bytes = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return statistics.median(times), peak_bytes
+
+def _method_caller(method_name: str) -> Callable[[Scraper], Any]:
+    """
+    :param method_name: Name of parsing method.
+    :return: Function calling the parsing method of given scraper object.
+    """
+    return lambda scraper_obj: getattr(scraper_obj, method_name)()
+
+def _configure_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m procyclingstats.bench",
+        description=(
+            "Benchmark of HTML parsing over saved pages named like HTML " +
+            "fixtures. Reports median time, operations per second and peak " +
+            "allocated memory of every operation."))
+    parser.add_argument("--fixtures", default=FIXTURES_PATH,
+                        help="Directory with HTML files, defaults to "
+                             f"'{FIXTURES_PATH}'.")
+    parser.add_argument("--filter", default="",
+                        help="Benchmark only files containing given string.")
+    parser.add_argument("--repeat", type=int, default=REPEAT,
+                        help="Count of measured runs of every operation.")
+    parser.add_argument("--save", metavar="PATH",
+                        help="Save results as baseline JSON.")
+    parser.add_argument("--compare", metavar="PATH",
+                        help="Compare results with baseline JSON and exit "
+                             "with code 1 when regressions are found.")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD,
+                        help="Relative slowdown reported as a regression.")
+    return parser
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import (Any, Dict, Iterable, Iterator, Mapping, Optional, Tuple,
+                    Union)
+
+from selectolax.parser import HTMLParser
+
+from .scraper import Scraper
+
+ParsedFile = Tuple[str, Union[Dict[str, Any], Exception]]
+"""Path of parsed file and its parsed data or exception raised while
+parsing."""
+
+CHUNKSIZE: int = 16
+"""Default count of files sent to a worker process at once."""
+
+
+def path_to_url(path: str) -> str:
+    """
+    Makes relative URL from path of a HTML file named the same way as HTML
+    fixtures, e.g. ``race_tour-de-france_2022_stage-21.txt`` ->
+    ``race/tour-de-france/2022/stage-21``.
+
+    :param path: Path to HTML file.
+    :return: Relative URL.
+    """
+    filename = os.path.splitext(os.path.basename(path))[0]
+    return filename.replace("_", "/")
+
+def parse_file(path: str, url: Optional[str] = None,
+               fields: Optional[Tuple[str, ...]] = None) -> Dict[str, Any]:
+    """
+    Parses HTML file with scraping class corresponding to its URL.
+
+    :param path: Path to HTML file.
+    :param url: Relative URL of the page, defaults to URL made from path by
+        `path_to_url`.
+    :param fields: Names of parsing methods to call, see `Scraper.parse`.
+        All parsing methods are called when None.
+    :raises ValueError: When scraping class for the URL wasn't found or HTML
+        is invalid.
+    :return: Parsed data.
+    """
+    url = url if url is not None else path_to_url(path)
+    with open(path, "r", encoding="utf-8") as html_file:
+        html = html_file.read()
+    scraper_obj = Scraper._scraping_class_for(url)._create_unfetched(url)
+    scraper_obj._html = HTMLParser(html)
+    scraper_obj._prepare_fetched_html()
+    return scraper_obj.parse(fields=fields)
+
+def parse_files(paths: Union[Iterable[str], Mapping[str, str]],
+                workers: Optional[int] = None,
+                chunksize: int = CHUNKSIZE,
+                fields: Optional[Iterable[str]] = None
+                ) -> Iterator[ParsedFile]:
+    """
+    Parses HTML files in a process pool. Every file is parsed by scraping
+    class corresponding to its URL. Worker processes get only paths and URLs
+    and return plain dicts, so HTML trees are never sent between processes.
+
+    Usage:
+
+    >>> from procyclingstats.bulk import parse_files
+    >>> paths = glob.glob("tests/fixtures/*.txt")
+    >>> for path, data in parse_files(paths, workers=4):
+    ...     if isinstance(data, Exception):
+    ...         print(path, data)
+
+    :param paths: Paths to HTML files named like HTML fixtures (relative URL
+        with slashes replaced by underscores, see `path_to_url`). Mapping of
+        paths to relative URLs can be passed instead, when files are named
+        differently.
+    :param workers: Count of worker processes, defaults to count of CPUs.
+        When 1, files are parsed in current process.
+    :param chunksize: Count of files sent to a worker process at once,
+        defaults to `CHUNKSIZE`.
+    :param fields: Names of parsing methods to call, see `Scraper.parse`.
+        All parsing methods are called when None.
+    :return: Generator yielding tuples of path and parsed data in the same
+        order as given paths. When parsing of a file failed, the raised
+        exception is yielded instead of parsed data.
+    """
+    if isinstance(paths, Mapping):
+        files: Iterable[Tuple[str, Optional[str]]] = paths.items()
+    else:
+        files = ((path, None) for path in paths)
+    fields = tuple(fields) if fields is not None else None
+    tasks = ((path, url, fields) for path, url in files)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for task in tasks:
+            yield task[0], _parse_task(task)
+        return
+
+    # files are submitted in batches, so generator of paths isn't consumed
+    # all at once, next batch is submitted before results of current batch
+    # are yielded, so workers don't wait for the consumer
+    batch_size = workers * chunksize * 4
+    with ProcessPoolExecutor(workers) as executor:
+        batch = list(itertools.islice(tasks, batch_size))
+        results = executor.map(_parse_task, batch, chunksize=chunksize)
+        while batch:
+            next_batch = list(itertools.islice(tasks, batch_size))
+            next_results = executor.map(_parse_task, next_batch,
+                                        chunksize=chunksize)
+            for (path, _, _), result in zip(batch, results):
+                yield path, result
+            batch, results = next_batch, next_results
+
+def _parse_task(task: Tuple[str, Optional[str], Optional[Tuple[str, ...]]]
+                ) -> Union[Dict[str, Any], Exception]:
+    """
+    Parses one file in worker process.
+
+    :param task: Tuple of path, URL and fields, see `parse_file`.
+    :return: Parsed data or exception raised while parsing.
+    """
+    try:
+        return parse_file(*task)
+    except Exception as e: # pylint: disable=broad-except
+        return e
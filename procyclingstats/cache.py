@@ -0,0 +1,466 @@
+import datetime
+import math
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from selectolax.parser import HTMLParser
+
+
+class CachedResponse(NamedTuple):
+    """Response stored in `ResponseCache`."""
+    url: str
+    text: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    stored_at: float
+
+
+class ResponseCache:
+    """
+    Persistent SQLite backed cache of HTTP responses keyed by absolute URL.
+    When set as `Scraper.cache`, it's consulted before every request.
+
+    Every URL has a TTL (time to live) in seconds. While cached response is
+    younger than its TTL it's returned without making a request. Expired
+    responses are revalidated with ``If-None-Match`` and
+    ``If-Modified-Since`` headers, so unchanged pages don't have to be
+    downloaded again.
+
+    TTL is evaluated in this order:
+
+    - first matching pattern from `ttl_rules`
+    - `historical_ttl` when URL contains a season older than the current one,
+      e.g. ``race/tour-de-france/1963/stage-1`` or ``team/banesto-1997``
+    - `default_ttl`
+
+    Usage:
+
+    >>> from procyclingstats import Scraper, ResponseCache
+    >>> Scraper.cache = ResponseCache("pcs_cache.sqlite", max_bytes=500_000_000)
+    >>> Scraper.cache.stats()
+    {'hits': 0, 'misses': 0, 'revalidations': 0, 'entries': 0, 'bytes': 0}
+
+    :param path: Path to SQLite database file, defaults to
+        ``pcs_cache.sqlite``. Use ``:memory:`` for in-memory cache.
+    :param ttl_rules: List of tuples with regex pattern (searched in absolute
+        URL) and TTL in seconds, defaults to `DEFAULT_TTL_RULES`.
+    :param default_ttl: TTL of URLs that don't match any rule, defaults to one
+        hour.
+    :param historical_ttl: TTL of URLs from past seasons, defaults to
+        ``math.inf`` (never expire).
+    :param max_bytes: Maximum size of all cached responses bodies. Least
+        recently used responses are evicted when exceeded. Defaults to None
+        (unlimited).
+    """
+
+    DEFAULT_TTL_RULES: List[Tuple[str, float]] = [
+        (r"\.com/(index\.php/?)?$", 60),
+        (r"/live$", 60),
+    ]
+    """Default TTL rules. Homepage and live pages expire after a minute."""
+
+    def __init__(self, path: str = "pcs_cache.sqlite",
+                 ttl_rules: Optional[List[Tuple[str, float]]] = None,
+                 default_ttl: float = 3600,
+                 historical_ttl: float = math.inf,
+                 max_bytes: Optional[int] = None) -> None:
+        self.path = path
+        if ttl_rules is None:
+            ttl_rules = self.DEFAULT_TTL_RULES
+        self.ttl_rules = [(re.compile(pattern), ttl)
+                          for pattern, ttl in ttl_rules]
+        self.default_ttl = default_ttl
+        self.historical_ttl = historical_ttl
+        self.max_bytes = max_bytes
+
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "url TEXT PRIMARY KEY, text TEXT NOT NULL, etag TEXT, "
+            "last_modified TEXT, stored_at REAL NOT NULL, "
+            "accessed_at REAL NOT NULL, size INTEGER NOT NULL)")
+        self._connection.commit()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(path='{self.path}')"
+
+    def ttl(self, url: str) -> float:
+        """
+        Gets TTL of given URL.
+
+        :param url: Absolute URL.
+        :return: TTL in seconds.
+        """
+        for pattern, ttl in self.ttl_rules:
+            if pattern.search(url):
+                return ttl
+        if self._is_historical(url):
+            return self.historical_ttl
+        return self.default_ttl
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """
+        Gets cached response of given URL regardless of its age.
+
+        :param url: Absolute URL.
+        :return: Cached response, None when URL isn't cached.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT url, text, etag, last_modified, stored_at "
+                "FROM responses WHERE url = ?", (url,)).fetchone()
+        if row is None:
+            return None
+        return CachedResponse(*row)
+
+    def is_fresh(self, response: CachedResponse) -> bool:
+        """
+        Checks whether cached response is younger than its TTL.
+
+        :param response: Cached response.
+        :return: True if response doesn't have to be revalidated.
+        """
+        return time.time() - response.stored_at < self.ttl(response.url)
+
+    def lookup(self, url: str) -> Tuple[Optional[CachedResponse], bool]:
+        """
+        Looks up given URL and updates hit and miss counters.
+
+        :param url: Absolute URL.
+        :return: Tuple of cached response (None when not cached) and whether
+            it's fresh.
+        """
+        response = self.get(url)
+        if response is not None and self.is_fresh(response):
+            with self._lock:
+                self.hits += 1
+            self._touch(url, refresh=False)
+            return response, True
+        return response, False
+
+    @staticmethod
+    def conditional_headers(response: Optional[CachedResponse]
+                            ) -> Dict[str, str]:
+        """
+        Makes headers for revalidation of given cached response.
+
+        :param response: Cached response, might be None.
+        :return: Dict with ``If-None-Match`` and ``If-Modified-Since`` headers
+            when available.
+        """
+        headers = {}
+        if response is None:
+            return headers
+        if response.etag:
+            headers["If-None-Match"] = response.etag
+        if response.last_modified:
+            headers["If-Modified-Since"] = response.last_modified
+        return headers
+
+    def revalidated(self, response: CachedResponse) -> str:
+        """
+        Marks cached response as revalidated (server responded with
+        ``304 Not Modified``), so its TTL starts again.
+
+        :param response: Cached response that was revalidated.
+        :return: Text of the cached response.
+        """
+        with self._lock:
+            self.revalidations += 1
+        self._touch(response.url, refresh=True)
+        return response.text
+
+    def store(self, url: str, text: str,
+              headers: Optional[Dict[str, str]] = None) -> None:
+        """
+        Stores response in the cache. Counted as cache miss.
+
+        :param url: Absolute URL of the response.
+        :param text: Response body.
+        :param headers: Response headers, ``ETag`` and ``Last-Modified`` are
+            stored for later revalidation.
+        """
+        headers = headers or {}
+        now = time.time()
+        with self._lock:
+            self.misses += 1
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (url, text, headers.get("ETag"), headers.get("Last-Modified"),
+                 now, now, len(text.encode("utf-8"))))
+            self._evict()
+            self._connection.commit()
+
+    def invalidate(self, url: str) -> None:
+        """
+        Removes given URL from the cache.
+
+        :param url: Absolute URL.
+        """
+        with self._lock:
+            self._connection.execute(
+                "DELETE FROM responses WHERE url = ?", (url,))
+            self._connection.commit()
+
+    def clear(self) -> None:
+        """Removes all responses from the cache and resets counters."""
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+            self._connection.commit()
+            self.hits = 0
+            self.misses = 0
+            self.revalidations = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Gets cache statistics.
+
+        :return: Dict with ``hits``, ``misses``, ``revalidations``, count of
+            cached ``entries`` and their total size in ``bytes``.
+        """
+        with self._lock:
+            entries, size = self._connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidations": self.revalidations,
+                "entries": entries,
+                "bytes": size
+            }
+
+    def close(self) -> None:
+        """Closes database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def _touch(self, url: str, refresh: bool) -> None:
+        """
+        Updates access time of cached response.
+
+        :param url: Absolute URL.
+        :param refresh: Whether to also reset time when response was stored.
+        """
+        now = time.time()
+        with self._lock:
+            if refresh:
+                self._connection.execute(
+                    "UPDATE responses SET accessed_at = ?, stored_at = ? "
+                    "WHERE url = ?", (now, now, url))
+            else:
+                self._connection.execute(
+                    "UPDATE responses SET accessed_at = ? WHERE url = ?",
+                    (now, url))
+            self._connection.commit()
+
+    def _evict(self) -> None:
+        """
+        Removes least recently used responses until total size is smaller
+        than `self.max_bytes`. Lock has to be acquired by caller.
+        """
+        if self.max_bytes is None:
+            return
+        total, = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        if total <= self.max_bytes:
+            return
+        rows = self._connection.execute(
+            "SELECT url, size FROM responses ORDER BY accessed_at").fetchall()
+        for url, size in rows:
+            if total <= self.max_bytes:
+                break
+            self._connection.execute(
+                "DELETE FROM responses WHERE url = ?", (url,))
+            total -= size
+
+    @staticmethod
+    def _is_historical(url: str) -> bool:
+        """
+        Checks whether given URL points to a page from past season.
+
+        :param url: Absolute URL.
+        :return: True if URL contains year older than the current one.
+        """
+        current_year = datetime.date.today().year
+        for year in re.findall(r"(?:/|-)(\d{4})(?=/|$)", url):
+            if 1869 <= int(year) < current_year:
+                return True
+        return False
+
+
+class HTMLTreeCache:
+    """
+    In-process LRU cache of parsed HTML trees keyed by absolute URL. When set
+    as `Scraper.tree_cache`, `Scraper.update_html` and `Scraper.fetch_html`
+    return trees from the cache instead of making request and parsing the
+    HTML again.
+
+    Scrapers modify their HTML trees before parsing (see
+    `Scraper._set_up_html`), so the cache always returns a copy of the cached
+    tree, which is still considerably faster than parsing the HTML.
+
+    Trees expire after their TTL, so pages that change (e.g. today races or
+    current rankings) aren't served stale for the whole life of the process.
+    By default homepage and live pages expire by `ResponseCache` rules,
+    pages from past seasons never expire and other pages expire after
+    `max_age` seconds.
+
+    Usage:
+
+    >>> from procyclingstats import HTMLTreeCache, Race, Scraper
+    >>> Scraper.tree_cache = HTMLTreeCache(max_bytes=100_000_000)
+    >>> race = Race("race/tour-de-france/2022")
+    >>> race = Race("race/tour-de-france/2022") # no request is made
+    >>> Scraper.tree_cache.stats()
+    {'hits': 1, 'misses': 1, 'entries': 1, 'bytes': 203811}
+
+    :param max_bytes: Maximum size of all cached HTMLs in bytes, defaults to
+        50 MB. Least recently used trees are evicted when exceeded.
+    :param max_age: TTL in seconds of trees of pages that aren't from past
+        seasons, defaults to 10 minutes.
+    :param ttl: Function returning TTL in seconds of given absolute URL,
+        e.g. ``ttl`` method of a `ResponseCache` to use its rules. Overrides
+        the default TTL evaluation when given.
+    """
+
+    def __init__(self, max_bytes: int = 50_000_000, max_age: float = 600,
+                 ttl: Optional[Callable[[str], float]] = None) -> None:
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._ttl = ttl
+        self._ttl_rules = [(re.compile(pattern), rule_ttl)
+                           for pattern, rule_ttl
+                           in ResponseCache.DEFAULT_TTL_RULES]
+        self.hits = 0
+        self.misses = 0
+        self._entries: \
+            "OrderedDict[str, Tuple[HTMLParser, str, int, float]]" = \
+            OrderedDict()
+        """URLs mapped to tuples of tree, HTML, size and expiration time."""
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(max_bytes={self.max_bytes})"
+
+    def __contains__(self, url: str) -> bool:
+        with self._lock:
+            return self._entry(url) is not None
+
+    def ttl(self, url: str) -> float:
+        """
+        Gets TTL of given URL.
+
+        :param url: Absolute URL.
+        :return: TTL in seconds.
+        """
+        if self._ttl is not None:
+            return self._ttl(url)
+        for pattern, rule_ttl in self._ttl_rules:
+            if pattern.search(url):
+                return min(rule_ttl, self.max_age)
+        if ResponseCache._is_historical(url):
+            return math.inf
+        return self.max_age
+
+    def get(self, url: str) -> Optional[HTMLParser]:
+        """
+        Gets copy of cached HTML tree of given URL.
+
+        :param url: Absolute URL.
+        :return: Copy of cached tree, None when URL isn't cached or its tree
+            expired.
+        """
+        with self._lock:
+            entry = self._entry(url)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(url)
+            self.hits += 1
+            return entry[0].clone()
+
+    def get_raw(self, url: str) -> Optional[str]:
+        """
+        Gets cached HTML of given URL as string.
+
+        :param url: Absolute URL.
+        :return: Cached HTML, None when URL isn't cached or its tree expired.
+        """
+        with self._lock:
+            entry = self._entry(url)
+            return entry[1] if entry is not None else None
+
+    def put(self, url: str, html: str) -> HTMLParser:
+        """
+        Parses given HTML and stores the tree in the cache.
+
+        :param url: Absolute URL of the HTML.
+        :param html: HTML to parse.
+        :return: Copy of the cached tree that might be modified.
+        """
+        tree = HTMLParser(html)
+        size = len(html.encode("utf-8"))
+        expires_at = time.time() + self.ttl(url)
+        with self._lock:
+            if url in self._entries:
+                self._size -= self._entries.pop(url)[2]
+            self._entries[url] = (tree, html, size, expires_at)
+            self._size += size
+            while self._size > self.max_bytes and len(self._entries) > 1:
+                _, (_, _, evicted_size, _) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+        return tree.clone()
+
+    def invalidate(self, url: Optional[str] = None) -> None:
+        """
+        Removes tree of given URL from the cache.
+
+        :param url: Absolute URL, when None all trees are removed.
+        """
+        with self._lock:
+            if url is None:
+                self._entries.clear()
+                self._size = 0
+            elif url in self._entries:
+                self._size -= self._entries.pop(url)[2]
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Gets cache statistics.
+
+        :return: Dict with ``hits``, ``misses``, count of cached ``entries``
+            and size of cached HTMLs in ``bytes``.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "bytes": self._size
+            }
+
+    def _entry(self, url: str
+               ) -> Optional[Tuple[HTMLParser, str, int, float]]:
+        """
+        Gets entry of given URL, expired entry is removed. Lock has to be
+        acquired by caller.
+
+        :param url: Absolute URL.
+        :return: Entry of the URL, None when URL isn't cached or expired.
+        """
+        entry = self._entries.get(url)
+        if entry is not None and time.time() >= entry[3]:
+            self._size -= self._entries.pop(url)[2]
+            return None
+        return entry
@@ -0,0 +1,341 @@
+from typing import (Any, Dict, Iterable, List, NamedTuple, Optional, Set,
+                    Tuple, Union)
+
+from .utils import seconds_to_time, time_to_seconds
+
+Seconds = Union[int, float]
+
+RESULTS_FIELDS: Tuple[str, ...] = (
+    "rider_name",
+    "rider_url",
+    "team_name",
+    "team_url",
+    "rank",
+    "status",
+    "age",
+    "time_seconds",
+    "bonus",
+)
+"""Fields of `Stage.results` tables used by `ClassificationsEngine`."""
+ELIMINATING_STATUSES: Tuple[str, ...] = ("DNF", "DNS", "OTL", "DSQ")
+"""Statuses of stage results that remove rider from the classifications."""
+
+
+class StageClassifications(NamedTuple):
+    """Classifications after a stage made by `ClassificationsEngine`."""
+    gc: List[Dict[str, Any]]
+    """GC table with the same fields as `Stage.gc` table."""
+    youth: List[Dict[str, Any]]
+    """Youth classification table with the same fields as GC table."""
+    teams: List[Dict[str, Any]]
+    """Teams classification table with the same fields as `Stage.teams`
+    table."""
+
+
+class Mismatch(NamedTuple):
+    """Difference between reconstructed and parsed classification."""
+    key: str
+    """Rider or team URL."""
+    field: str
+    """Field that differs, ``row`` when the row is missing in one table."""
+    expected: Any
+    """Value from parsed table."""
+    actual: Any
+    """Value from reconstructed table."""
+
+
+class ClassificationsEngine:
+    """
+    Reconstructs GC, youth and teams classifications of a stage race from
+    results of its stages, e.g. for old races where GC tables of some stages
+    are missing. Stages are added one by one by `add_stage` and all
+    computations are done with counts of seconds.
+
+    - GC time is sum of stage times minus bonuses (negative bonuses are
+      penalties). Ties are broken by sum of stage ranks and then by rank in
+      the last stage.
+    - Riders with status from `ELIMINATING_STATUSES` or missing in results of
+      a stage are removed from all classifications.
+    - Youth classification is GC of riders which age in their first stage
+      was at most `youth_max_age`.
+    - Teams classification time is sum of times of the best `team_size`
+      riders of the team in every stage (without bonuses). Teams with less
+      finishers in a stage are removed.
+
+    Usage:
+
+    >>> from procyclingstats import ClassificationsEngine, Race, Stage
+    >>> from procyclingstats.classifications import RESULTS_FIELDS
+    >>> engine = ClassificationsEngine()
+    >>> for stage in Race("race/tour-de-france/2022").stages("stage_url"):
+    ...     results = Stage(stage["stage_url"]).results(*RESULTS_FIELDS)
+    ...     classifications = engine.add_stage(results)
+    >>> classifications.gc[0]["rider_url"]
+    'rider/jonas-vingegaard'
+
+    :param youth_max_age: Maximal age of riders in youth classification,
+        defaults to 25.
+    :param team_size: Count of riders whose times make stage time of a team,
+        defaults to 3.
+    """
+
+    def __init__(self, youth_max_age: int = 25, team_size: int = 3) -> None:
+        self.youth_max_age = youth_max_age
+        self.team_size = team_size
+        self.stages: List[StageClassifications] = []
+        """Classifications after every added stage."""
+
+        self._times: Dict[str, Seconds] = {}
+        self._bonuses: Dict[str, Seconds] = {}
+        self._rank_sums: Dict[str, int] = {}
+        self._last_ranks: Dict[str, int] = {}
+        self._riders: Dict[str, Dict[str, Any]] = {}
+        self._youth: Set[str] = set()
+        self._eliminated: Set[str] = set()
+        self._team_times: Dict[str, Seconds] = {}
+        self._teams: Dict[str, Dict[str, Any]] = {}
+        self._eliminated_teams: Set[str] = set()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(stages={len(self.stages)})"
+
+    def add_stage(self, results: List[Dict[str, Any]]
+                  ) -> StageClassifications:
+        """
+        Adds results of the next stage and computes classifications after
+        it.
+
+        :param results: Stage results table with `RESULTS_FIELDS` (``age``,
+            ``bonus``, ``rank`` and ``status`` are optional).
+        :raises ValueError: When results rows don't have ``rider_url`` or
+            ``time_seconds`` field.
+        :return: Classifications after the stage.
+        """
+        first_stage = not self.stages
+        finished: Dict[str, Seconds] = {}
+        team_riders_times: Dict[str, List[Seconds]] = {}
+        for row in results:
+            if "rider_url" not in row or "time_seconds" not in row:
+                raise ValueError(
+                    "Results rows have to contain 'rider_url' and "
+                    "'time_seconds' fields")
+            rider_url = row["rider_url"]
+            if rider_url in self._eliminated:
+                continue
+            if (row.get("status") in ELIMINATING_STATUSES or
+                    row["time_seconds"] is None or
+                    (not first_stage and rider_url not in self._times)):
+                self._eliminate(rider_url)
+                continue
+            if first_stage:
+                self._add_rider(row)
+            finished[rider_url] = row["time_seconds"]
+            bonus = self._bonus_seconds(row.get("bonus"))
+            self._times[rider_url] += row["time_seconds"] - bonus
+            self._bonuses[rider_url] += bonus
+            rank = self._rank(row.get("rank"), len(results))
+            self._rank_sums[rider_url] += rank
+            self._last_ranks[rider_url] = rank
+            team_url = row.get("team_url")
+            if team_url is not None:
+                team_riders_times.setdefault(team_url, []).append(
+                    row["time_seconds"])
+        # riders missing in results of the stage
+        for rider_url in [rider_url for rider_url in self._times
+                          if rider_url not in finished]:
+            self._eliminate(rider_url)
+
+        for team_url, times in team_riders_times.items():
+            if team_url in self._eliminated_teams:
+                continue
+            if first_stage:
+                self._team_times[team_url] = 0
+            if len(times) < self.team_size or team_url not in self._team_times:
+                self._eliminate_team(team_url)
+                continue
+            self._team_times[team_url] += sum(
+                sorted(times)[:self.team_size])
+        for team_url in [team_url for team_url in self._team_times
+                         if team_url not in team_riders_times]:
+            self._eliminate_team(team_url)
+
+        previous = self.stages[-1] if self.stages else None
+        gc = self._gc_table(self._ranked_riders(),
+                            previous.gc if previous else [])
+        youth = self._gc_table(
+            [rider for rider in self._ranked_riders()
+             if rider in self._youth],
+            previous.youth if previous else [])
+        classifications = StageClassifications(gc, youth, self._teams_table(
+            previous.teams if previous else []))
+        self.stages.append(classifications)
+        return classifications
+
+    def _add_rider(self, row: Dict[str, Any]) -> None:
+        """
+        Adds rider from results of the first stage to the classifications.
+
+        :param row: Results row of the rider.
+        """
+        rider_url = row["rider_url"]
+        self._times[rider_url] = 0
+        self._bonuses[rider_url] = 0
+        self._rank_sums[rider_url] = 0
+        self._riders[rider_url] = {
+            "rider_name": row.get("rider_name"),
+            "rider_url": rider_url,
+            "team_name": row.get("team_name"),
+            "team_url": row.get("team_url"),
+        }
+        if row.get("team_url") is not None:
+            self._teams.setdefault(row["team_url"], {
+                "team_name": row.get("team_name"),
+                "team_url": row["team_url"],
+            })
+        age = row.get("age")
+        if age is not None and age <= self.youth_max_age:
+            self._youth.add(rider_url)
+
+    def _eliminate(self, rider_url: str) -> None:
+        """
+        Removes rider from the classifications.
+
+        :param rider_url: URL of the rider.
+        """
+        self._eliminated.add(rider_url)
+        for values in (self._times, self._bonuses, self._rank_sums,
+                       self._last_ranks):
+            values.pop(rider_url, None)
+
+    def _eliminate_team(self, team_url: str) -> None:
+        """
+        Removes team from the teams classification.
+
+        :param team_url: URL of the team.
+        """
+        self._eliminated_teams.add(team_url)
+        self._team_times.pop(team_url, None)
+
+    def _ranked_riders(self) -> List[str]:
+        """
+        :return: URLs of riders in the GC sorted by GC time and tie breaks.
+        """
+        return sorted(self._times, key=lambda rider_url: (
+            self._times[rider_url], self._rank_sums[rider_url],
+            self._last_ranks[rider_url]))
+
+    def _gc_table(self, riders: List[str], previous: List[Dict[str, Any]]
+                  ) -> List[Dict[str, Any]]:
+        """
+        :param riders: Ranked URLs of riders in the classification.
+        :param previous: The classification table after previous stage.
+        :return: Classification table.
+        """
+        previous_ranks = {row["rider_url"]: row["rank"] for row in previous}
+        table = []
+        for rank, rider_url in enumerate(riders, 1):
+            time = self._times[rider_url]
+            table.append({
+                **self._riders[rider_url],
+                "rank": rank,
+                "prev_rank": previous_ranks.get(rider_url),
+                "time": seconds_to_time(time),
+                "time_seconds": time,
+                "bonus": seconds_to_time(self._bonuses[rider_url]),
+            })
+        return table
+
+    def _teams_table(self, previous: List[Dict[str, Any]]
+                     ) -> List[Dict[str, Any]]:
+        """
+        :param previous: Teams classification table after previous stage.
+        :return: Teams classification table.
+        """
+        previous_ranks = {row["team_url"]: row["rank"] for row in previous}
+        teams = sorted(self._team_times, key=self._team_times.__getitem__)
+        return [{
+            **self._teams[team_url],
+            "rank": rank,
+            "prev_rank": previous_ranks.get(team_url),
+            "time": seconds_to_time(self._team_times[team_url]),
+            "time_seconds": self._team_times[team_url],
+        } for rank, team_url in enumerate(teams, 1)]
+
+    @staticmethod
+    def _bonus_seconds(bonus: Optional[str]) -> Seconds:
+        """
+        :param bonus: Bonus in `H:MM:SS` format, penalty when it starts with
+            ``-``.
+        :return: Bonus as count of seconds, negative for penalties.
+        """
+        if not bonus:
+            return 0
+        if bonus.startswith("-"):
+            return -time_to_seconds(bonus[1:])
+        return time_to_seconds(bonus)
+
+    @staticmethod
+    def _rank(rank: Any, results_length: int) -> int:
+        """
+        :param rank: Parsed stage rank.
+        :param results_length: Count of rows in stage results.
+        :return: Rank as int, ranks that couldn't be parsed are behind all
+            riders.
+        """
+        try:
+            return int(rank)
+        except (TypeError, ValueError):
+            return results_length + 1
+
+
+def reconstruct(stages_results: Iterable[List[Dict[str, Any]]],
+                youth_max_age: int = 25,
+                team_size: int = 3) -> List[StageClassifications]:
+    """
+    Reconstructs classifications after every stage of a stage race, see
+    `ClassificationsEngine`.
+
+    :param stages_results: Results tables of stages in order of the stages.
+    :param youth_max_age: Maximal age of riders in youth classification,
+        defaults to 25.
+    :param team_size: Count of riders whose times make stage time of a team,
+        defaults to 3.
+    :return: Classifications after every stage.
+    """
+    engine = ClassificationsEngine(youth_max_age, team_size)
+    for results in stages_results:
+        engine.add_stage(results)
+    return engine.stages
+
+
+def verify(reconstructed: List[Dict[str, Any]],
+           parsed: List[Dict[str, Any]],
+           fields: Tuple[str, ...] = ("rank", "time_seconds"),
+           key: str = "rider_url") -> List[Mismatch]:
+    """
+    Compares reconstructed classification with parsed one, e.g. with table
+    from ``Stage.gc("rider_url", "rank", "time_seconds")``.
+
+    :param reconstructed: Classification table made by
+        `ClassificationsEngine`.
+    :param parsed: Parsed classification table.
+    :param fields: Fields to compare, defaults to ``rank`` and
+        ``time_seconds``. Fields missing in parsed rows aren't compared.
+    :param key: Field identifying rows, defaults to ``rider_url``. Use
+        ``team_url`` for teams classification.
+    :return: List of mismatches, empty when the tables are the same.
+    """
+    reconstructed_rows = {row[key]: row for row in reconstructed}
+    mismatches = []
+    for row in parsed:
+        reconstructed_row = reconstructed_rows.pop(row[key], None)
+        if reconstructed_row is None:
+            mismatches.append(Mismatch(row[key], "row", row, None))
+            continue
+        for field in fields:
+            if field in row and row[field] != reconstructed_row[field]:
+                mismatches.append(Mismatch(row[key], field, row[field],
+                                           reconstructed_row[field]))
+    for row_key, row in reconstructed_rows.items():
+        mismatches.append(Mismatch(row_key, "row", None, row))
+    return mismatches
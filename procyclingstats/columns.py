@@ -0,0 +1,142 @@
+import array
+import math
+from typing import Any, Dict, List, Sequence, Union
+
+# Try to import optional libraries for exports of columns
+try:
+    import numpy
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    import pandas
+    HAS_PANDAS = True
+except ImportError:
+    HAS_PANDAS = False
+
+try:
+    import pyarrow
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+Column = Union[List[Any], "array.array[Any]"]
+"""Values of one field, typed array for numeric fields."""
+Columns = Dict[str, Column]
+"""Field names mapped to columns of the same length."""
+
+
+def as_columns(table: List[Dict[str, Any]], typed: bool = True) -> Columns:
+    """
+    Converts table (list of dicts) to columns.
+
+    Usage:
+
+    >>> from procyclingstats import Stage
+    >>> from procyclingstats.columns import as_columns
+    >>> stage = Stage("race/tour-de-france/2022/stage-21")
+    >>> columns = as_columns(stage.results("rider_name", "rank"))
+    >>> columns["rank"][:3]
+    array('q', [1, 2, 3])
+
+    :param table: Table to convert. Missing values of rows are None.
+    :param typed: Whether to convert numeric columns to typed arrays, see
+        `typed_column`. Defaults to True.
+    :return: Field names (in order of first occurrence) mapped to columns.
+    """
+    fields: Dict[str, None] = {}
+    for row in table:
+        for field in row:
+            fields.setdefault(field)
+    columns: Columns = {field: [row.get(field) for row in table]
+                        for field in fields}
+    if typed:
+        return {field: typed_column(values)
+                for field, values in columns.items()}
+    return columns
+
+def typed_column(values: Sequence[Any]) -> Column:
+    """
+    Converts column with numeric values to typed array (``array.array``),
+    which stores values without Python object per value and supports the
+    buffer protocol, so e.g. ``numpy.asarray`` doesn't copy it. Columns with
+    ints only are converted to ``array('q')``, columns with floats or with
+    ints and missing values are converted to ``array('d')`` with NaN as
+    missing value. Other columns are returned as lists.
+
+    :param values: Values of a column.
+    :return: Typed array or list of the values.
+    """
+    kinds = set()
+    for value in values:
+        if value is None:
+            kinds.add(None)
+        elif isinstance(value, bool):
+            return list(values)
+        elif isinstance(value, int):
+            kinds.add(int)
+        elif isinstance(value, float):
+            kinds.add(float)
+        else:
+            return list(values)
+    if kinds == {int}:
+        return array.array("q", values)
+    if int in kinds or float in kinds:
+        return array.array("d", [math.nan if value is None else value
+                                 for value in values])
+    return list(values)
+
+def to_numpy(columns: Columns) -> Dict[str, Any]:
+    """
+    Converts columns to NumPy arrays. Typed arrays aren't copied, other
+    columns become arrays of objects.
+
+    :param columns: Columns made by `as_columns` or
+        `TableParser.to_columns`.
+    :raises ImportError: When numpy isn't installed.
+    :return: Field names mapped to ``numpy.ndarray`` objects.
+    """
+    if not HAS_NUMPY:
+        raise ImportError("NumPy export requires numpy: pip install numpy")
+    arrays = {}
+    for field, values in columns.items():
+        if isinstance(values, array.array):
+            arrays[field] = numpy.asarray(values)
+        else:
+            arrays[field] = numpy.array(values, dtype=object)
+    return arrays
+
+def to_arrow(columns: Columns) -> Any:
+    """
+    Converts columns to Arrow table. NaN values of float columns become
+    nulls and columns with mixed types are converted to strings.
+
+    :param columns: Columns made by `as_columns` or
+        `TableParser.to_columns`.
+    :raises ImportError: When pyarrow isn't installed.
+    :return: ``pyarrow.Table``.
+    """
+    if not HAS_PYARROW:
+        raise ImportError("Arrow export requires pyarrow: pip install pyarrow")
+    arrays = {}
+    for field, values in columns.items():
+        try:
+            arrays[field] = pyarrow.array(values, from_pandas=True)
+        except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+            arrays[field] = pyarrow.array(
+                [None if value is None else str(value) for value in values])
+    return pyarrow.table(arrays)
+
+def to_pandas(columns: Columns) -> Any:
+    """
+    Converts columns to pandas DataFrame.
+
+    :param columns: Columns made by `as_columns` or
+        `TableParser.to_columns`.
+    :raises ImportError: When pandas isn't installed.
+    :return: ``pandas.DataFrame``.
+    """
+    if not HAS_PANDAS:
+        raise ImportError("pandas export requires pandas: pip install pandas")
+    return pandas.DataFrame(to_numpy(columns))
@@ -0,0 +1,46 @@
+from typing import Any
+
+from .race_climbs_scraper import RaceClimbs
+from .race_combative_riders_scraper import RaceCombativeRiders
+from .race_scraper import Race
+from .race_startlist_scraper import RaceStartlist
+from .ranking_scraper import Ranking
+from .rider_results_scraper import RiderResults
+from .rider_scraper import Rider
+from .stage_scraper import Stage
+from .team_scraper import Team
+from .today_races_scraper import TodayRaces
+
+
+def get_corresponding_scraping_class(relative_url: str) -> Any:
+    """
+    Returns scraping class for given URL (!!!does not work 100% of times!!!).
+
+    :param relative_url: Relative URL of some PCS page.
+    :return: Scraping class for the URL. None when not found.
+    """
+    splitted_url = relative_url.split("/")
+    if relative_url == "" or relative_url == "index.php" or relative_url == "index.php/":
+        return TodayRaces
+    if "comative-riders" in splitted_url or "combative-riders" in splitted_url:
+        return RaceCombativeRiders
+    if (splitted_url[0] == "rider" and "results" in splitted_url) or \
+        (relative_url[:9] == "rider.php"):  
+        return RiderResults
+    elif splitted_url[0] == "rider":
+        return Rider
+    elif len(splitted_url) >= 4 and splitted_url[0] == "race" and \
+        ("stage" in splitted_url[3] or "gc" in splitted_url[3] or "prologue" \
+        in splitted_url[3] or "result" in splitted_url):
+        return Stage
+    elif "rankings" in relative_url:
+        return Ranking
+    elif splitted_url[0] == "race" and "startlist" in splitted_url:
+        return RaceStartlist
+    elif "team" == splitted_url[0]:
+        return Team
+    elif splitted_url[0] == "race" and "climbs" in splitted_url:
+        return RaceClimbs
+    elif splitted_url[0] == "race":
+        return Race
+    return None
@@ -0,0 +1,391 @@
+import json
+import sqlite3
+import sys
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Set, Union
+
+from .records import is_table
+from .scraper import Scraper
+
+URL_FIELDS: Dict[str, str] = {
+    "rider_url": "rider",
+    "team_url": "team",
+    "race_url": "race",
+    "stage_url": "stage",
+    "nation_url": "nation",
+}
+"""Table fields with URLs of entities mapped to kinds of the entities."""
+
+
+class EntityIndex:
+    """
+    Index of riders, teams (per season), races, stages and nations found in
+    parsed pages. Every entity has integer ID and canonical URL (e.g.
+    ``rider/tadej-pogacar`` for all rider pages of Tadej Pogačar) and keeps
+    attributes collected from parsed pages (e.g. ``name`` and
+    ``nationality``). URLs and string attributes are interned, so every
+    string is stored only once, and all lookups are dict lookups.
+
+    When path is given, the index is loaded from SQLite database and `save`
+    writes new and changed entities back to it.
+
+    Usage:
+
+    >>> from procyclingstats import EntityIndex, RaceStartlist, Stage
+    >>> index = EntityIndex()
+    >>> index.add_page(RaceStartlist("race/tour-de-france/2022/startlist"))
+    >>> results = index.encode(
+    ...     Stage("race/tour-de-france/2022/stage-21").results())
+    >>> results[0]["rider_id"], results[0]["team_id"]
+    (96, 92)
+    >>> index.get(results[0]["rider_id"])["name"]
+    'PHILIPSEN Jasper'
+
+    :param path: Path to SQLite database file, the index is kept only in
+        memory when None. Defaults to None.
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        self.path = path
+        self._urls: List[str] = []
+        self._kinds: List[str] = []
+        self._attributes: List[Dict[str, Any]] = []
+        self._ids: Dict[str, int] = {}
+        self._changed: Set[int] = set()
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        if path is not None:
+            self._connection = sqlite3.connect(path, check_same_thread=False)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS entities ("
+                "id INTEGER PRIMARY KEY, url TEXT UNIQUE NOT NULL, "
+                "kind TEXT NOT NULL, attributes TEXT NOT NULL)")
+            self._connection.commit()
+            for entity_id, url, kind, attributes in self._connection.execute(
+                    "SELECT id, url, kind, attributes FROM entities "
+                    "ORDER BY id"):
+                if entity_id != len(self._urls):
+                    raise ValueError(f"Invalid entity IDs in '{path}'")
+                self._append(url, kind, self._interned(
+                    json.loads(attributes)))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(entities={len(self)})"
+
+    def __len__(self) -> int:
+        return len(self._urls)
+
+    def __contains__(self, url: str) -> bool:
+        return self.canonical_url(url) in self._ids
+
+    def id(self, url: str) -> int: # pylint: disable=invalid-name
+        """
+        Gets ID of entity with given URL, the entity is added when it isn't
+        in the index.
+
+        :param url: Absolute or relative URL of any page of the entity, e.g.
+            ``rider/tadej-pogacar/statistics``.
+        :raises ValueError: When URL isn't URL of a rider, team, race, stage
+            or nation.
+        :return: ID of the entity.
+        """
+        url = self.canonical_url(url)
+        entity_id = self._ids.get(url)
+        if entity_id is None:
+            with self._lock:
+                entity_id = self._ids.get(url)
+                if entity_id is None:
+                    entity_id = self._append(url, self.kind(url), {})
+                    self._changed.add(entity_id)
+        return entity_id
+
+    def url(self, entity_id: int) -> str:
+        """
+        :param entity_id: ID of an entity.
+        :raises IndexError: When entity with given ID isn't in the index.
+        :return: Canonical URL of the entity.
+        """
+        return self._urls[entity_id]
+
+    def get(self, id_or_url: Union[int, str]) -> Optional[Dict[str, Any]]:
+        """
+        Gets entity with given ID or URL.
+
+        :param id_or_url: ID of the entity or URL of any page of the entity.
+        :return: Dict with ``id``, ``url``, ``kind`` and attributes of the
+            entity, None when the entity isn't in the index.
+        """
+        if isinstance(id_or_url, int):
+            entity_id: Optional[int] = id_or_url
+            if not 0 <= id_or_url < len(self._urls):
+                return None
+        else:
+            entity_id = self._ids.get(self.canonical_url(id_or_url))
+            if entity_id is None:
+                return None
+        return {"id": entity_id, "url": self._urls[entity_id],
+                "kind": self._kinds[entity_id],
+                **self._attributes[entity_id]}
+
+    def entities(self, kind: Optional[str] = None
+                 ) -> Iterable[Dict[str, Any]]:
+        """
+        :param kind: Kind of entities (``rider``, ``team``, ``race``,
+            ``stage`` or ``nation``), all entities when None.
+        :return: Generator yielding entities (same dicts as `get` returns).
+        """
+        for entity_id, entity_kind in enumerate(self._kinds):
+            if kind is None or entity_kind == kind:
+                yield self.get(entity_id) # type: ignore
+
+    def add(self, url: str, **attributes: Any) -> int:
+        """
+        Adds entity to the index or updates its attributes. Attributes with
+        None values don't overwrite known values.
+
+        :param url: URL of any page of the entity.
+        :param attributes: Attributes of the entity, e.g. ``name``.
+        :raises ValueError: When URL isn't URL of an entity.
+        :return: ID of the entity.
+        """
+        entity_id = self.id(url)
+        with self._lock:
+            entity_attributes = self._attributes[entity_id]
+            for name, value in attributes.items():
+                if value is None or entity_attributes.get(name) == value:
+                    continue
+                entity_attributes[sys.intern(name)] = self._interned_value(
+                    value)
+                self._changed.add(entity_id)
+        return entity_id
+
+    def add_page(self, scraper_obj: Scraper) -> None:
+        """
+        Adds entities from parsed page, see `add_parsed`.
+
+        :param scraper_obj: Scraping object ready for parsing.
+        """
+        self.add_parsed(scraper_obj.relative_url(), scraper_obj.parse())
+
+    def add_parsed(self, url: str, data: Dict[str, Any]) -> None:
+        """
+        Adds entities from parsed data of a page. Entity of the page gets
+        values of parsed data that aren't tables (e.g. ``nationality`` of
+        `Rider`). Entities referenced in tables (e.g. ``rider_url`` and
+        ``team_url`` fields) get values of table fields with their prefix
+        (e.g. ``rider_name`` as ``name``), see `add_table`.
+
+        :param url: URL of the page.
+        :param data: Parsed data of the page, e.g. output of `Scraper.parse`.
+        """
+        try:
+            self.kind(url)
+        except ValueError:
+            pass
+        else:
+            self.add(url, **{key: value for key, value in data.items()
+                             if self._is_scalar(value)})
+        for value in data.values():
+            if is_table(value):
+                self.add_table(value)
+
+    def add_table(self, table: List[Dict[str, Any]]) -> None:
+        """
+        Adds entities referenced in table rows by fields from `URL_FIELDS`.
+        Row fields with the same prefix as the URL field are attributes of
+        the entity (e.g. ``rider_name`` -> ``name``). ``nationality`` field
+        is attribute of the first referenced entity of the row.
+
+        :param table: Parsed table.
+        """
+        for row in table:
+            first = True
+            for field, kind in URL_FIELDS.items():
+                url = row.get(field)
+                if not url or not isinstance(url, str):
+                    continue
+                prefix = kind + "_"
+                attributes = {key[len(prefix):]: value
+                              for key, value in row.items()
+                              if key.startswith(prefix) and key != field and
+                              self._is_scalar(value)}
+                if first and row.get("nationality") is not None:
+                    attributes["nationality"] = row["nationality"]
+                first = False
+                try:
+                    self.add(url, **attributes)
+                except ValueError:
+                    continue
+
+    def encode(self, table: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Replaces fields from `URL_FIELDS` (e.g. ``rider_url``) in table rows
+        with fields with IDs of the entities (e.g. ``rider_id``). Entities
+        that aren't in the index are added. Other fields of the entities
+        (e.g. ``rider_name``) are kept.
+
+        :param table: Parsed table.
+        :return: New table with IDs.
+        """
+        encoded = []
+        for row in table:
+            encoded_row = {}
+            for field, value in row.items():
+                if field in URL_FIELDS and isinstance(value, str) and value:
+                    try:
+                        encoded_row[field[:-4] + "_id"] = self.id(value)
+                        continue
+                    except ValueError:
+                        pass
+                encoded_row[field] = value
+            encoded.append(encoded_row)
+        return encoded
+
+    def decode(self, table: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Replaces fields with IDs made by `encode` with fields with URLs.
+
+        :param table: Table made by `encode`.
+        :return: New table with URLs.
+        """
+        id_fields = {field[:-4] + "_id": field for field in URL_FIELDS}
+        return [{id_fields[field] if field in id_fields else field:
+                 self._urls[value] if field in id_fields else value
+                 for field, value in row.items()} for row in table]
+
+    def join(self, table: List[Dict[str, Any]], *attributes: str,
+             key: str = "rider_url") -> List[Dict[str, Any]]:
+        """
+        Adds attributes of entities to table rows, e.g. ``nationality`` of
+        riders from `Rider` pages to stage results. Works like
+        `utils.join_tables`, but every row is joined by index lookup.
+
+        :param table: Table which rows reference entities.
+        :param attributes: Names of entity attributes to add. Attributes
+            are added with prefix of the key field (e.g. ``rider_``) unless
+            the attribute is ``nationality``. Missing attributes (and all
+            attributes of entities that aren't in the index) are None.
+        :param key: Field referencing entities, either URL field (e.g.
+            ``rider_url``) or ID field made by `encode` (e.g. ``rider_id``).
+            Defaults to ``rider_url``.
+        :return: New table with added attributes.
+        """
+        prefix = key.rsplit("_", 1)[0] + "_"
+        names = [(attribute, attribute if attribute == "nationality"
+                  else prefix + attribute) for attribute in attributes]
+        joined = []
+        for row in table:
+            value = row.get(key)
+            entity_id: Optional[int]
+            if isinstance(value, int):
+                entity_id = value if 0 <= value < len(self._urls) else None
+            elif value:
+                entity_id = self._ids.get(self.canonical_url(value))
+            else:
+                entity_id = None
+            entity = self._attributes[entity_id] if entity_id is not None \
+                else {}
+            joined.append({**row, **{name: entity.get(attribute)
+                                     for attribute, name in names}})
+        return joined
+
+    def save(self) -> None:
+        """
+        Writes new and changed entities to the SQLite database.
+
+        :raises ValueError: When the index doesn't have path.
+        """
+        if self._connection is None:
+            raise ValueError("Entity index without path can't be saved")
+        with self._lock:
+            changed = sorted(self._changed)
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO entities VALUES (?, ?, ?, ?)",
+                [(entity_id, self._urls[entity_id], self._kinds[entity_id],
+                  json.dumps(self._attributes[entity_id], default=str))
+                 for entity_id in changed])
+            self._connection.commit()
+            self._changed.clear()
+
+    def close(self) -> None:
+        """Closes database connection, unsaved changes are lost."""
+        if self._connection is not None:
+            self._connection.close()
+
+    @staticmethod
+    def canonical_url(url: str) -> str:
+        """
+        Makes canonical URL of an entity from URL of any of its pages.
+
+        :param url: Absolute or relative URL, e.g.
+            ``https://www.procyclingstats.com/race/tour-de-france/2022/gc``.
+        :return: Canonical URL, e.g. ``race/tour-de-france/2022``.
+        """
+        if url.startswith(Scraper.BASE_URL):
+            url = url[len(Scraper.BASE_URL):]
+        parts = url.strip("/").split("/")
+        if parts[0] == "race" and len(parts) >= 4 and (
+                parts[3].startswith("stage-") or parts[3] == "prologue"):
+            return "/".join(parts[:4])
+        if parts[0] == "race":
+            return "/".join(parts[:3])
+        return "/".join(parts[:2])
+
+    @staticmethod
+    def kind(url: str) -> str:
+        """
+        :param url: URL of any page of an entity.
+        :raises ValueError: When URL isn't URL of a rider, team, race, stage
+            or nation.
+        :return: Kind of the entity, e.g. ``rider``.
+        """
+        parts = EntityIndex.canonical_url(url).split("/")
+        if parts[0] == "race" and len(parts) == 4:
+            return "stage"
+        if parts[0] == "race" and len(parts) == 3:
+            return "race"
+        if parts[0] in ("rider", "team", "nation") and len(parts) == 2:
+            return parts[0]
+        raise ValueError(f"URL isn't URL of an entity: '{url}'")
+
+    def _append(self, url: str, kind: str, attributes: Dict[str, Any]
+                ) -> int:
+        """
+        :param url: Canonical URL of new entity.
+        :param kind: Kind of the entity.
+        :param attributes: Interned attributes of the entity.
+        :return: ID of the entity.
+        """
+        entity_id = len(self._urls)
+        url = sys.intern(url)
+        self._urls.append(url)
+        self._kinds.append(sys.intern(kind))
+        self._attributes.append(attributes)
+        self._ids[url] = entity_id
+        return entity_id
+
+    @staticmethod
+    def _interned(attributes: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        :param attributes: Attributes of an entity.
+        :return: Attributes with interned names and string values.
+        """
+        return {sys.intern(name): EntityIndex._interned_value(value)
+                for name, value in attributes.items()}
+
+    @staticmethod
+    def _interned_value(value: Any) -> Any:
+        """
+        :param value: Attribute value.
+        :return: Interned value when it's string, otherwise the value.
+        """
+        return sys.intern(value) if isinstance(value, str) else value
+
+    @staticmethod
+    def _is_scalar(value: Any) -> bool:
+        """
+        :param value: Parsed value.
+        :return: Whether the value is string, number, bool or None.
+        """
+        return value is None or isinstance(value, (str, int, float, bool))
+
@@ -0,0 +1,342 @@
+"""
+Ingestion of a directory with saved pages into columnar files, one file per
+table kind (e.g. ``stage_results.csv``).
+
+Usage::
+
+    python -m procyclingstats ingest pages/ --out dataset/ --format parquet
+"""
+import argparse
+import csv
+import inspect
+import json
+import os
+import re
+import sys
+from typing import (Any, Dict, List, NamedTuple, Optional, Sequence, Tuple,
+                    Type)
+
+from .bulk import CHUNKSIZE, parse_files, path_to_url
+from .records import is_table
+from .scraper import Scraper
+from .utils import OPT_IN_FIELDS
+
+# Try to import pyarrow for Parquet output
+try:
+    import pyarrow
+    import pyarrow.parquet
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+EXTENSIONS: Tuple[str, ...] = (".txt", ".html")
+"""Extensions of HTML files that are ingested."""
+URL_COLUMN: str = "page_url"
+"""Column with relative URL of the page every row comes from."""
+SELECT_FIELDS: Tuple[str, ...] = ("text", "value")
+"""Fields of tables parsed from select menus (``*_select`` methods)."""
+TABLE_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "today_races_live_races": ("url", "name", "status", "togo"),
+    "today_races_next_to_finish": ("url", "name", "eta", "category",
+                                   "class"),
+    "today_races_finished_races": ("url", "name", "category"),
+    "today_races_yesterday_races": ("url", "name", "category"),
+}
+"""
+Fields of table kinds which parsing methods don't take fields as args.
+Fields of other tables are listed in docstrings of their parsing methods.
+"""
+COLUMN_TYPES: Dict[str, type] = {
+    **{name: int for name in (
+        "age", "career_points", "edition", "first_places", "gc_position",
+        "km_before_finnish", "pcs_ranking_position", "prev_rank",
+        "profile_score", "racedays", "rank", "ranking_points",
+        "ranking_position", "result", "rider_number", "season",
+        "second_places", "third_places", "top", "uci_ranking_position",
+        "vertical_meters", "wins_count", "year")},
+    **{name: float for name in (
+        "average_percentage", "avg_speed_winner", "avg_temperature",
+        "breakaway_kms", "distance", "height", "length", "pcs_points",
+        "points", "steepness", "uci_points", "weight")},
+    "is_one_day_race": bool,
+    "stage_climbs.rank": str,
+}
+"""
+Types of columns mapped by column name or by table kind and column name
+(e.g. ``stage_climbs.rank``). Other columns are strings.
+"""
+
+
+class IngestReport(NamedTuple):
+    """Result of `ingest`."""
+    files: Dict[str, int]
+    """Paths of written files mapped to counts of written rows."""
+    errors: Dict[str, str]
+    """Paths of HTML files that couldn't be parsed mapped to error messages."""
+
+
+class ColumnBuffer:
+    """
+    Table stored as columns. Rows with keys that aren't in given columns add
+    columns which are filled with None for previous rows, so every column
+    has the same length.
+
+    :param kind: Table kind, e.g. ``stage_results``.
+    :param columns: Columns of the table, defaults to no columns.
+    """
+
+    def __init__(self, kind: str, columns: Sequence[str] = ()) -> None:
+        self.kind = kind
+        self.columns: Dict[str, List[Any]] = {name: [] for name in columns}
+        self.length = 0
+        self._fixed = len(self.columns)
+
+    def append(self, row: Dict[str, Any]) -> None:
+        """
+        Appends row to the table.
+
+        :param row: Dict with column names and values.
+        """
+        for key, value in row.items():
+            column = self.columns.get(key)
+            if column is None:
+                column = self.columns[key] = [None] * self.length
+            column.append(value)
+        self.length += 1
+        for column in self.columns.values():
+            if len(column) < self.length:
+                column.append(None)
+
+    def schema(self) -> List[Tuple[str, type]]:
+        """
+        :return: Column names and their types (see `column_type`). Given
+            columns are first in given order, added columns are sorted, so
+            the order doesn't depend on order of ingested pages.
+        """
+        names = list(self.columns)
+        names = names[:self._fixed] + sorted(names[self._fixed:])
+        return [(name, column_type(self.kind, name)) for name in names]
+
+
+def ingest(directory: str, out: str, file_format: str = "csv",
+           workers: Optional[int] = None,
+           chunksize: int = CHUNKSIZE) -> IngestReport:
+    """
+    Parses all HTML files from given directory (and its subdirectories) and
+    writes parsed data to columnar files in `out` directory. Files have to
+    be named like HTML fixtures, see `bulk.path_to_url`. Every table kind
+    (e.g. ``results`` of `Stage`) is written to its own file named by the
+    scraping class and the parsing method, e.g. ``stage_results.csv``.
+    Values of other parsing methods are written to file named by the
+    scraping class, e.g. ``stage.csv`` with one row per page. Every row has
+    the `URL_COLUMN` with relative URL of its page.
+
+    Schema of the files doesn't depend on the ingested pages. Columns of
+    tables are fields of the tables (see `table_fields`) and columns of
+    pages are names of the other parsing methods. Every column has type
+    from `COLUMN_TYPES`, values that can't be converted to the type of
+    numeric column are missing.
+
+    :param directory: Directory with HTML files.
+    :param out: Output directory, created if it doesn't exist.
+    :param file_format: Either ``csv`` or ``parquet`` (requires pyarrow),
+        defaults to ``csv``.
+    :param workers: Count of worker processes, defaults to count of CPUs.
+    :param chunksize: Count of files sent to a worker process at once,
+        defaults to `bulk.CHUNKSIZE`.
+    :raises ValueError: When file format is invalid.
+    :raises ImportError: When Parquet is wanted and pyarrow isn't installed.
+    :return: Report with written files and errors.
+    """
+    if file_format not in ("csv", "parquet"):
+        raise ValueError(f"Invalid file format: '{file_format}'")
+    if file_format == "parquet" and not HAS_PYARROW:
+        raise ImportError("Parquet output requires pyarrow: "
+                          "pip install pyarrow")
+    paths = sorted(
+        os.path.join(root, filename)
+        for root, _, filenames in os.walk(directory)
+        for filename in filenames if filename.endswith(EXTENSIONS))
+
+    tables: Dict[str, ColumnBuffer] = {}
+    errors = {}
+    for path, data in parse_files(paths, workers, chunksize):
+        if isinstance(data, Exception):
+            errors[path] = f"{type(data).__name__}: {data}"
+            continue
+        url = path_to_url(path)
+        scraping_class = Scraper._scraping_class_for(url)
+        class_name = _snake_case(scraping_class.__name__)
+        if class_name not in tables:
+            _add_buffers(tables, scraping_class)
+        page_row: Dict[str, Any] = {URL_COLUMN: url}
+        for key, value in data.items():
+            table = tables.get(f"{class_name}_{key}")
+            if table is None:
+                page_row[key] = value
+            elif is_table(value):
+                for row in value:
+                    table.append({URL_COLUMN: url, **row})
+        tables[class_name].append(page_row)
+
+    os.makedirs(out, exist_ok=True)
+    files = {}
+    for kind, table in sorted(tables.items()):
+        path = os.path.join(out, f"{kind}.{file_format}")
+        if file_format == "csv":
+            _write_csv(path, table)
+        else:
+            _write_parquet(path, table)
+        files[path] = table.length
+    return IngestReport(files, errors)
+
+def table_fields(scraping_class: Type[Scraper], method_name: str
+                 ) -> Optional[Tuple[str, ...]]:
+    """
+    Gets fields of table returned by parsing method when it's called
+    without args. Fields are taken from `TABLE_FIELDS` or from the list of
+    fields in docstring of the parsing method (opt-in fields aren't
+    included).
+
+    :param scraping_class: Scraping class, e.g. `Stage`.
+    :param method_name: Name of parsing method, e.g. ``results``.
+    :return: Fields of the table, None when the method doesn't return
+        table.
+    """
+    fields = TABLE_FIELDS.get(
+        f"{_snake_case(scraping_class.__name__)}_{method_name}")
+    if fields is not None:
+        return fields
+    if method_name.endswith("_select"):
+        return SELECT_FIELDS
+    parameters = inspect.signature(
+        getattr(scraping_class, method_name)).parameters.values()
+    if not any(parameter.kind == parameter.VAR_POSITIONAL
+               for parameter in parameters):
+        return None
+    docstring = inspect.getdoc(getattr(scraping_class, method_name)) or ""
+    args_doc = re.split(r"\n:(?:raises|return)",
+                        docstring.partition(":param args:")[2])[0]
+    return tuple(field for field in re.findall(r"^\s*- (\w+):", args_doc,
+                                               re.MULTILINE)
+                 if field not in OPT_IN_FIELDS)
+
+def column_type(kind: str, name: str) -> type:
+    """
+    :param kind: Table kind, e.g. ``stage_results``.
+    :param name: Column name.
+    :return: Type of the column from `COLUMN_TYPES`, ``str`` by default.
+    """
+    return COLUMN_TYPES.get(f"{kind}.{name}", COLUMN_TYPES.get(name, str))
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Runs the ingestion from command line.
+
+    :param argv: Command line arguments, defaults to `sys.argv`.
+    :return: Exit code, 1 when some files couldn't be parsed, otherwise 0.
+    """
+    args = _configure_parser().parse_args(argv)
+    report = ingest(args.directory, args.out, args.format, args.workers)
+    for path, rows in report.files.items():
+        print(f"{path}: {rows} rows")
+    for path, error in report.errors.items():
+        print(f"{path}: {error}", file=sys.stderr)
+    return 1 if report.errors else 0
+
+def _add_buffers(tables: Dict[str, ColumnBuffer],
+                 scraping_class: Type[Scraper]) -> None:
+    """
+    Adds buffers for pages of given scraping class and for all its table
+    kinds.
+
+    :param tables: Table kinds mapped to their buffers.
+    :param scraping_class: Scraping class.
+    """
+    class_name = _snake_case(scraping_class.__name__)
+    page_columns = [URL_COLUMN]
+    for method_name in scraping_class._parsing_method_names():
+        fields = table_fields(scraping_class, method_name)
+        if fields is None:
+            page_columns.append(method_name)
+        else:
+            kind = f"{class_name}_{method_name}"
+            tables[kind] = ColumnBuffer(kind, (URL_COLUMN, *fields))
+    tables[class_name] = ColumnBuffer(class_name, page_columns)
+
+def _write_csv(path: str, table: ColumnBuffer) -> None:
+    """
+    Writes table to CSV file.
+
+    :param path: Path to the file.
+    :param table: Table to write.
+    """
+    schema = table.schema()
+    columns = [[_typed(value, value_type) for value in table.columns[name]]
+               for name, value_type in schema]
+    with open(path, "w", encoding="utf-8", newline="") as csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerow([name for name, _ in schema])
+        writer.writerows(zip(*columns))
+
+def _write_parquet(path: str, table: ColumnBuffer) -> None:
+    """
+    Writes table to Parquet file.
+
+    :param path: Path to the file.
+    :param table: Table to write.
+    """
+    arrow_types = {int: pyarrow.int64(), float: pyarrow.float64(),
+                   bool: pyarrow.bool_(), str: pyarrow.string()}
+    arrays = {
+        name: pyarrow.array(
+            [_typed(value, value_type) for value in table.columns[name]],
+            type=arrow_types[value_type])
+        for name, value_type in table.schema()}
+    pyarrow.parquet.write_table(pyarrow.table(arrays), path)
+
+def _typed(value: Any, value_type: type) -> Any:
+    """
+    :param value: Parsed value.
+    :param value_type: Type of the column, see `column_type`.
+    :return: Value converted to given type, None when it's missing or can't
+        be converted to numeric type. Values that aren't scalars are
+        converted to JSON strings.
+    """
+    if value is None:
+        return None
+    if value_type is str:
+        if isinstance(value, (list, dict, tuple)):
+            return json.dumps(value, default=str)
+        return str(value)
+    if isinstance(value, (list, dict, tuple)):
+        return None
+    try:
+        return value_type(value)
+    except (TypeError, ValueError):
+        return None
+
+def _snake_case(name: str) -> str:
+    """
+    :param name: Name in CamelCase, e.g. ``RaceStartlist``.
+    :return: Name in snake_case, e.g. ``race_startlist``.
+    """
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
+
+def _configure_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m procyclingstats ingest",
+        description=(
+            "Parses all HTML files from given directory (named like HTML " +
+            "fixtures) and writes every table kind to its own CSV or " +
+            "Parquet file."))
+    parser.add_argument("directory", help="Directory with HTML files.")
+    parser.add_argument("--out", required=True, help="Output directory.")
+    parser.add_argument("--format", choices=("csv", "parquet"),
+                        default="csv", help="Output file format.")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Count of worker processes.")
+    return parser
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,159 @@
+import contextlib
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple
+
+Hook = Callable[[str, float, Dict[str, str]], None]
+"""Function called with metric name, observed value and labels."""
+
+
+class Instrumentation:
+    """
+    Collects timings and counters of scraping. When set as
+    `Scraper.instrumentation`, following metrics are recorded:
+
+    - ``request_seconds``: Requests including retries and backoff sleeps
+      (labels ``scraper``).
+    - ``backoff_seconds``: Sleeps before retries of failed requests (labels
+      ``scraper``).
+    - ``downloaded_bytes``: Bodies of successful responses (counter, labels
+      ``scraper``).
+    - ``html_parser_seconds``: Creating ``HTMLParser`` trees (labels
+      ``scraper``).
+    - ``html_valid_seconds``: HTML validation (labels ``scraper``).
+    - ``parsing_method_seconds``: Parsing methods called by `Scraper.parse`
+      (labels ``scraper`` and ``method``).
+    - ``table_field_seconds``: Parsing of table fields by `TableParser`
+      (labels ``field`` and ``engine``).
+
+    Timings are summaries (count, sum and maximum of observed values).
+
+    Usage:
+
+    >>> from procyclingstats import Instrumentation, Scraper, Stage
+    >>> Scraper.instrumentation = Instrumentation()
+    >>> Stage("race/tour-de-france/2022/stage-21").parse()
+    >>> print(Scraper.instrumentation.to_openmetrics())
+    # TYPE procyclingstats_request_seconds summary
+    procyclingstats_request_seconds_count{scraper="Stage"} 1
+    procyclingstats_request_seconds_sum{scraper="Stage"} 0.412
+    ...
+
+    :param hooks: Functions called with every observed value, e.g. to
+        forward values to a monitoring system. Defaults to no hooks.
+    """
+
+    PREFIX: str = "procyclingstats_"
+    """Prefix of metric names in `to_openmetrics` output."""
+    COUNTERS: Tuple[str, ...] = ("downloaded_bytes",)
+    """Metrics exported as counters, other metrics are summaries."""
+
+    def __init__(self, hooks: Iterable[Hook] = ()) -> None:
+        self.hooks: List[Hook] = list(hooks)
+        self._metrics: Dict[str, Dict[Tuple[Tuple[str, str], ...],
+                                      List[float]]] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(metrics={len(self._metrics)})"
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        """
+        Records observed value of a metric and calls hooks.
+
+        :param name: Metric name, e.g. ``request_seconds``.
+        :param value: Observed value, e.g. count of seconds.
+        :param labels: Labels of the value, e.g. ``scraper="Stage"``.
+        """
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._metrics.setdefault(name, {})
+            summary = series.get(key)
+            if summary is None:
+                series[key] = [1, value, value]
+            else:
+                summary[0] += 1
+                summary[1] += value
+                summary[2] = max(summary[2], value)
+        for hook in self.hooks:
+            hook(name, value, labels)
+
+    @contextlib.contextmanager
+    def timer(self, name: str, **labels: str) -> Iterator[None]:
+        """
+        Context manager observing count of seconds spent in its block.
+
+        :param name: Metric name, e.g. ``request_seconds``.
+        :param labels: Labels of the value, e.g. ``scraper="Stage"``.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def as_dict(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Exports recorded metrics.
+
+        :return: Metric names mapped to lists of dicts with keys ``labels``,
+            ``count``, ``sum`` and ``max`` (one dict per labels combination).
+        """
+        with self._lock:
+            return {
+                name: [{"labels": dict(key), "count": summary[0],
+                        "sum": summary[1], "max": summary[2]}
+                       for key, summary in series.items()]
+                for name, series in self._metrics.items()
+            }
+
+    def to_openmetrics(self) -> str:
+        """
+        Exports recorded metrics in OpenMetrics text format.
+
+        :return: OpenMetrics text ending with ``# EOF``.
+        """
+        lines = []
+        for name, series in sorted(self.as_dict().items()):
+            metric_name = self.PREFIX + name
+            if name in self.COUNTERS:
+                lines.append(f"# TYPE {metric_name} counter")
+                for values in series:
+                    labels = self._format_labels(values["labels"])
+                    lines.append(
+                        f"{metric_name}_total{labels} {values['sum']}")
+                continue
+            lines.append(f"# TYPE {metric_name} summary")
+            for values in series:
+                labels = self._format_labels(values["labels"])
+                lines.append(f"{metric_name}_count{labels} {values['count']}")
+                lines.append(f"{metric_name}_sum{labels} {values['sum']}")
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Removes all recorded metrics."""
+        with self._lock:
+            self._metrics.clear()
+
+    @staticmethod
+    def _format_labels(labels: Dict[str, str]) -> str:
+        """
+        :param labels: Labels of a value.
+        :return: Labels in OpenMetrics format, e.g. ``{scraper="Stage"}``.
+        """
+        if not labels:
+            return ""
+        formatted = ",".join(
+            f'{key}="{Instrumentation._escape(value)}"'
+            for key, value in labels.items())
+        return "{" + formatted + "}"
+
+    @staticmethod
+    def _escape(value: str) -> str:
+        """
+        :param value: Label value.
+        :return: Label value with escaped backslashes, quotes and newlines.
+        """
+        return value.replace("\\", "\\\\").replace('"', '\\"').replace(
+            "\n", "\\n")
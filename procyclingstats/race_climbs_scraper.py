@@ -80,7 +80,7 @@ class RaceClimbs(Scraper):
         table_html = self.html.css_first("table.basic")
         if table_html.css_first("tbody > tr") is None:
             return []
-        table_parser = TableParser(table_html)
+        table_parser = TableParser(table_html, self.instrumentation)
         casual_fields = [f for f in fields if f in ("climb_name", "climb_url")]
         table_parser.parse(casual_fields)
         if "length" in fields:
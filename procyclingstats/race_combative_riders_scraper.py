@@ -57,7 +57,7 @@ class RaceCombativeRiders(Scraper):
         if not riders_table_html:
             return []
 
-        table_parser = TableParser(riders_table_html)
+        table_parser = TableParser(riders_table_html, self.instrumentation)
         nationality_present = False
         if "nationality" in fields:
             fields.remove("nationality")
@@ -1,8 +1,13 @@
 import re
-from typing import Any, Dict, List
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, Type
 
 from .errors import ExpectedParsingError, UnexpectedParsingError
+from .race_climbs_scraper import RaceClimbs
+from .race_startlist_scraper import RaceStartlist
 from .scraper import Scraper
+from .stage_scraper import Stage
 from .table_parser import TableParser
 from .utils import get_day_month, parse_select, parse_table_fields_args
 
@@ -26,6 +31,22 @@ class Race(Scraper):
     }
 
     """
+    _public_nonparsing_methods = Scraper._public_nonparsing_methods + (
+        "crawl",
+    )
+    crawl_stage_fields: Tuple[str, ...] = (
+        "date",
+        "stage_type",
+        "distance",
+        "results",
+        "gc",
+        "points",
+        "kom",
+        "youth",
+        "teams",
+    )
+    """Stage parsing methods called by `crawl` by default."""
+
     def year(self) -> int:
         """
         Parse year when the race occured from HTML.
@@ -203,7 +224,7 @@ class Race(Scraper):
         # removes last row from stages table
         for row in stages_table_html.css("tr.sum"):
             row.remove()
-        table_parser = TableParser(stages_table_html)
+        table_parser = TableParser(stages_table_html, self.instrumentation)
         casual_f_to_parse = [f for f in fields if f != "date"]
         table_parser.parse(casual_f_to_parse)
 
@@ -248,7 +269,7 @@ class Race(Scraper):
             stage_name = stage_e.css_first("td").text()
             if not stage_name:
                 stage_e.remove()
-        table_parser = TableParser(winners_html)
+        table_parser = TableParser(winners_html, self.instrumentation)
     
         casual_f_to_parse = [f for f in fields if f != "stage_name"]
         try:
@@ -278,3 +299,126 @@ class Race(Scraper):
             table_parser.extend_table("stage_name", stage_names)
                     
         return table_parser.table
+
+    def crawl(self, concurrency: Optional[int] = None,
+              stage_fields: Optional[Tuple[str, ...]] = None,
+              startlist: bool = True, climbs: bool = True,
+              resume: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Fetches and parses the whole race: all stages (result page when race
+        is one day race), startlist and climbs. Pages are fetched
+        concurrently in a thread pool and share one session. Page that
+        couldn't be fetched or parsed doesn't stop the crawl, its error is
+        reported in returned dict instead.
+
+        Usage:
+
+        >>> race = Race("race/tour-de-france/2022")
+        >>> bundle = race.crawl(concurrency=4)
+        >>> bundle["stages"][-1]["data"]["gc"][0]["rider_name"]
+        'Vingegaard Jonas'
+        >>> # crawl again only pages that failed
+        >>> bundle = race.crawl(concurrency=4, resume=bundle)
+
+        :param concurrency: Count of pages fetched at once, defaults to
+            `MAX_WORKERS`.
+        :param stage_fields: Stage parsing methods to call, defaults to
+            `crawl_stage_fields`.
+        :param startlist: Whether to crawl race startlist, defaults to True.
+        :param climbs: Whether to crawl race climbs, defaults to True.
+        :param resume: Dict returned by previous crawl of the race. Pages
+            that were parsed successfully are taken from it instead of being
+            crawled again.
+        :return: Dict with keys:
+
+            - race: Parsed race overview, see `parse`.
+            - stages: List of dicts with keys ``stage_url``, ``stage_name``,
+                ``data`` (dict with parsed stage fields, None when failed),
+                ``error`` (None when succeeded) and ``seconds`` (time spent
+                fetching and parsing the stage), in the same order as
+                `stages`.
+            - startlist: Parsed startlist, None when not crawled or failed.
+            - climbs: Parsed climbs, None when not crawled or failed.
+            - errors: URLs of failed pages mapped to error messages.
+            - seconds: Duration of the whole crawl.
+        """
+        crawl_start = time.perf_counter()
+        resume = resume or {}
+        fields = stage_fields or self.crawl_stage_fields
+        race_url = "/".join(self._decompose_url()[:3])
+        if self.is_one_day_race():
+            stages = [{"stage_url": f"{race_url}/result", "stage_name": None}]
+        else:
+            stages = self.stages("stage_name", "stage_url")
+        resumed_stages = {stage["stage_url"]: stage
+                          for stage in resume.get("stages", [])
+                          if stage["error"] is None}
+
+        bundle: Dict[str, Any] = {
+            "race": self.parse(),
+            "stages": [],
+            "startlist": resume.get("startlist") if startlist else None,
+            "climbs": resume.get("climbs") if climbs else None,
+            "errors": {},
+        }
+        with ThreadPoolExecutor(concurrency or self.MAX_WORKERS) as executor:
+            stage_futures = {}
+            for stage in stages:
+                if stage["stage_url"] not in resumed_stages:
+                    stage_futures[stage["stage_url"]] = executor.submit(
+                        self._crawl_page, Stage, stage["stage_url"], fields)
+            page_futures = {}
+            if startlist and bundle["startlist"] is None:
+                page_futures["startlist"] = (f"{race_url}/startlist",
+                    executor.submit(self._crawl_page, RaceStartlist,
+                                    f"{race_url}/startlist", ("startlist",)))
+            if climbs and bundle["climbs"] is None:
+                page_futures["climbs"] = (f"{race_url}/route/climbs",
+                    executor.submit(self._crawl_page, RaceClimbs,
+                                    f"{race_url}/route/climbs", ("climbs",)))
+
+            for stage in stages:
+                if stage["stage_url"] in resumed_stages:
+                    bundle["stages"].append(resumed_stages[stage["stage_url"]])
+                    continue
+                future = stage_futures[stage["stage_url"]]
+                data, error, seconds = future.result()
+                bundle["stages"].append({
+                    "stage_url": stage["stage_url"],
+                    "stage_name": stage["stage_name"],
+                    "data": data,
+                    "error": error,
+                    "seconds": seconds,
+                })
+                if error is not None:
+                    bundle["errors"][stage["stage_url"]] = error
+            for key, (url, future) in page_futures.items():
+                data, error, _ = future.result()
+                if error is not None:
+                    bundle["errors"][url] = error
+                else:
+                    bundle[key] = data[key] # type: ignore
+        bundle["seconds"] = time.perf_counter() - crawl_start
+        return bundle
+
+    @staticmethod
+    def _crawl_page(scraping_class: Type[Scraper], url: str,
+                    fields: Tuple[str, ...]
+                    ) -> Tuple[Optional[Dict[str, Any]], Optional[str], float]:
+        """
+        Fetches page and parses given fields from it, see `crawl`.
+
+        :param scraping_class: Scraping class of the page.
+        :param url: URL of the page.
+        :param fields: Parsing methods to call.
+        :return: Tuple of parsed data (None when failed), error message (None
+            when succeeded) and duration of fetching and parsing.
+        """
+        page_start = time.perf_counter()
+        try:
+            scraper_obj = scraping_class._create_fetched(url)
+            data: Optional[Dict[str, Any]] = scraper_obj.parse(fields=fields)
+            error = None
+        except Exception as e: # pylint: disable=broad-except
+            data, error = None, f"{type(e).__name__}: {e}"
+        return data, error, time.perf_counter() - page_start
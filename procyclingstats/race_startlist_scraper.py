@@ -74,7 +74,8 @@ class RaceStartlist(Scraper):
 
         # if startlist is a table
         if startlist_html:
-            startlist_parser = TableParser(startlist_html)
+            startlist_parser = TableParser(
+                startlist_html, self.instrumentation)
             casual_fields = [f for f in fields if f != "rider_number"]
             startlist_parser.parse(casual_fields)
             # adds rider number to table if needed
@@ -93,7 +94,7 @@ class RaceStartlist(Scraper):
         startlist_html = self.html.css_first(".startlist_v4")
         for team_html in startlist_html.css(".ridersCont"):
             riders_table = team_html.css_first("ul")
-            table_parser = TableParser(riders_table)
+            table_parser = TableParser(riders_table, self.instrumentation)
             rider_f_to_parse = [f for f in casual_rider_fields if f in fields]
             table_parser.parse(rider_f_to_parse)
             # add rider numbers to the table if needed
@@ -1,5 +1,6 @@
 import re
-from typing import Any, Dict, List, Literal, Tuple
+from typing import (Any, Dict, Iterator, List, Literal, Optional, Tuple,
+                    Union)
 
 from .errors import ExpectedParsingError
 from .scraper import Scraper
@@ -60,6 +61,23 @@ class Ranking(Scraper):
         ...
     }
     """
+    _public_nonparsing_methods = Scraper._public_nonparsing_methods + (
+        "iter_all",
+        "iter_dates",
+    )
+    _ranking_methods: Dict[str, str] = {
+        "individual": "individual_ranking",
+        "teams": "team_ranking",
+        "nations": "nations_ranking",
+        "races": "races_ranking",
+        "distance": "distance_ranking",
+        "racedays": "racedays_ranking",
+        "individual_wins": "individual_wins_ranking",
+        "team_wins": "teams_wins_ranking",
+        "nation_wins": "nations_wins_ranking",
+    }
+    """Ranking types mapped to names of methods that parse them."""
+
     def individual_ranking(self, *args: str) -> List[Dict[str, Any]]:
         """
         Parses individual ranking from HTML.
@@ -203,7 +221,7 @@ class Ranking(Scraper):
 
         fields = parse_table_fields_args(args, available_fields)
         html_table = self.html.css_first("table")
-        table_parser = TableParser(html_table)
+        table_parser = TableParser(html_table, self.instrumentation)
         # parse race name and url as stage name and url and rename it
         # afterwards
         if "race_name" in fields:
@@ -372,7 +390,8 @@ class Ranking(Scraper):
         casual_fields = [f for f in fields if f not in ("distance")]
 
         distance_ranking_table_html = self.html.css_first(".page-content > div > div > table")
-        table_parser = TableParser(distance_ranking_table_html)
+        table_parser = TableParser(
+            distance_ranking_table_html, self.instrumentation)
         table_parser.parse(casual_fields)
 
         if "distance" in fields:
@@ -419,7 +438,8 @@ class Ranking(Scraper):
         casual_fields = [f for f in fields if f not in ("racedays")]
 
         distance_ranking_table_html = self.html.css_first(".page-content > div > div > table")
-        table_parser = TableParser(distance_ranking_table_html)
+        table_parser = TableParser(
+            distance_ranking_table_html, self.instrumentation)
         table_parser.parse(casual_fields)
 
         if "racedays" in fields:
@@ -473,6 +493,92 @@ class Ranking(Scraper):
         """
         return parse_select(select_menu_by_name(self.html, "teamlevel"))
 
+    def iter_all(self, *args: str, concurrency: Optional[int] = None,
+                 top_n: Optional[int] = None,
+                 date: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Streams rows of the whole ranking from all its pages (see
+        `pages_select`) in rank order. Pages are fetched in a thread pool,
+        at most `concurrency` pages are being fetched at once and pages are
+        fetched only when they are needed, so stopping the iteration stops
+        fetching.
+
+        Usage:
+
+        >>> ranking = Ranking("rankings/me/individual")
+        >>> for row in ranking.iter_all("rider_name", "points", top_n=250):
+        ...     print(row)
+        {'rider_name': 'Pogačar Tadej', 'points': 2981.0}
+        ...
+
+        :param args: Fields of the rows, same as fields of the ranking
+            parsing method that works with the object (e.g.
+            `individual_ranking`).
+        :param concurrency: Maximum count of pages fetched at once, defaults
+            to `MAX_WORKERS`.
+        :param top_n: Count of rows after which iteration stops, all rows
+            are yielded when None.
+        :param date: Date of the ranking from `dates_select` values, defaults
+            to the date of the object's ranking.
+        :raises ExpectedParsingError: When the object's ranking can't be
+            parsed.
+        :return: Generator yielding ranking rows.
+        """
+        method_name = self._ranking_methods[self._ranking_type()]
+        try:
+            offsets = [option["value"] for option in self.pages_select()]
+        except ExpectedParsingError:
+            offsets = []
+        other_date = date is not None and date != self._selected_value("date")
+        current_offset = None if other_date else self._selected_value("offset")
+        if not offsets or (current_offset is not None and
+                           offsets == [current_offset]):
+            # single page ranking
+            pages: List[Union[str, Scraper]] = [
+                self._filter_url(date=date) if other_date else self]
+        else:
+            pages = [
+                self if offset == current_offset else
+                self._filter_url(offset=offset, date=date)
+                for offset in offsets]
+
+        yielded = 0
+        for page in self._iter_fetched(pages, concurrency):
+            for row in getattr(page, method_name)(*args):
+                if top_n is not None and yielded >= top_n:
+                    return
+                yielded += 1
+                yield row
+
+    def iter_dates(self, *args: str, concurrency: Optional[int] = None,
+                   dates: Optional[List[str]] = None
+                   ) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+        """
+        Streams historical snapshots of the ranking for dates from
+        `dates_select`. Only the first page of the ranking is parsed for
+        every date, use `iter_all` with `date` to get whole ranking.
+
+        :param args: Fields of the rows, same as in `iter_all`.
+        :param concurrency: Maximum count of pages fetched at once, defaults
+            to `MAX_WORKERS`.
+        :param dates: Dates from `dates_select` values to get the ranking
+            for, defaults to all dates.
+        :raises ExpectedParsingError: When the ranking doesn't have dates
+            select menu.
+        :return: Generator yielding tuples of date and ranking table in the
+            same order as dates.
+        """
+        method_name = self._ranking_methods[self._ranking_type()]
+        if dates is None:
+            dates = [option["value"] for option in self.dates_select()]
+        current_date = self._selected_value("date")
+        current_offset = self._selected_value("offset")
+        pages: List[Union[str, Scraper]] = [
+            self if date == current_date and current_offset in (None, "0")
+            else self._filter_url(offset="0", date=date) for date in dates]
+        for date, page in zip(dates, self._iter_fetched(pages, concurrency)):
+            yield date, getattr(page, method_name)(*args)
+
     def _ranking_type(self) -> Literal["individual",
                                        "nations",
                                        "teams",
@@ -524,6 +630,6 @@ class Ranking(Scraper):
         """
         fields = parse_table_fields_args(args, available_fields)
         html_table = self.html.css_first("table")
-        table_parser = TableParser(html_table)
+        table_parser = TableParser(html_table, self.instrumentation)
         table_parser.parse(fields)
         return table_parser.table
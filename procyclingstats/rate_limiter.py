@@ -0,0 +1,173 @@
+import asyncio
+import email.utils
+import random
+import threading
+import time
+from typing import Any, Optional
+
+
+def jittered_backoff(attempt: int, base: float = 1.0,
+                     cap: float = 60.0) -> float:
+    """
+    Computes delay before next retry using exponential backoff with full
+    jitter, so concurrent requests that failed together don't retry together.
+
+    :param attempt: Index of the failed attempt (starting from 0).
+    :param base: Delay of the first retry in seconds, defaults to 1.
+    :param cap: Maximum delay in seconds, defaults to 60.
+    :return: Delay in seconds.
+    """
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parses value of ``Retry-After`` HTTP header.
+
+    :param value: Header value, either count of seconds or HTTP date.
+    :return: Count of seconds to wait, None when value is missing or invalid.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_date.timestamp() - time.time())
+
+
+class RateLimiter:
+    """
+    Token bucket rate limiter with a limit of requests in flight. When set as
+    `Scraper.rate_limiter`, every request (synchronous, from `fetch_many`
+    threads or asynchronous) has to acquire it first.
+
+    When adaptive, the rate is halved every time a request is blocked and
+    slowly restored after successful requests, up to the initial rate.
+
+    Usage:
+
+    >>> from procyclingstats import RateLimiter, Scraper
+    >>> Scraper.rate_limiter = RateLimiter(rate=2, burst=5, max_in_flight=4)
+    >>> with Scraper.rate_limiter:
+    ...     pass # make request
+
+    :param rate: Requests per second, defaults to 2.
+    :param burst: Maximum count of requests that can be made at once after
+        a period of inactivity, defaults to 4.
+    :param max_in_flight: Maximum count of unfinished requests, None for
+        unlimited. Defaults to 8.
+    :param adaptive: Whether to decrease the rate when requests are blocked,
+        defaults to True.
+    :param min_rate: Minimum rate when adaptive, defaults to 0.1.
+    """
+
+    POLL_INTERVAL: float = 0.05
+    """Seconds to wait before trying again when no request slot is free."""
+
+    def __init__(self, rate: float = 2.0, burst: int = 4,
+                 max_in_flight: Optional[int] = 8, adaptive: bool = True,
+                 min_rate: float = 0.1) -> None:
+        if rate <= 0 or burst < 1:
+            raise ValueError("Rate has to be positive and burst at least 1")
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.max_in_flight = max_in_flight
+        self.adaptive = adaptive
+        self.min_rate = min(min_rate, rate)
+
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._paused_until = 0.0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return (f"{type(self).__name__}(rate={self.rate}, burst={self.burst}, "
+                f"max_in_flight={self.max_in_flight})")
+
+    def __enter__(self) -> "RateLimiter":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.release()
+
+    async def __aenter__(self) -> "RateLimiter":
+        await self.acquire_async()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.release()
+
+    @property
+    def in_flight(self) -> int:
+        """Count of requests that acquired the limiter and weren't released."""
+        return self._in_flight
+
+    def acquire(self) -> None:
+        """Blocks until request can be made."""
+        wait = self._try_acquire()
+        while wait:
+            time.sleep(wait)
+            wait = self._try_acquire()
+
+    async def acquire_async(self) -> None:
+        """Waits without blocking the event loop until request can be made."""
+        wait = self._try_acquire()
+        while wait:
+            await asyncio.sleep(wait)
+            wait = self._try_acquire()
+
+    def release(self) -> None:
+        """Marks request as finished."""
+        with self._lock:
+            self._in_flight = max(0, self._in_flight - 1)
+
+    def blocked(self, retry_after: Optional[float] = None) -> None:
+        """
+        Reports blocked request. All requests are paused for `retry_after`
+        seconds and the rate is halved when adaptive.
+
+        :param retry_after: Seconds from ``Retry-After`` header, if any.
+        """
+        with self._lock:
+            if retry_after:
+                self._paused_until = max(self._paused_until,
+                                         time.monotonic() + retry_after)
+            if self.adaptive:
+                self.rate = max(self.min_rate, self.rate / 2)
+
+    def succeeded(self) -> None:
+        """Reports successful request, so adaptive rate can be increased."""
+        if not self.adaptive or self.rate >= self.max_rate:
+            return
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 20)
+
+    def _try_acquire(self) -> float:
+        """
+        Acquires request slot if possible.
+
+        :return: 0 when slot was acquired, otherwise seconds to wait before
+            trying again.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst,
+                self._tokens + (now - self._last_refill) * self.rate)
+            self._last_refill = now
+            if now < self._paused_until:
+                return self._paused_until - now
+            if (self.max_in_flight is not None and
+                    self._in_flight >= self.max_in_flight):
+                return self.POLL_INTERVAL
+            if self._tokens < 1:
+                return (1 - self._tokens) / self.rate
+            self._tokens -= 1
+            self._in_flight += 1
+            return 0
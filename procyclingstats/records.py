@@ -0,0 +1,168 @@
+import collections
+import keyword
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+ROW_TYPE_NAMES: Dict[str, str] = {
+    "results": "ResultRow",
+    "gc": "GCRow",
+    "points": "PointsRow",
+    "kom": "KOMRow",
+    "youth": "YouthRow",
+    "teams": "TeamResultRow",
+    "startlist": "StartlistRow",
+    "riders": "TeamRiderRow",
+    "climbs": "ClimbRow",
+    "stages": "StageRow",
+    "individual_ranking": "RankingRow",
+    "team_ranking": "RankingRow",
+    "nations_ranking": "RankingRow",
+    "races_ranking": "RankingRow",
+    "individual_wins_ranking": "RankingRow",
+    "teams_wins_ranking": "RankingRow",
+    "nations_wins_ranking": "RankingRow",
+    "distance_ranking": "RankingRow",
+    "racedays_ranking": "RankingRow",
+}
+"""
+Names of parsing methods returning tables mapped to names of their row
+types. Other tables have row types named by the method, e.g.
+``teams_history`` -> ``TeamsHistoryRow``.
+"""
+
+_row_types: Dict[Tuple[str, Tuple[str, ...]], type] = {}
+_row_types_lock = threading.Lock()
+
+
+def row_type(name: str, fields: Tuple[str, ...]) -> type:
+    """
+    Gets row type with given name and fields. Row type is a ``NamedTuple``
+    (so rows don't have ``__dict__``) which attributes are the fields.
+    Fields that aren't valid attribute names (``class``) get underscore
+    suffix (``class_``). Row types are created only once for every name and
+    fields.
+
+    Row types have `fields` attribute with original field names and
+    `as_dict` method converting row back to dict.
+
+    :param name: Name of the row type, e.g. ``ResultRow``.
+    :param fields: Fields of rows.
+    :return: Row type.
+    """
+    key = (name, fields)
+    cls = _row_types.get(key)
+    if cls is None:
+        with _row_types_lock:
+            cls = _row_types.get(key)
+            if cls is None:
+                base = collections.namedtuple(  # type: ignore
+                    name, [_attribute_name(field) for field in fields])
+                cls = type(name, (base,), {
+                    "__slots__": (),
+                    "__module__": __name__,
+                    "fields": fields,
+                    "as_dict": _as_dict,
+                })
+                _row_types[key] = cls
+    return cls
+
+def row_type_name(method_name: str) -> str:
+    """
+    :param method_name: Name of parsing method returning a table.
+    :return: Name of row type of the table, see `ROW_TYPE_NAMES`.
+    """
+    name = ROW_TYPE_NAMES.get(method_name)
+    if name is None:
+        name = "".join(part.capitalize() for part in method_name.split("_"))
+        name += "Row"
+    return name
+
+def as_records(table: List[Dict[str, Any]],
+               row_type_or_name: Union[str, Callable[..., Any]] = "Row"
+               ) -> List[Any]:
+    """
+    Converts table (list of dicts) to list of row objects.
+
+    Usage:
+
+    >>> from procyclingstats import Stage
+    >>> from procyclingstats.records import as_records
+    >>> stage = Stage("race/tour-de-france/2022/stage-21")
+    >>> rows = as_records(stage.results("rider_name", "rank"), "ResultRow")
+    >>> rows[0]
+    ResultRow(rider_name='Philipsen Jasper', rank=1)
+    >>> rows[0].as_dict()
+    {'rider_name': 'Philipsen Jasper', 'rank': 1}
+
+    :param table: Table to convert. Rows should have the same keys, missing
+        values are None.
+    :param row_type_or_name: Name of row type to create with `row_type`
+        from fields of the table, or class which is called with the fields
+        as keyword arguments (e.g. own dataclass with slots). Defaults to
+        ``Row``.
+    :return: List of row objects.
+    """
+    if not table:
+        return []
+    fields: Dict[str, None] = {}
+    for row in table:
+        for field in row:
+            fields.setdefault(field)
+    field_names = tuple(fields)
+    if isinstance(row_type_or_name, str):
+        cls = row_type(row_type_or_name, field_names)
+        return [cls(*[row.get(field) for field in field_names])
+                for row in table]
+    attribute_names = [_attribute_name(field) for field in field_names]
+    return [row_type_or_name(**{attribute: row.get(field) for attribute, field
+                                in zip(attribute_names, field_names)})
+            for row in table]
+
+def as_dicts(records: List[Any]) -> List[Dict[str, Any]]:
+    """
+    Converts row objects created by `as_records` back to table.
+
+    :param records: Row objects with `as_dict` method (created by
+        `row_type`) or dataclass instances.
+    :return: Table represented as list of dicts.
+    """
+    table = []
+    for record in records:
+        as_dict: Optional[Callable[[], Dict[str, Any]]] = getattr(
+            record, "as_dict", None)
+        if as_dict is not None:
+            table.append(as_dict())
+        else:
+            table.append({_field_name(attribute): getattr(record, attribute)
+                          for attribute in record.__dataclass_fields__})
+    return table
+
+def is_table(value: Any) -> bool:
+    """
+    :param value: Parsed value.
+    :return: Whether the value is a table (non-empty list of dicts).
+    """
+    return (isinstance(value, list) and bool(value) and
+            all(isinstance(row, dict) for row in value))
+
+def _as_dict(self: Any) -> Dict[str, Any]:
+    """
+    :return: Row converted to dict with original field names.
+    """
+    return dict(zip(type(self).fields, self))
+
+def _attribute_name(field: str) -> str:
+    """
+    :param field: Field name.
+    :return: Field name that can be used as attribute name.
+    """
+    return field + "_" if keyword.iskeyword(field) else field
+
+def _field_name(attribute: str) -> str:
+    """
+    :param attribute: Attribute name made by `_attribute_name`.
+    :return: Original field name.
+    """
+    if attribute.endswith("_") and keyword.iskeyword(attribute[:-1]):
+        return attribute[:-1]
+    return attribute
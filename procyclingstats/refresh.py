@@ -0,0 +1,275 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from .scraper import Scraper
+from .today_races_scraper import TodayRaces
+
+
+class RefreshReport(NamedTuple):
+    """Result of `IncrementalRefresher.refresh`."""
+    refreshed: List[str]
+    """URLs which content changed, so they were parsed again."""
+    unchanged: List[str]
+    """URLs that were fetched, but their content didn't change."""
+    skipped: List[str]
+    """URLs that weren't fetched, because they aren't dirty (see
+    `IncrementalRefresher`)."""
+    errors: Dict[str, str]
+    """URLs that couldn't be refreshed mapped to error messages."""
+
+
+class IncrementalRefresher:
+    """
+    Keeps the last parsed output of pages in SQLite database together with
+    hash of their HTML, so pages are parsed again only when they changed.
+    Requests are made by `Scraper`, so `Scraper.cache` (``ETag``
+    revalidation) and `Scraper.rate_limiter` are used when set.
+
+    Page is dirty (has to be fetched) when it wasn't refreshed yet, when
+    `refresh` is called without a change feed or when the change feed marks
+    it as changed. The change feed is `TodayRaces` object: races from its
+    `finished_races` and `yesterday_races` make all pages of these races
+    dirty (e.g. the race overview and all its stages) and riders from
+    results of refreshed race pages make their rider pages dirty. The feed
+    doesn't say anything about other pages (e.g. rankings or teams), so they
+    are dirty when they were checked more than `max_age` seconds ago. Dirty
+    page is fetched and parsed only when hash of its HTML changed.
+
+    Usage:
+
+    >>> from procyclingstats import IncrementalRefresher, TodayRaces
+    >>> refresher = IncrementalRefresher("pcs_refresh.sqlite")
+    >>> report = refresher.refresh(["race/tour-de-france/2024/stage-21",
+    ...                             "rider/tadej-pogacar"],
+    ...                            today=TodayRaces())
+    >>> report.skipped
+    ['race/tour-de-france/2024/stage-21', 'rider/tadej-pogacar']
+    >>> refresher.get("rider/tadej-pogacar")["nationality"]
+    'SI'
+
+    :param path: Path to SQLite database file, defaults to
+        ``pcs_refresh.sqlite``. Use ``:memory:`` for in-memory database.
+    :param max_workers: Count of threads fetching pages, defaults to
+        `Scraper.MAX_WORKERS`.
+    :param max_age: Count of seconds after which pages that aren't race or
+        rider pages are dirty when change feed is used, defaults to a day.
+        When None, such pages are dirty only when they weren't refreshed
+        yet or were invalidated by `invalidate`.
+    """
+
+    def __init__(self, path: str = "pcs_refresh.sqlite",
+                 max_workers: Optional[int] = None,
+                 max_age: Optional[float] = 86400) -> None:
+        self.path = path
+        self.max_workers = max_workers or Scraper.MAX_WORKERS
+        self.max_age = max_age
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS pages ("
+            "url TEXT PRIMARY KEY, content_hash TEXT NOT NULL, "
+            "data TEXT NOT NULL, checked_at REAL NOT NULL, "
+            "refreshed_at REAL NOT NULL)")
+        self._connection.commit()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(path='{self.path}')"
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Gets the last parsed output of given page.
+
+        :param url: URL of the page. Either absolute or relative.
+        :return: Output of `Scraper.parse`, None when page wasn't refreshed
+            yet.
+        """
+        row = self._get_row(self._relative_url(url))
+        if row is None:
+            return None
+        return json.loads(row[1])
+
+    def refresh(self, urls: Iterable[str], today: Optional[TodayRaces] = None,
+                force: bool = False) -> RefreshReport:
+        """
+        Refreshes given pages. Race pages are refreshed before rider pages,
+        so riders from refreshed results are known before riders are
+        checked.
+
+        :param urls: URLs of pages to refresh. Either absolute or relative.
+        :param today: Change feed, when None all pages are dirty.
+        :param force: Whether to parse dirty pages even if their HTML didn't
+            change, defaults to False.
+        :return: Report with refreshed, unchanged, skipped and failed URLs.
+        """
+        relative_urls = list(dict.fromkeys(
+            self._relative_url(url) for url in urls))
+        report = RefreshReport([], [], [], {})
+        if today is None:
+            dirty_races = None
+        else:
+            dirty_races = {self._race_prefix(race["url"]) for race in
+                           today.finished_races() + today.yesterday_races()}
+        dirty_riders: Set[str] = set()
+
+        race_urls = [url for url in relative_urls
+                     if not url.startswith("rider/")]
+        rider_urls = [url for url in relative_urls
+                      if url.startswith("rider/")]
+        for urls_group in (race_urls, rider_urls):
+            to_fetch = []
+            for url in urls_group:
+                if (dirty_races is None or
+                        self._is_dirty(url, dirty_races, dirty_riders)):
+                    to_fetch.append(url)
+                else:
+                    report.skipped.append(url)
+            with ThreadPoolExecutor(self.max_workers) as executor:
+                results = executor.map(
+                    lambda url: self._refresh_url(url, force), to_fetch)
+                for url, (status, data) in zip(to_fetch, results):
+                    if status == "refreshed":
+                        report.refreshed.append(url)
+                        dirty_riders.update(self._riders(data))
+                    elif status == "unchanged":
+                        report.unchanged.append(url)
+                    else:
+                        report.errors[url] = status
+        return report
+
+    def invalidate(self, url: str) -> None:
+        """
+        Removes given page, so it's fetched and parsed by next refresh.
+
+        :param url: URL of the page. Either absolute or relative.
+        """
+        with self._lock:
+            self._connection.execute("DELETE FROM pages WHERE url = ?",
+                                     (self._relative_url(url),))
+            self._connection.commit()
+
+    def close(self) -> None:
+        """Closes database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def _refresh_url(self, url: str, force: bool
+                     ) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """
+        Fetches given page and parses it when its HTML changed.
+
+        :param url: Relative URL of the page.
+        :param force: Whether to parse the page even if HTML didn't change.
+        :return: Tuple of status (``refreshed``, ``unchanged`` or error
+            message) and parsed data (None when not parsed).
+        """
+        try:
+            scraping_class = Scraper._scraping_class_for(url)
+            scraper_obj = scraping_class._create_unfetched(url)
+            html = scraper_obj._make_request(scraper_obj.url)
+            content_hash = hashlib.sha256(html.encode("utf-8")).hexdigest()
+            row = self._get_row(url)
+            now = time.time()
+            if not force and row is not None and row[0] == content_hash:
+                with self._lock:
+                    self._connection.execute(
+                        "UPDATE pages SET checked_at = ? WHERE url = ?",
+                        (now, url))
+                    self._connection.commit()
+                return "unchanged", None
+            scraper_obj._html = scraper_obj._parse_html(scraper_obj.url, html)
+            scraper_obj._prepare_fetched_html()
+            data = scraper_obj.parse()
+            with self._lock:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?)",
+                    (url, content_hash, json.dumps(data, default=str),
+                     now, now))
+                self._connection.commit()
+            return "refreshed", data
+        except Exception as e: # pylint: disable=broad-except
+            return f"{type(e).__name__}: {e}", None
+
+    def _is_dirty(self, url: str, dirty_races: Set[str],
+                  dirty_riders: Set[str]) -> bool:
+        """
+        Checks whether page has to be fetched when change feed is used.
+
+        :param url: Relative URL of the page.
+        :param dirty_races: URLs of races marked as changed by the feed.
+        :param dirty_riders: URLs of riders from refreshed results.
+        :return: True if the page is dirty, otherwise False.
+        """
+        row = self._get_row(url)
+        if row is None:
+            return True
+        if url.startswith("race/"):
+            return self._race_prefix(url) in dirty_races
+        if url.startswith("rider/"):
+            return self._rider_prefix(url) in dirty_riders
+        return self.max_age is not None and \
+            time.time() - row[2] > self.max_age
+
+    def _get_row(self, url: str) -> Optional[Tuple[str, str, float]]:
+        """
+        :param url: Relative URL of the page.
+        :return: Tuple of content hash, JSON with parsed data and time when
+            the page was checked, None when page wasn't refreshed yet.
+        """
+        with self._lock:
+            return self._connection.execute(
+                "SELECT content_hash, data, checked_at FROM pages "
+                "WHERE url = ?", (url,)).fetchone()
+
+    @staticmethod
+    def _riders(data: Any) -> Set[str]:
+        """
+        Finds riders in parsed data.
+
+        :param data: Parsed data of a page.
+        :return: Set of riders URLs prefixes (``rider/<name>``).
+        """
+        riders = set()
+        if isinstance(data, dict):
+            for key, value in data.items():
+                if key == "rider_url" and isinstance(value, str):
+                    riders.add(IncrementalRefresher._rider_prefix(value))
+                else:
+                    riders.update(IncrementalRefresher._riders(value))
+        elif isinstance(data, list):
+            for value in data:
+                riders.update(IncrementalRefresher._riders(value))
+        return riders
+
+    @staticmethod
+    def _relative_url(url: str) -> str:
+        """
+        :param url: Absolute or relative URL.
+        :return: Relative URL without leading and trailing slashes.
+        """
+        if url.startswith(Scraper.BASE_URL):
+            url = url[len(Scraper.BASE_URL):]
+        return url.strip("/")
+
+    @staticmethod
+    def _race_prefix(url: str) -> str:
+        """
+        :param url: Relative URL of a race page, e.g.
+            ``race/tour-de-france/2022/stage-1``.
+        :return: URL of the race, e.g. ``race/tour-de-france/2022``.
+        """
+        return "/".join(url.strip("/").split("/")[:3])
+
+    @staticmethod
+    def _rider_prefix(url: str) -> str:
+        """
+        :param url: Relative URL of a rider page, e.g.
+            ``rider/tadej-pogacar/results``.
+        :return: URL of the rider, e.g. ``rider/tadej-pogacar``.
+        """
+        return "/".join(url.strip("/").split("/")[:2])
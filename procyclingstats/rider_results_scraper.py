@@ -1,4 +1,5 @@
-from typing import Any, Dict, List
+from typing import (Any, Dict, Iterable, Iterator, List, Optional, Set,
+                    Tuple, Union)
 
 from .errors import ExpectedParsingError
 from .scraper import Scraper
@@ -52,6 +53,10 @@ class RiderResults(Scraper):
         ...
     }
     """
+    _public_nonparsing_methods = Scraper._public_nonparsing_methods + (
+        "iter_career",
+    )
+
     def _html_valid(self) -> bool:
         """
         Extends Scraper method for validating HTMLs.
@@ -119,7 +124,7 @@ class RiderResults(Scraper):
 
         fields = parse_table_fields_args(args, available_fields)
         results_table_html = self.html.css_first("table")
-        table_parser = TableParser(results_table_html)
+        table_parser = TableParser(results_table_html, self.instrumentation)
         table_parser.parse(fields)
         return table_parser.table
 
@@ -168,7 +173,7 @@ class RiderResults(Scraper):
             if f not in ("vertical_meters", "average_percentage")]
 
         results_table_html = self.html.css_first("div:nth-child(4) table")
-        table_parser = TableParser(results_table_html)
+        table_parser = TableParser(results_table_html, self.instrumentation)
         table_parser.parse(casual_fields)
         # add vertical meters column if needed
         if "vertical_meters" in fields:
@@ -233,3 +238,104 @@ class RiderResults(Scraper):
             ``text`` and ``value``.
         """
         return parse_select(select_menu_by_name(self.html, "category"))
+
+    @classmethod
+    def iter_career(cls, rider_url: str, *args: str,
+                    concurrency: Optional[int] = None,
+                    seasons: Optional[List[str]] = None
+                    ) -> Iterator[Dict[str, Any]]:
+        """
+        Streams rider's results from all pages of the results table. Pages
+        are fetched in a thread pool with at most `concurrency` pages being
+        fetched at once and only when they are needed, so only a few pages
+        are held in memory at any time. When `seasons` are given, the first
+        pages of the seasons are prefetched the same way (by another
+        `concurrency` threads). Rows that were already yielded (e.g. when
+        results were updated during the iteration and shifted to the next
+        page) are skipped, rows are identified by ``date`` and
+        ``stage_url``.
+
+        Usage:
+
+        >>> from procyclingstats import RiderResults
+        >>> results = RiderResults.iter_career("rider/tadej-pogacar",
+        ...                                    "date", "stage_url", "rank")
+        >>> next(results)
+        {'date': '2024-10-12', 'stage_url': 'race/il-lombardia/2024/result',
+         'rank': 1}
+
+        :param rider_url: URL of the rider or of the rider's results page.
+        :param args: Fields of the rows, same as `results` fields.
+        :param concurrency: Maximum count of pages fetched at once, defaults
+            to `MAX_WORKERS`.
+        :param seasons: Seasons from `seasons_select` values to get results
+            from (in given order), the whole career when None.
+        :raises ValueError: When one of args is of invalid value or HTML of
+            the results page is invalid.
+        :return: Generator yielding results rows, newest first within every
+            season.
+        """
+        rider_url = rider_url.rstrip("/")
+        if not rider_url.endswith("/results"):
+            rider_url += "/results"
+        # date and stage URL identify a result, so they're always parsed
+        key_fields = [f for f in ("date", "stage_url")
+                      if args and f not in args]
+        fields_to_parse = list(args) + key_fields
+
+        first_page = cls._create_fetched(rider_url)
+        if seasons is None:
+            pages: Iterable[Union[str, Scraper]] = \
+                first_page._career_pages(None)
+        else:
+            pages = first_page._seasons_pages(seasons, concurrency)
+
+        keys: Set[Tuple[Any, Any]] = set()
+        for page in cls._iter_fetched(pages, concurrency):
+            for row in page.results(*fields_to_parse): # type: ignore
+                key = (row["date"], row["stage_url"])
+                if key in keys:
+                    continue
+                keys.add(key)
+                for key_field in key_fields:
+                    row.pop(key_field)
+                yield row
+
+    def _career_pages(self, season: Optional[str]
+                      ) -> Iterator[Union[str, "RiderResults"]]:
+        """
+        Gets pages of the results table of the object.
+
+        :param season: Season the object's results are filtered by.
+        :return: Generator yielding the object itself for its own page and
+            URLs of the other pages.
+        """
+        try:
+            offsets = [option["value"] for option in self.pages_select()]
+        except ExpectedParsingError:
+            offsets = []
+        current_offset = self._selected_value("offset")
+        yield self
+        for offset in offsets:
+            if offset != current_offset:
+                yield self._filter_url(offset=offset, xseason=season)
+
+    def _seasons_pages(self, seasons: List[str],
+                       concurrency: Optional[int] = None
+                       ) -> Iterator[Union[str, "RiderResults"]]:
+        """
+        Gets pages of the results table filtered by given seasons. The first
+        pages of the seasons (needed to find out count of their pages) are
+        fetched in a thread pool, see `_iter_fetched`.
+
+        :param seasons: Seasons from `seasons_select` values.
+        :param concurrency: Maximum count of the first pages fetched at once,
+            defaults to `MAX_WORKERS`.
+        :return: Generator yielding the first page of every season and URLs
+            of the other pages of the season.
+        """
+        season_urls = [self._filter_url(offset="0", xseason=season)
+                       for season in seasons]
+        season_pages = type(self)._iter_fetched(season_urls, concurrency)
+        for season, season_page in zip(seasons, season_pages):
+            yield from season_page._career_pages(season) # type: ignore
@@ -154,7 +154,7 @@ class Rider(Scraper):
         filtered_ul_html = "<ul class='rdr-teams2'>{}</ul>".format("".join(li.html for li in valid_items))
         # Parse a new HTML string with the filtered items
         filtered_ul_node = HTMLParser(filtered_ul_html).css_first("ul.rdr-teams2")
-        table_parser = TableParser(filtered_ul_node)
+        table_parser = TableParser(filtered_ul_node, self.instrumentation)
         casual_fields = [f for f in fields
                          if f in ("season", "team_name", "team_url")]
         if casual_fields:
@@ -201,7 +201,7 @@ class Rider(Scraper):
         )
         fields = parse_table_fields_args(args, available_fields)
         points_table_html = self.html.css_first("div.mt20 > table")
-        table_parser = TableParser(points_table_html)
+        table_parser = TableParser(points_table_html, self.instrumentation)
         table_parser.parse(fields)
         return table_parser.table
 
@@ -302,7 +302,7 @@ class Rider(Scraper):
         # Clean string when there's an additional crossed-out value. Takes most recent updated value
         clean_crossed_out_val = lambda x: x.strip().split(' ')[-1]
 
-        table_parser = TableParser(results_html)
+        table_parser = TableParser(results_html, self.instrumentation)
         if casual_fields:
             table_parser.parse(casual_fields)
         if "date" in fields:
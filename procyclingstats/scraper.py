@@ -1,9 +1,20 @@
+import asyncio
+import contextlib
 import inspect
+import threading
 import time
-from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+from collections import deque
+from collections.abc import Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (Any, Callable, ContextManager, Deque, Dict, Hashable,
+                    Iterable, Iterator, List, Optional, Set, Tuple, Type,
+                    TypeVar, Union)
+from urllib.parse import urlencode
 
 import requests
-from selectolax.parser import HTMLParser
+from requests.adapters import HTTPAdapter
+from selectolax.parser import HTMLParser, Node
+from urllib3.util.retry import Retry
 
 # Try to import cloudscraper to bypass Cloudflare
 try:
@@ -12,7 +23,116 @@ try:
 except ImportError:
     HAS_CLOUDSCRAPER = False
 
+# Try to import aiohttp for native asyncio requests
+try:
+    import aiohttp
+    HAS_AIOHTTP = True
+except ImportError:
+    HAS_AIOHTTP = False
+
+# Try to import httpx for HTTP/2 requests
+try:
+    import httpx
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+
+from .cache import CachedResponse, HTMLTreeCache, ResponseCache
 from .errors import ExpectedParsingError
+from .instrumentation import Instrumentation
+from .rate_limiter import RateLimiter, jittered_backoff, parse_retry_after
+from .records import as_records, is_table, row_type_name
+from .transport import Transport
+
+T = TypeVar("T")
+
+_REQUEST_EXCEPTIONS: Tuple[Type[Exception], ...] = (
+    (requests.RequestException, httpx.HTTPError) if HAS_HTTPX
+    else (requests.RequestException,))
+"""Exceptions raised by sessions when request fails."""
+
+class LazyParsedData(Mapping):
+    """
+    Read-only dict returned by `Scraper.parse` when called with
+    ``lazy=True``. Parsing method is called when its key is accessed for the
+    first time and the parsed value is memoized.
+
+    :param scraper: Scraper to call parsing methods of.
+    :param method_names: Names of parsing methods that are keys of the dict.
+    :param exceptions_to_ignore: Exceptions ignored when raised by parsing
+        methods.
+    :param none_when_unavailable: Whether value is None when parsing method
+        raises ignored exception. When False the key is treated as missing,
+        so iterating or getting length of the dict calls all parsing methods.
+    :param records: Whether tables are converted to row objects, see
+        `Scraper.parse`. Defaults to False.
+    """
+
+    def __init__(self, scraper: "Scraper", method_names: Tuple[str, ...],
+                 exceptions_to_ignore: Tuple[Type[Exception], ...],
+                 none_when_unavailable: bool, records: bool = False) -> None:
+        self._scraper = scraper
+        self._method_names = method_names
+        self._exceptions_to_ignore = exceptions_to_ignore
+        self._none_when_unavailable = none_when_unavailable
+        self._records = records
+        self._values: Dict[str, Any] = {}
+        self._unavailable: Set[str] = set()
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._method_names or not self._load(key):
+            raise KeyError(key)
+        return self._values[key]
+
+    def __iter__(self) -> Iterator[str]:
+        for method_name in self._method_names:
+            if self._none_when_unavailable or method_name in self:
+                yield method_name
+
+    def __len__(self) -> int:
+        if self._none_when_unavailable:
+            return len(self._method_names)
+        return sum(1 for _ in self)
+
+    def __contains__(self, key: object) -> bool:
+        if key not in self._method_names:
+            return False
+        return self._none_when_unavailable or self._load(key) # type: ignore
+
+    def __repr__(self) -> str:
+        items = ", ".join(
+            f"{name!r}: {self._values[name]!r}" if name in self._values
+            else f"{name!r}: ..." for name in self._method_names
+            if name not in self._unavailable)
+        return f"{type(self).__name__}({{{items}}})"
+
+    def _load(self, key: str) -> bool:
+        """
+        Calls parsing method and memoizes its value if it wasn't called yet.
+        Exceptions other than ignored ones are raised, so e.g. ``KeyError``
+        raised by a parsing method isn't mistaken for a missing key.
+
+        :param key: Name of the parsing method.
+        :return: False when the parsing method raised ignored exception and
+            the key is treated as missing, otherwise True.
+        """
+        if key in self._values:
+            return True
+        if key in self._unavailable:
+            return False
+        try:
+            with self._scraper._timer("parsing_method_seconds", method=key):
+                value = getattr(self._scraper, key)()
+        except self._exceptions_to_ignore:
+            if not self._none_when_unavailable:
+                self._unavailable.add(key)
+                return False
+            value = None
+        if self._records and is_table(value):
+            value = as_records(value, row_type_name(key))
+        self._values[key] = value
+        return True
+
 
 class Scraper:
     """Base class for all scraping classes."""
@@ -28,17 +148,52 @@ class Scraper:
         'Upgrade-Insecure-Requests': '1',
     }
 
+    cache: Optional[ResponseCache] = None
+    """Response cache consulted before every request, None to disable."""
+    tree_cache: Optional[HTMLTreeCache] = None
+    """Cache of parsed HTML trees shared by all scrapers, None to disable."""
+    rate_limiter: Optional[RateLimiter] = None
+    """Rate limiter acquired before every request, None to disable."""
+    instrumentation: Optional[Instrumentation] = None
+    """Collector of timings of requests and parsing, None to disable."""
+    transport: Optional[Transport] = None
+    """
+    Source of pages used instead of requests to `BASE_URL`, e.g. a local
+    mirror. None to make requests.
+    """
+
     # Shared session to maintain cookies
     _session = None
-    _scraper = None  # cloudscraper instance
+    _session_lock = threading.Lock()
+
+    ASYNC_CONCURRENCY: int = 8
+    """Default maximum of requests made at once by `create_many_async`."""
+    MAX_WORKERS: int = 8
+    """Default count of threads used by `fetch_many`."""
+    POOL_CONNECTIONS: int = 10
+    """Default count of hosts which connection pools are kept by session."""
+    POOL_MAXSIZE: int = 16
+    """
+    Default maximum of connections to one host kept alive by session. Should
+    be at least the count of threads making requests, otherwise connections
+    are closed after every request and new connections have to be opened.
+    """
 
     _public_nonparsing_methods = (
         "update_html",
         "parse",
         "relative_url",
         "fetch_html",  
+        "update_html_async",
+        "fetch_html_async",
+        "create_async",
+        "create_many_async",
+        "fetch_many",
+        "configure_session",
     )
     """Public methods that aren't called by `parse` method."""
+    _parsing_methods_registry: Dict[type, Tuple[str, ...]] = {}
+    """Names of parsing methods of scraping classes mapped by the class."""
 
     def __init__(self, url: str, html: Optional[str] = None,
                  update_html: bool = True) -> None:
@@ -61,17 +216,20 @@ class Scraper:
         # validate given URL
         self._url = self._make_url_absolute(url)
         self._html = None
+        self._memo: Dict[Hashable, Any] = {}
+        self._memo_html: Optional[HTMLParser] = None
+        self._uncached_response: Optional[Tuple[str, str, Any]] = None
         if html:
-            self._html = HTMLParser(html)
-            if not self._html_valid():
+            with self._timer("html_parser_seconds"):
+                self._html = HTMLParser(html)
+            with self._timer("html_valid_seconds"):
+                html_valid = self._html_valid()
+            if not html_valid:
                 raise ValueError("Given HTML is invalid.")
             self._set_up_html()
         if update_html:
             self.update_html()
-            if not self._html_valid():
-                raise ValueError(
-                    f"HTML from given URL is invalid: '{self.url}'")
-            self._set_up_html()
+            self._prepare_fetched_html()
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}(url='{self.url}')"
@@ -102,84 +260,483 @@ class Scraper:
         """
         return "/".join(self._url.split("/")[3:])
 
+    @classmethod
+    def configure_session(cls, session: Any = None,
+                          pool_connections: Optional[int] = None,
+                          pool_maxsize: Optional[int] = None,
+                          max_retries: int = 0, pool_block: bool = False,
+                          http2: bool = False) -> Any:
+        """
+        Sets session shared by all synchronous requests. Either given
+        session is used or new session with given connection pool is
+        created.
+
+        Usage:
+
+        >>> from procyclingstats import Scraper
+        >>> session = Scraper.configure_session(pool_maxsize=32)
+        >>> session = Scraper.configure_session(http2=True) # needs httpx
+
+        :param session: Session to use, e.g. ``requests.Session`` with custom
+            adapters or ``httpx.Client``. It has to have ``get`` method
+            accepting ``headers`` and ``timeout`` keyword arguments and
+            returning response with ``status_code``, ``text`` and
+            ``headers``. Other parameters are ignored when given. Defaults to
+            None.
+        :param pool_connections: Count of hosts which connection pools are
+            kept, defaults to `POOL_CONNECTIONS`.
+        :param pool_maxsize: Maximum of connections to one host kept alive,
+            defaults to `POOL_MAXSIZE`.
+        :param max_retries: Count of retries of failed connections made by
+            the connection pool (failed responses are retried by `Scraper`
+            regardless), defaults to 0.
+        :param pool_block: Whether requests should wait for a free connection
+            when `pool_maxsize` connections are in use instead of opening
+            a new one, defaults to False.
+        :param http2: Whether to create ``httpx.Client`` with HTTP/2
+            multiplexing instead of ``requests`` session, defaults to False.
+        :raises ImportError: When HTTP/2 is wanted and httpx isn't installed.
+        :return: The session that is used.
+        """
+        if session is None:
+            pool_connections = pool_connections or cls.POOL_CONNECTIONS
+            pool_maxsize = pool_maxsize or cls.POOL_MAXSIZE
+            if http2:
+                session = cls._create_http2_session(pool_maxsize, max_retries)
+            else:
+                session = cls._create_session(pool_connections, pool_maxsize,
+                                              max_retries, pool_block)
+        with Scraper._session_lock:
+            Scraper._session = session
+        return session
+
     @classmethod
     def _get_session(cls):
         """
-        Obtain or create a session to make requests.
+        Obtain or create a session to make requests. Session set by
+        `configure_session` is used, otherwise the default session is
+        created.
+        """
+        with Scraper._session_lock:
+            if Scraper._session is None:
+                Scraper._session = cls._create_session(
+                    cls.POOL_CONNECTIONS, cls.POOL_MAXSIZE, 0, False)
+            return Scraper._session
+
+    @classmethod
+    def _create_session(cls, pool_connections: int, pool_maxsize: int,
+                        max_retries: int, pool_block: bool
+                        ) -> requests.Session:
+        """
+        Creates ``requests`` session with connection pools of given size.
         Use cloudscraper if available to bypass Cloudflare.
+
+        :param pool_connections: Count of hosts which connection pools are
+            kept.
+        :param pool_maxsize: Maximum of connections to one host kept alive.
+        :param max_retries: Count of retries of failed connections.
+        :param pool_block: Whether to wait for a free connection.
+        :return: New session.
         """
         if HAS_CLOUDSCRAPER:
-            if cls._scraper is None:
-                cls._scraper = cloudscraper.create_scraper(
-                    browser={
-                        'browser': 'chrome',
-                        'platform': 'windows',
-                        'desktop': True
-                    }
-                )
-            return cls._scraper
+            session = cloudscraper.create_scraper(
+                browser={
+                    'browser': 'chrome',
+                    'platform': 'windows',
+                    'desktop': True
+                }
+            )
         else:
-            if cls._session is None:
-                cls._session = requests.Session()
-                cls._session.headers.update(cls.DEFAULT_HEADERS)
-            return cls._session
+            session = requests.Session()
+            session.headers.update(cls.DEFAULT_HEADERS)
+        # adapters are reconfigured instead of replaced, because cloudscraper
+        # mounts its own adapter
+        for adapter in session.adapters.values():
+            if isinstance(adapter, HTTPAdapter):
+                adapter.max_retries = Retry.from_int(max_retries)
+                adapter.init_poolmanager(pool_connections, pool_maxsize,
+                                         block=pool_block)
+        return session
+
+    @classmethod
+    def _create_http2_session(cls, pool_maxsize: int,
+                              max_retries: int) -> "httpx.Client":
+        """
+        Creates httpx client multiplexing requests over HTTP/2 connections.
+
+        :param pool_maxsize: Maximum of connections kept alive.
+        :param max_retries: Count of retries of failed connections.
+        :raises ImportError: When httpx isn't installed.
+        :return: New client.
+        """
+        if not HAS_HTTPX:
+            raise ImportError(
+                "HTTP/2 requires httpx: pip install 'httpx[http2]'")
+        transport = httpx.HTTPTransport(
+            http2=True, retries=max_retries,
+            limits=httpx.Limits(max_connections=pool_maxsize,
+                                max_keepalive_connections=pool_maxsize))
+        return httpx.Client(headers=cls.DEFAULT_HEADERS, transport=transport,
+                            follow_redirects=True)
 
     def _make_request(self, url: str) -> str:
         """
-        Make a request with error handling and retry.
+        Make a request with error handling and retry. When `self.transport`
+        is set, HTML is obtained from it instead.
 
         :param url: URL to make the request to.
         :return: HTML as string.
         """
-        session = self._get_session()
-        max_retries = 3
-        
-        for attempt in range(max_retries):
-            try:
-                response = session.get(url, timeout=30)
+        if self.transport is not None:
+            with self._timer("request_seconds"):
+                return self.transport.fetch(url)
+        with self._timer("request_seconds"):
+            cached, fresh = self._cache_lookup(url)
+            if fresh:
+                return cached.text # type: ignore
+            headers = ResponseCache.conditional_headers(cached)
+            session = self._get_session()
+            max_retries = 3
+
+            for attempt in range(max_retries):
+                try:
+                    if self.rate_limiter is None:
+                        response = session.get(url, headers=headers,
+                                               timeout=30)
+                    else:
+                        with self.rate_limiter:
+                            response = session.get(url, headers=headers,
+                                                   timeout=30)
+                    if cached is not None and response.status_code == 304:
+                        self._request_succeeded(url, 304, "",
+                                                response.headers)
+                        return self.cache.revalidated(cached) # type: ignore
 
-                # Check if it's a Cloudflare challenge page
-                if 'Just a moment' in response.text or response.status_code == 403:
+                    # Check if it's a Cloudflare challenge page
+                    if self._is_blocked(response.status_code, response.text):
+                        if attempt < max_retries - 1:
+                            time.sleep(self._retry_delay(
+                                attempt, response.headers, blocked=True))
+                            continue
+                        else:
+                            raise ConnectionError(
+                                f"Cloudflare protection detected. Install 'cloudscraper': pip install cloudscraper"
+                            )
+
+                    self._request_succeeded(url, response.status_code,
+                                            response.text, response.headers)
+                    return response.text
+
+                except _REQUEST_EXCEPTIONS as e:
                     if attempt < max_retries - 1:
-                        time.sleep(2 ** attempt)  # Exponential backoff
+                        time.sleep(self._retry_delay(attempt))
                         continue
-                    else:
+                    raise ConnectionError(f"Failed to fetch {url}: {e}")
+
+            return ""
+
+    async def _make_request_async(
+            self, url: str,
+            session: Optional["aiohttp.ClientSession"] = None) -> str:
+        """
+        Asynchronous counterpart of `_make_request`. Uses `self.transport`
+        when set, aiohttp when installed, otherwise the blocking request is
+        run in the event loop's default executor.
+
+        :param url: URL to make the request to.
+        :param session: aiohttp session to make the request with. When None,
+            a temporary session is created.
+        :return: HTML as string.
+        """
+        if self.transport is not None:
+            with self._timer("request_seconds"):
+                return await self.transport.fetch_async(url)
+        if not HAS_AIOHTTP:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self._make_request, url)
+        if session is None:
+            async with aiohttp.ClientSession(
+                    headers=self.DEFAULT_HEADERS) as new_session:
+                return await self._make_request_async(url, new_session)
+
+        with self._timer("request_seconds"):
+            cached, fresh = self._cache_lookup(url)
+            if fresh:
+                return cached.text # type: ignore
+            headers = ResponseCache.conditional_headers(cached)
+            max_retries = 3
+            for attempt in range(max_retries):
+                try:
+                    if self.rate_limiter is not None:
+                        await self.rate_limiter.acquire_async()
+                    try:
+                        async with session.get(
+                                url, headers=headers,
+                                timeout=aiohttp.ClientTimeout(total=30)
+                                ) as response:
+                            text = await response.text()
+                            status = response.status
+                            response_headers = response.headers
+                    finally:
+                        if self.rate_limiter is not None:
+                            self.rate_limiter.release()
+                    if cached is not None and status == 304:
+                        self._request_succeeded(url, 304, "",
+                                                response_headers)
+                        return self.cache.revalidated(cached) # type: ignore
+
+                    if self._is_blocked(status, text):
+                        if attempt < max_retries - 1:
+                            await asyncio.sleep(self._retry_delay(
+                                attempt, response_headers, blocked=True))
+                            continue
                         raise ConnectionError(
-                            f"Cloudflare protection detected. Install 'cloudscraper': pip install cloudscraper"
-                        )
-                
-                return response.text
-                
-            except requests.RequestException as e:
-                if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)
-                    continue
-                raise ConnectionError(f"Failed to fetch {url}: {e}")
-        
-        return ""
+                            f"Cloudflare protection detected: {url}")
+                    self._request_succeeded(url, status, text,
+                                            response_headers)
+                    return text
+
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    if attempt < max_retries - 1:
+                        await asyncio.sleep(self._retry_delay(attempt))
+                        continue
+                    raise ConnectionError(f"Failed to fetch {url}: {e}")
+
+            return ""
+
+    def _cache_lookup(self, url: str
+                      ) -> Tuple[Optional[CachedResponse], bool]:
+        """
+        Looks up given URL in `self.cache`.
+
+        :param url: Absolute URL.
+        :return: Tuple of cached response (None when not cached or cache is
+            disabled) and whether it can be used without revalidation.
+        """
+        if self.cache is None:
+            return None, False
+        return self.cache.lookup(url)
+
+    def _request_succeeded(self, url: str, status_code: int, text: str,
+                           headers: Any) -> None:
+        """
+        Reports successful request (including ``304 Not Modified``
+        revalidation) to `self.rate_limiter` and `self.instrumentation` if
+        they are enabled. Successful response is kept for `self.cache`, it's
+        stored by `_cache_response` only when its HTML is valid.
+
+        :param url: Absolute URL of the response.
+        :param status_code: HTTP status code of the response.
+        :param text: Response body.
+        :param headers: Response headers.
+        """
+        if self.rate_limiter is not None:
+            self.rate_limiter.succeeded()
+        if self.instrumentation is not None:
+            self.instrumentation.observe(
+                "downloaded_bytes", len(text.encode("utf-8")),
+                scraper=type(self).__name__)
+        if self.cache is not None and status_code == 200:
+            self._uncached_response = (url, text, headers)
+
+    def _cache_response(self, html_valid: Optional[bool] = None) -> None:
+        """
+        Stores response from `self.url` kept by `_request_succeeded` in
+        `self.cache` if HTML of the object is valid, so error pages (e.g.
+        'Page not found' returned with status 200) aren't cached.
+
+        :param html_valid: Result of `_html_valid` when it's already known.
+        """
+        response = self._uncached_response
+        self._uncached_response = None
+        if response is None or response[0] != self._url or \
+                self.cache is None:
+            return
+        if html_valid is None:
+            html_valid = self._html_valid()
+        if html_valid:
+            self.cache.store(*response)
+
+    def _retry_delay(self, attempt: int, headers: Any = None,
+                     blocked: bool = False) -> float:
+        """
+        Computes delay before next attempt of a failed request. When request
+        was blocked, it's reported to `self.rate_limiter`. The delay is
+        recorded by `self.instrumentation` if it's set.
+
+        :param attempt: Index of the failed attempt (starting from 0).
+        :param headers: Headers of the failed response, if any.
+        :param blocked: Whether the request was blocked.
+        :return: Delay in seconds. Jittered exponential backoff or the
+            ``Retry-After`` header value.
+        """
+        retry_after = None
+        if headers is not None:
+            retry_after = parse_retry_after(headers.get("Retry-After"))
+        if blocked and self.rate_limiter is not None:
+            # rate limiter pauses all requests for `retry_after` seconds
+            self.rate_limiter.blocked(retry_after)
+            delay = jittered_backoff(attempt)
+        else:
+            delay = max(retry_after or 0, jittered_backoff(attempt))
+        if self.instrumentation is not None:
+            self.instrumentation.observe("backoff_seconds", delay,
+                                         scraper=type(self).__name__)
+        return delay
+
+    @staticmethod
+    def _is_blocked(status_code: int, text: str) -> bool:
+        """
+        Checks whether response is a Cloudflare challenge page or a block.
+
+        :param status_code: HTTP status code of the response.
+        :param text: Response body.
+        :return: True if the request was blocked, otherwise False.
+        """
+        return 'Just a moment' in text or status_code in (403, 429)
 
     def update_html(self) -> None:
         """
         Calls request to `self.url` and updates `self.html` to HTMLParser
         object created from returned HTML.
         """
-        html_str = self._make_request(self._url)
-        self._html = HTMLParser(html_str)
+        self._html = self.fetch_html(self._url)
+        self._cache_response()
 
     def fetch_html(self, url: str) -> HTMLParser:
         """
-        Fetches HTML from given URL and returns it as HTMLParser object.
+        Fetches HTML from given URL and returns it as HTMLParser object. When
+        `self.tree_cache` is set, cached tree is returned if available.
 
         :param url: URL to fetch HTML from.
         :return: HTMLParser object created from fetched HTML.
         """
+        if self.tree_cache is not None:
+            tree = self.tree_cache.get(url)
+            if tree is not None:
+                return tree
         html_str = self._make_request(url)
-        return HTMLParser(html_str)
+        return self._parse_html(url, html_str)
+
+    async def update_html_async(
+            self, session: Optional["aiohttp.ClientSession"] = None) -> None:
+        """
+        Asynchronous version of `update_html`.
+
+        :param session: aiohttp session to make the request with. When None,
+            a temporary session is created.
+        """
+        self._html = await self.fetch_html_async(self._url, session)
+        self._cache_response()
+
+    async def fetch_html_async(
+            self, url: str,
+            session: Optional["aiohttp.ClientSession"] = None) -> HTMLParser:
+        """
+        Asynchronous version of `fetch_html`.
+
+        :param url: URL to fetch HTML from.
+        :param session: aiohttp session to make the request with. When None,
+            a temporary session is created.
+        :return: HTMLParser object created from fetched HTML.
+        """
+        if self.tree_cache is not None:
+            tree = self.tree_cache.get(url)
+            if tree is not None:
+                return tree
+        html_str = await self._make_request_async(url, session)
+        return self._parse_html(url, html_str)
+
+    def _parse_html(self, url: str, html_str: str) -> HTMLParser:
+        """
+        Parses fetched HTML and stores the tree in `self.tree_cache` if it's
+        set.
+
+        :param url: URL the HTML was fetched from.
+        :param html_str: Fetched HTML.
+        :return: HTMLParser object created from given HTML.
+        """
+        with self._timer("html_parser_seconds"):
+            if self.tree_cache is not None:
+                return self.tree_cache.put(url, html_str)
+            return HTMLParser(html_str)
+
+    @classmethod
+    async def create_async(
+            cls, url: str,
+            session: Optional["aiohttp.ClientSession"] = None,
+            semaphore: Optional[asyncio.Semaphore] = None) -> "Scraper":
+        """
+        Asynchronously creates scraper object that is ready for HTML parsing.
+        Equivalent of ``cls(url)`` that doesn't block the event loop.
+
+        Usage:
+
+        >>> stage = await Stage.create_async("race/tour-de-france/2022/stage-18")
+        >>> stage.date()
+        '2022-07-21'
+
+        :param url: URL of procyclingstats page to parse. Either absolute or
+            relative.
+        :param session: aiohttp session to make the request with. When None,
+            a temporary session is created.
+        :param semaphore: Semaphore limiting count of concurrent requests.
+        :raises ValueError: When HTML from given URL is invalid.
+        :return: Scraper object ready for parsing.
+        """
+        scraper_obj = cls._create_unfetched(url)
+        if semaphore is None:
+            await scraper_obj.update_html_async(session)
+        else:
+            async with semaphore:
+                await scraper_obj.update_html_async(session)
+        scraper_obj._prepare_fetched_html()
+        return scraper_obj
+
+    @classmethod
+    async def create_many_async(cls, urls: List[str],
+                                concurrency: Optional[int] = None,
+                                return_exceptions: bool = False
+                                ) -> List[Any]:
+        """
+        Asynchronously creates scraper objects from all given URLs while
+        making at most `concurrency` requests at once. All requests share one
+        HTTP session.
+
+        Usage:
+
+        >>> riders = await Rider.create_many_async(
+        ...     ["rider/tadej-pogacar", "rider/jonas-vingegaard-rasmussen"])
+        >>> [rider.height() for rider in riders]
+        [1.76, 1.75]
+
+        :param urls: URLs of procyclingstats pages to parse.
+        :param concurrency: Maximum of concurrent requests, defaults to
+            `ASYNC_CONCURRENCY`.
+        :param return_exceptions: Whether to return exceptions raised while
+            creating an object in place of the object instead of raising the
+            first one.
+        :return: Scraper objects in the same order as given URLs.
+        """
+        semaphore = asyncio.Semaphore(concurrency or cls.ASYNC_CONCURRENCY)
+        if HAS_AIOHTTP:
+            async with aiohttp.ClientSession(
+                    headers=cls.DEFAULT_HEADERS) as session:
+                return await asyncio.gather(
+                    *[cls.create_async(url, session, semaphore)
+                      for url in urls],
+                    return_exceptions=return_exceptions)
+        return await asyncio.gather(
+            *[cls.create_async(url, None, semaphore) for url in urls],
+            return_exceptions=return_exceptions)
     
     def parse(self,
             exceptions_to_ignore: Tuple[
             Type[Exception], ...] = (ExpectedParsingError,),
-            none_when_unavailable: bool = True) -> Dict[str, Any]:
+            none_when_unavailable: bool = True,
+            fields: Optional[Iterable[str]] = None,
+            lazy: bool = False,
+            records: bool = False) -> Dict[str, Any]:
         """
         Creates JSON like dict with parsed data by calling all parsing methods.
         Keys in dict are methods names and values parsed data
@@ -190,17 +747,30 @@ class Scraper:
         :param none_when_unavailable: Whether to set dict value to None when
             method raises ignored exception. When False the key value pair is
             skipped. Defaults to True.
+        :param fields: Names of parsing methods to call, all parsing methods
+            are called when None. Defaults to None.
+        :param lazy: Whether to return `LazyParsedData`, which calls parsing
+            methods only when their values are accessed. Defaults to False.
+        :param records: Whether to convert tables to lists of row objects
+            (``NamedTuple`` per table kind, e.g. ``ResultRow`` or
+            ``RankingRow``), which take less memory than dicts, see
+            `records.as_records`. Rows can be converted back to dicts by
+            their ``as_dict`` method. Defaults to False.
+        :raises ValueError: When one of fields isn't a parsing method.
         :return: Dict with parsing methods mapping to parsed data.
         """
-        parsing_methods = self._parsing_methods()
-        parsed_data = {}
-        for method_name, method in parsing_methods:
-            try:
-                parsed_data[method_name] = method()
-            except exceptions_to_ignore:
-                if none_when_unavailable:
-                    parsed_data[method_name] = None
-        return parsed_data
+        method_names = self._parsing_method_names()
+        if fields is not None:
+            fields = tuple(fields)
+            for field in fields:
+                if field not in method_names:
+                    raise ValueError(f"Invalid field argument: '{field}'")
+            method_names = fields
+        parsed_data = LazyParsedData(self, method_names, exceptions_to_ignore,
+                                     none_when_unavailable, records)
+        if lazy:
+            return parsed_data # type: ignore
+        return dict(parsed_data)
 
     def _decompose_url(self) -> List[str]:
         """
@@ -218,13 +788,27 @@ class Scraper:
 
         :return: List of tuples parsing methods names and parsing methods.
         """
-        methods = inspect.getmembers(self, predicate=inspect.ismethod)
-        parsing_methods = []
-        for method_name, method in methods:
-            if (method_name[0] != "_"
-                and method_name not in self._public_nonparsing_methods):
-                parsing_methods.append((method_name, method))
-        return parsing_methods
+        return [(method_name, getattr(self, method_name))
+                for method_name in self._parsing_method_names()]
+
+    @classmethod
+    def _parsing_method_names(cls) -> Tuple[str, ...]:
+        """
+        Gets names of all parsing methods of the class, see
+        `_parsing_methods`. Names are found only once per class and then
+        stored in `_parsing_methods_registry`.
+
+        :return: Sorted names of parsing methods.
+        """
+        method_names = Scraper._parsing_methods_registry.get(cls)
+        if method_names is None:
+            method_names = tuple(
+                name for name in dir(cls)
+                if name[0] != "_"
+                and name not in cls._public_nonparsing_methods
+                and inspect.isfunction(inspect.getattr_static(cls, name)))
+            Scraper._parsing_methods_registry[cls] = method_names
+        return method_names
 
     def _make_url_absolute(self, url: str) -> str:
         """
@@ -241,12 +825,253 @@ class Scraper:
                 url = self.BASE_URL + url
         return url
 
+    @classmethod
+    def fetch_many(cls, urls: List[str], max_workers: Optional[int] = None
+                   ) -> Iterator[Union["Scraper", Exception]]:
+        """
+        Creates scraper objects from all given URLs in a thread pool. All
+        requests share one session. When called on `Scraper` class itself,
+        scraping class is chosen for every URL separately, otherwise objects
+        of the class that the method was called on are created.
+
+        Usage:
+
+        >>> for rider in Rider.fetch_many(["rider/tadej-pogacar",
+        ...                                "rider/fake-rider"]):
+        ...     print(rider)
+        Rider(url='https://www.procyclingstats.com/rider/tadej-pogacar')
+        HTML from given URL is invalid: '.../rider/fake-rider'
+
+        :param urls: URLs of procyclingstats pages to parse.
+        :param max_workers: Count of threads making requests, defaults to
+            `MAX_WORKERS`. At most `max_workers` requests are made ahead of
+            the consumer, so stopping the iteration stops making requests.
+        :return: Generator yielding scraper objects ready for parsing in the
+            same order as given URLs. When creation of an object failed (e.g.
+            scraping class for the URL wasn't found or HTML is invalid), the
+            raised exception is yielded in its place.
+        """
+        def create(url: str) -> "Scraper":
+            return cls._scraping_class_for(url)._create_fetched(url)
+
+        max_workers = max_workers or cls.MAX_WORKERS
+        executor = ThreadPoolExecutor(max_workers)
+        pending: Deque["Future[Scraper]"] = deque()
+        urls_iter = iter(urls)
+
+        def submit_next() -> None:
+            for url in urls_iter:
+                pending.append(executor.submit(create, url))
+                return
+
+        try:
+            for _ in range(max_workers):
+                submit_next()
+            while pending:
+                future = pending.popleft()
+                submit_next()
+                try:
+                    yield future.result()
+                except Exception as e: # pylint: disable=broad-except
+                    yield e
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @classmethod
+    def _iter_fetched(cls, pages: Iterable[Union[str, "Scraper"]],
+                      concurrency: Optional[int] = None
+                      ) -> Iterator["Scraper"]:
+        """
+        Creates scraper objects from given URLs in a thread pool while
+        keeping at most `concurrency` requests in flight. Unlike `fetch_many`
+        URLs are taken from `pages` only when there is a free slot, so
+        stopping the iteration stops making requests.
+
+        :param pages: URLs of pages to fetch. Scraper objects that are already
+            fetched can be passed instead of URLs too.
+        :param concurrency: Maximum count of pages fetched at once, defaults
+            to `MAX_WORKERS`.
+        :raises Exception: Exception raised while creating an object, when
+            the object is reached.
+        :return: Generator yielding scraper objects in the same order as
+            given pages.
+        """
+        concurrency = concurrency or cls.MAX_WORKERS
+        executor = ThreadPoolExecutor(concurrency)
+        pending: Deque[Union["Future[Scraper]", "Scraper"]] = deque()
+        pages_iter = iter(pages)
+
+        def submit_next() -> None:
+            for page in pages_iter:
+                pending.append(executor.submit(cls._create_fetched, page)
+                               if isinstance(page, str) else page)
+                return
+
+        try:
+            for _ in range(concurrency):
+                submit_next()
+            while pending:
+                page = pending.popleft()
+                submit_next()
+                yield page.result() if isinstance(page, Future) else page
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @classmethod
+    def _scraping_class_for(cls, url: str) -> Type["Scraper"]:
+        """
+        Gets scraping class that should be used for given URL. Subclasses
+        always return themselves.
+
+        :param url: URL of procyclingstats page. Either absolute or relative.
+        :raises ValueError: When scraping class for given URL wasn't found.
+        :return: Scraping class.
+        """
+        if cls is not Scraper:
+            return cls
+        # imported here, because the dispatch module imports all subclasses
+        from .dispatch import \
+            get_corresponding_scraping_class # pylint: disable=import-outside-toplevel
+        if "https" in url:
+            url = "/".join(url.split("/")[3:])
+        scraper_class = get_corresponding_scraping_class(url.lstrip("/"))
+        if scraper_class is None:
+            raise ValueError(f"No scraping class found for URL: '{url}'")
+        return scraper_class
+
+    @classmethod
+    def _create_fetched(cls, url: str) -> "Scraper":
+        """
+        Creates scraper object from given URL that is ready for HTML parsing.
+
+        :param url: URL of procyclingstats page to parse.
+        :raises ValueError: When HTML from given URL is invalid.
+        :return: Scraper object ready for parsing.
+        """
+        scraper_obj = cls._create_unfetched(url)
+        scraper_obj.update_html()
+        scraper_obj._prepare_fetched_html()
+        return scraper_obj
+
+    @classmethod
+    def _create_unfetched(cls, url: str) -> "Scraper":
+        """
+        Creates scraper object from given URL without making a request. Should
+        be overridden by subclasses with different constructor signature.
+
+        :param url: URL of procyclingstats page to parse.
+        :return: Scraper object which HTML has to be updated before parsing.
+        """
+        return cls(url, update_html=False)
+
+    def _prepare_fetched_html(self) -> None:
+        """
+        Validates HTML obtained from `self.url` and sets it up for parsing.
+
+        :raises ValueError: When HTML from `self.url` is invalid.
+        """
+        with self._timer("html_valid_seconds"):
+            html_valid = self._html_valid()
+        self._cache_response(html_valid)
+        if not html_valid:
+            raise ValueError(
+                f"HTML from given URL is invalid: '{self.url}'")
+        self._set_up_html()
+
     def _set_up_html(self):
         """
         Empty method that should be overridden by subclasses if it's needed to
         modify HTML before parsing.
         """
 
+    def _timer(self, name: str, **labels: str) -> ContextManager[None]:
+        """
+        Times block of code by `self.instrumentation` if it's set. Class name
+        of the object is added to labels as ``scraper``.
+
+        :param name: Metric name, see `Instrumentation`.
+        :param labels: Labels of the value.
+        :return: Context manager timing its block.
+        """
+        if self.instrumentation is None:
+            return contextlib.nullcontext()
+        return self.instrumentation.timer(
+            name, scraper=type(self).__name__, **labels)
+
+    def _memoized(self, key: Hashable, func: Callable[[], T]) -> T:
+        """
+        Gets value memoized under given key, calls `func` to get the value
+        when it isn't memoized yet. Memoized values are dropped whenever
+        `self.html` is replaced (e.g. by `self.update_html`).
+
+        :param key: Key of the value.
+        :param func: Function that returns the value.
+        :return: Memoized value.
+        """
+        if self._memo_html is not self._html:
+            self._memo = {}
+            self._memo_html = self._html
+        if key not in self._memo:
+            self._memo[key] = func()
+        return self._memo[key]
+
+    def _filter_form(self) -> Node:
+        """
+        Finds the form with filters (select menus) of the page, e.g. with
+        pages or seasons.
+
+        :raises ExpectedParsingError: When the form isn't in page HTML.
+        :return: HTML of the form.
+        """
+        node = self.html.css_first("form select")
+        while node is not None and node.tag != "form":
+            node = node.parent
+        if node is None:
+            raise ExpectedParsingError("Filters form not in page HTML.")
+        return node
+
+    def _selected_value(self, select_name: str) -> Optional[str]:
+        """
+        Gets currently selected value of a filter select menu.
+
+        :param select_name: Name attribute of the select menu.
+        :return: Selected value, the first option's value when none is
+            selected, None when select menu isn't in page HTML.
+        """
+        select = self.html.css_first(f"select[name={select_name}]")
+        if not select:
+            return None
+        option = select.css_first("option[selected]") or \
+            select.css_first("option")
+        if not option:
+            return None
+        return option.attributes.get("value") or ""
+
+    def _filter_url(self, **filters: Optional[str]) -> str:
+        """
+        Makes URL of the page with the same filters as the object's page
+        except of given ones, e.g. ``offset``.
+
+        :param filters: Filters (select menus names) mapped to their values,
+            filters with None value aren't changed.
+        :raises ExpectedParsingError: When the page doesn't have filters.
+        :return: Relative URL of the page.
+        """
+        filter_form = self._filter_form()
+        params = {}
+        for input_e in filter_form.css("input[name]"):
+            if input_e.attributes.get("type") == "hidden":
+                params[input_e.attributes["name"]] = \
+                    input_e.attributes.get("value") or ""
+        for select in filter_form.css("select[name]"):
+            name = select.attributes["name"]
+            params[name] = self._selected_value(name) or "" # type: ignore
+        for name, value in filters.items():
+            if value is not None:
+                params[name] = value
+        path = self.relative_url().split("?")[0]
+        return f"{path}?{urlencode(params)}"
+
     def _html_valid(self) -> bool:
         """
         Checks whether given HTML is valid based on some known invalid formats
@@ -7,7 +7,7 @@ from .errors import ExpectedParsingError
 from .scraper import Scraper
 from .table_parser import TableParser
 from .utils import (add_times, convert_date, format_time, join_tables,
-                    parse_table_fields_args)
+                    parse_table_fields_args, time_to_seconds)
 
 
 class Stage(Scraper):
@@ -56,7 +56,9 @@ class Stage(Scraper):
         """
         # If there are elements with .restabs class (Stage/GC... menu), the race
         # is a stage race
-        return len(self.html.css(".restabs")) == 0 and len(self.html.css(".resultTabs")) == 0
+        return self._memoized("is_one_day_race", lambda: (
+            not self.html.css_first(".restabs") and
+            not self.html.css_first(".resultTabs")))
 
     def distance(self) -> float:
         """
@@ -83,6 +85,15 @@ class Stage(Scraper):
 
         :return: Stage type, e.g. ``ITT``.
         """
+        return self._memoized("stage_type", self._parse_stage_type)
+
+    def _parse_stage_type(self) -> Literal["ITT", "TTT", "RR"]:
+        """
+        Parses stage type from HTML, see `self.stage_type`.
+
+        :raises ExpectedParsingError: When page title isn't in the HTML.
+        :return: Stage type.
+        """
         page_title = self.html.css_first(".page-title")
         if not page_title:
             raise ExpectedParsingError("Page title not found")
@@ -311,7 +322,7 @@ class Stage(Scraper):
             if not table:
                 continue
 
-            table_parser = TableParser(table)
+            table_parser = TableParser(table, self.instrumentation)
             rider_fields = [
                 "rider_name",
                 "rider_url",
@@ -372,6 +383,8 @@ class Stage(Scraper):
             - age: Rider's age.
             - nationality: Rider's nationality as 2 chars long country code.
             - time: Rider's time in the stage.
+            - time_seconds: Rider's time in the stage in seconds.
+                Opt-in field: only returned when explicitly requested.
             - bonus: Bonus seconds in `H:MM:SS` time format.
             - pcs_points:
             - uci_points:
@@ -405,7 +418,7 @@ class Stage(Scraper):
             gc_table_html = self._table_html("gc")
             if (not self.is_one_day_race() and gc_table_html and
                 ("nationality" in fields or "age" in fields or "rider_number" in fields)):
-                table_parser = TableParser(gc_table_html)
+                table_parser = TableParser(gc_table_html, self.instrumentation)
                 extra_fields = [f for f in fields
                                 if f in ("nationality", "age", "rider_number", "rider_url")]
                 # add rider_url for table joining purposes
@@ -448,7 +461,8 @@ class Stage(Scraper):
                 if len(columns) <= 2 and columns[0].text() == "" or \
                         "relegated from" in columns[0].text():
                     row.remove()
-            table_parser = TableParser(results_table_html)
+            table_parser = TableParser(
+                results_table_html, self.instrumentation)
             table_parser.parse(fields)
             table = table_parser.table
         return table
@@ -474,6 +488,8 @@ class Stage(Scraper):
             - age: Rider's age.
             - nationality: Rider's nationality as 2 chars long country code.
             - time: Rider's GC time after the stage.
+            - time_seconds: Rider's GC time after the stage in seconds.
+                Opt-in field: only returned when explicitly requested.
             - bonus: Bonus seconds that the rider gained throughout the race.
             - pcs_points:
             - uci_points:
@@ -501,7 +517,7 @@ class Stage(Scraper):
         gc_table_html = self._table_html("gc")
         if not gc_table_html:
             return []
-        table_parser = TableParser(gc_table_html)
+        table_parser = TableParser(gc_table_html, self.instrumentation)
         table_parser.parse(fields)
         return table_parser.table
 
@@ -550,7 +566,7 @@ class Stage(Scraper):
         points_table_html = self._table_html("points")
         if not points_table_html:
             return []
-        table_parser = TableParser(points_table_html)
+        table_parser = TableParser(points_table_html, self.instrumentation)
         table_parser.parse(fields)
         return table_parser.table
 
@@ -599,7 +615,7 @@ class Stage(Scraper):
         kom_table_html = self._table_html("kom")
         if not kom_table_html:
             return []
-        table_parser = TableParser(kom_table_html)
+        table_parser = TableParser(kom_table_html, self.instrumentation)
         table_parser.parse(fields)
         return table_parser.table
 
@@ -621,6 +637,8 @@ class Stage(Scraper):
                 Opt-in field: only returned when explicitly requested.
             - prev_rank: Rider's youth classif. rank before the stage.
             - time: Rider's GC time after the stage.
+            - time_seconds: Rider's GC time after the stage in seconds.
+                Opt-in field: only returned when explicitly requested.
             - age: Rider's age.
             - nationality: Rider's nationality as 2 chars long country code.
             - pcs_points:
@@ -647,7 +665,7 @@ class Stage(Scraper):
         youth_table_html = self._table_html("youth")
         if not youth_table_html:
             return []
-        table_parser = TableParser(youth_table_html)
+        table_parser = TableParser(youth_table_html, self.instrumentation)
         table_parser.parse(fields)
         return table_parser.table
 
@@ -666,6 +684,8 @@ class Stage(Scraper):
                 Opt-in field: only returned when explicitly requested.
             - prev_rank: Team's classif. rank before the stage.
             - time: Team's total GC time after the stage.
+            - time_seconds: Team's total GC time after the stage in seconds.
+                Opt-in field: only returned when explicitly requested.
             - nationality: Team's nationality as 2 chars long country code.
 
         :raises ValueError: When one of args is of invalid value.
@@ -683,7 +703,7 @@ class Stage(Scraper):
         teams_table_html = self._table_html("teams")
         if not teams_table_html:
             return []
-        table_parser = TableParser(teams_table_html)
+        table_parser = TableParser(teams_table_html, self.instrumentation)
         table_parser.parse(fields)
         return table_parser.table
 
@@ -695,17 +715,30 @@ class Stage(Scraper):
         :return: Value of given label. Empty string when label is not in
             infolist.
         """
-        stage_info = self._find_header_list("Race information")
-        for row in stage_info.css("li"):
-            row_text = row.text(separator="\n").split("\n")
-            row_text = [x for x in row_text if x != " "]
-            if label in row_text[0]:
-                if len(row_text) > 1:
-                    return row_text[1]
-                else:
-                    return ""
+        for row_label, value in self._stage_info().items():
+            if label in row_label:
+                return value
         return ""
 
+    def _stage_info(self) -> Dict[str, str]:
+        """
+        Parses infolist with race information once per HTML.
+
+        :return: Infolist labels mapped to their values in infolist order.
+        """
+        def parse_stage_info() -> Dict[str, str]:
+            stage_info = {}
+            stage_info_html = self._find_header_list("Race information")
+            if not stage_info_html:
+                return stage_info
+            for row in stage_info_html.css("li"):
+                row_text = row.text(separator="\n").split("\n")
+                row_text = [x for x in row_text if x != " "]
+                stage_info.setdefault(
+                    row_text[0], row_text[1] if len(row_text) > 1 else "")
+            return stage_info
+        return self._memoized("stage_info", parse_stage_info)
+
     def _table_html(self, table: Literal[
             "stage",
             "gc",
@@ -716,6 +749,16 @@ class Stage(Scraper):
         """
         Get HTML of a .resTab table with results based on `table` param.
 
+        :param table: Keyword of wanted table that occurs in result tabs.
+        :return: HTML of wanted HTML table, None when not found.
+        """
+        return self._memoized(("table_html", table),
+                              lambda: self._find_table_html(table))
+
+    def _find_table_html(self, table: str) -> Optional[Node]:
+        """
+        Finds HTML of a .resTab table with results, see `self._table_html`.
+
         :param table: Keyword of wanted table that occurs in result tabs.
         :return: HTML of wanted HTML table, None when not found.
         """
@@ -729,27 +772,13 @@ class Stage(Scraper):
             "teams": ["TEAMS", "teams"]
         }
         
-        # Look for tabs in the results section
-        tab_nav = self.html.css("ul.tabs.tabnav.resultTabs li")
-        if not tab_nav:
-            # Fallback to old tab structure
-            tab_nav = self.html.css("ul.restabs li")
-        
-        for tab_element in tab_nav:
-            tab_link = tab_element.css_first("a")
-            if not tab_link:
-                continue
-                
-            tab_text = tab_link.text().upper()
-            tab_keywords = tab_mapping.get(table, [])
-            
+        tab_keywords = tab_mapping.get(table, [])
+        for tab_text, data_id in self._result_tabs():
             # Check if this tab matches what we're looking for
             if any(keyword.upper() in tab_text for keyword in tab_keywords):
-                # Get the data-id from the tab link
-                data_id = tab_link.attributes.get("data-id")
+                # Find result div corresponding to the tab's data-id
                 if data_id:
-                    # Find corresponding result div
-                    result_div = self.html.css_first(f'div.resTab[data-id="{data_id}"]')
+                    result_div = self._result_divs().get(data_id)
                     if result_div:
                         return result_div.css_first("table.results")
         
@@ -767,6 +796,42 @@ class Stage(Scraper):
             
         return None
 
+    def _result_tabs(self) -> List[Tuple[str, Optional[str]]]:
+        """
+        Parses result tabs navigation once per HTML.
+
+        :return: List of tuples of uppercased tab text and tab's data-id.
+        """
+        def parse_result_tabs() -> List[Tuple[str, Optional[str]]]:
+            # Look for tabs in the results section
+            tab_nav = self.html.css("ul.tabs.tabnav.resultTabs li")
+            if not tab_nav:
+                # Fallback to old tab structure
+                tab_nav = self.html.css("ul.restabs li")
+            tabs = []
+            for tab_element in tab_nav:
+                tab_link = tab_element.css_first("a")
+                if tab_link:
+                    tabs.append((tab_link.text().upper(),
+                                 tab_link.attributes.get("data-id")))
+            return tabs
+        return self._memoized("result_tabs", parse_result_tabs)
+
+    def _result_divs(self) -> Dict[str, Node]:
+        """
+        Finds .resTab divs once per HTML.
+
+        :return: The first .resTab div with given data-id mapped by data-id.
+        """
+        def find_result_divs() -> Dict[str, Node]:
+            result_divs: Dict[str, Node] = {}
+            for result_div in self.html.css("div.resTab[data-id]"):
+                data_id = result_div.attributes.get("data-id")
+                if data_id is not None:
+                    result_divs.setdefault(data_id, result_div)
+            return result_divs
+        return self._memoized("result_divs", find_result_divs)
+
     @staticmethod
     def _ttt_results(results_table_html: Node,
                      fields: List[str]) -> List[Dict[str, Any]]:
@@ -805,6 +870,8 @@ class Stage(Scraper):
                     table[-1]["team_url"] = team_url
                 if "time" in fields:
                     table[-1]["time"] = time
+                if "time_seconds" in fields:
+                    table[-1]["time_seconds"] = time_to_seconds(time)
                 if "bonus" in fields:
                     table[-1]["bonus"] = "0:00:00"
                 if "status" in fields:
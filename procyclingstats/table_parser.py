@@ -1,9 +1,40 @@
-from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Union, Set
+import contextlib
+from typing import (Any, Callable, ContextManager, Dict, List, Literal,
+                    Optional, Set, Tuple, Union)
 
 from selectolax.parser import Node
 
+from .columns import Columns, typed_column
 from .errors import ExpectedParsingError, UnexpectedParsingError
-from .utils import add_times, format_time
+from .instrumentation import Instrumentation
+from .utils import format_time, seconds_to_time, time_to_seconds
+
+_REQUIRED = object()
+"""Marks header field that can't be parsed without its column."""
+
+
+class _RowContext:
+    """
+    Table row used by the ``rows`` engine of `TableParser.parse`.
+
+    :param row: HTML of the table row.
+    """
+    __slots__ = ("row", "elements", "links", "_cells")
+
+    def __init__(self, row: Node) -> None:
+        self.row = row
+        self.elements: Dict[str, Node] = {}
+        """First row element matching a selector mapped by the selector."""
+        self.links: Dict[str, List[Tuple[str, str]]] = {}
+        """Tuples of href and text of row links mapped by kind of the link."""
+        self._cells: Optional[List[Node]] = None
+
+    @property
+    def cells(self) -> List[Node]:
+        """Child elements of the row, same as `nth-child` selector counts."""
+        if self._cells is None:
+            self._cells = list(self.row.iter())
+        return self._cells
 
 
 class TableParser:
@@ -12,6 +43,9 @@ class TableParser:
     represented as list of dicts.
 
     :param html_table: HTML table to be parsed from.
+    :param instrumentation: Instrumentation timing parsing of fields, usually
+        `instrumentation` of the scraper that makes the parser. Fields aren't
+        timed when None. Defaults to None.
     """
 
     table_row_dict: Dict[str, str] = {
@@ -25,8 +59,31 @@ class TableParser:
         "li": "div"
     }
     """Finds out what is the table row column tag."""
+    default_engine: Literal["columns", "rows"] = "columns"
+    """Engine used by `parse` when no engine is given. See `parse`."""
+    column_aliases: Dict[str, Tuple[str, ...]] = {
+        "rank": ("Rnk", "pos", "Result", "#"),
+        "pcs_points": ("Pnt", "PCS points"),
+        "points": ("Points", "Pnt", "PCS points"),
+    }
+    """
+    Groups of column names that mean the same column in different tables.
+    The first found column of a group is also available in `header_index`
+    under the group name.
+    """
+    link_kinds: Dict[str, str] = {
+        "rider": "rider",
+        "team": "team",
+        "race": "race",
+        "national-race": "race",
+        "nation": "nation",
+        "location": "location",
+    }
+    """Href path segments mapped to kinds of links they mark."""
 
-    def __init__(self, html_table: Node) -> None:
+    def __init__(self, html_table: Node,
+                 instrumentation: Optional[Instrumentation] = None) -> None:
+        self.instrumentation = instrumentation
         self.table = []
         table_body = html_table.css_first("tbody")
         if table_body:
@@ -39,20 +96,48 @@ class TableParser:
         self.table_row_tag = self.table_row_dict[self.html_table.tag]
         self.row_column_tag = self.row_column_tag_dict[self.table_row_tag]
 
+        self.header_index: Dict[str, int] = {}
+        """
+        Lowercased table header texts and names of `column_aliases` groups
+        mapped to column indexes. Empty when table doesn't have a header.
+        """
+        self._header_texts: List[Tuple[str, int]] = []
+        self._column_index_cache: Dict[str, Optional[int]] = {}
+        if self.header is not None:
+            for i, column_name_e in enumerate(self.header.css("th")):
+                header_text = column_name_e.text().lower().strip()
+                self._header_texts.append((header_text, i))
+                self.header_index.setdefault(header_text, i)
+            for group, column_names in self.column_aliases.items():
+                for column_name in column_names:
+                    index = self.column_index(column_name)
+                    if index is not None:
+                        self.header_index.setdefault(group, index)
+                        break
+
         self.a_elements = self.html_table.css("a")
-        self.table_length = len(self.html_table.css(self.table_row_tag))
+        self._rows = self.html_table.css(self.table_row_tag)
+        self.table_length = len(self._rows)
+        self._link_index: Optional[Dict[
+            str, List[Tuple[Optional[int], str, str]]]] = None
         self.row_length = len(self.html_table.css(
             f"{self.table_row_tag}:first-child > {self.row_column_tag}"))
 
-    def parse(self, fields: Union[List[str], Tuple[str, ...]]) -> None:
+    def parse(self, fields: Union[List[str], Tuple[str, ...]],
+              engine: Optional[Literal["columns", "rows"]] = None) -> None:
         """
         Parses HTML table to `self.table` (list of dicts) by calling given
         table parsing methods. Every parsed table row is dictionary with
         `fields` keys.
 
         :param fields: Table parsing methods of this class.
+        :param engine: Either ``columns`` or ``rows``, defaults to
+        `self.default_engine`. The ``columns`` engine parses every field from
+        the whole table separately and zips parsed columns to rows. The
+        ``rows`` engine walks every table row only once and parses all fields
+        from it, so values are always parsed from the row they belong to.
         :raises UnexpectedParsingError: When parsed field values aren't the
-        same size as table length.
+        same size as table length (only with ``columns`` engine).
 
         :regular fields options:
             - rider_url
@@ -66,6 +151,8 @@ class TableParser:
             - age
             - nationality
             - time
+            - time_seconds: Same as time, but as count of seconds (float when
+                time has fraction of a second).
             - bonus
             - profile_icon
             - season
@@ -86,8 +173,29 @@ class TableParser:
             - distance
             - date
         """
+        seconds_field, parsed_fields = self._fields_to_parse(fields)
+        self._parse_fields(parsed_fields, engine)
+        if "time" in parsed_fields and self.table:
+            self._make_times_absolute(seconds_field=seconds_field)
+        if seconds_field and "time" not in fields:
+            for row in self.table:
+                row.pop("time", None)
+
+    def _parse_fields(self, fields: Union[List[str], Tuple[str, ...]],
+                      engine: Optional[Literal["columns", "rows"]]) -> None:
+        """
+        Parses given fields to `self.table` with given engine, see
+        `self.parse`.
+
+        :param fields: Table parsing methods of this class.
+        :param engine: Either ``columns`` or ``rows``.
+        """
+        if (engine or self.default_engine) == "rows":
+            self.table.extend(self._parse_rows(fields))
+            return
+
         raw_table = []
-        for row_element in self.html_table.css(f"{self.table_row_tag}"):
+        for row_element in self._rows:
             # Handle rows with missing or malformed data
             if "colspan" in row_element.attributes and "relegated" in row_element.text().lower():
                 print(f"Skipping relegated rider row: {row_element.text()}")
@@ -95,28 +203,96 @@ class TableParser:
                 continue
             raw_table.append({})
 
+        for field, parsed_field_list in self._parse_columns(fields).items():
+            for row, parsed_value in zip(raw_table, parsed_field_list):
+                row[field] = parsed_value
+
+        self.table.extend(raw_table)
+
+    def to_columns(self, fields: Union[List[str], Tuple[str, ...]],
+                   engine: Optional[Literal["columns", "rows"]] = None,
+                   typed: bool = True) -> Columns:
+        """
+        Parses HTML table to columns instead of rows. With the ``columns``
+        engine parsed fields aren't scattered to row dicts at all. Times are
+        made absolute the same way as by `self.parse`. `self.table` isn't
+        changed.
+
+        :param fields: Table parsing methods of this class, same as
+        `self.parse` fields.
+        :param engine: Either ``columns`` or ``rows``, defaults to
+        `self.default_engine`. See `self.parse`.
+        :param typed: Whether to convert numeric columns (e.g. ``rank``,
+        ``uci_points`` or ``time_seconds``) to typed arrays, see
+        `columns.typed_column`. Defaults to True.
+        :raises UnexpectedParsingError: When parsed field values aren't the
+        same size as table length (only with ``columns`` engine).
+        :return: Fields mapped to columns in order of `fields`.
+        """
+        seconds_field, parsed_fields = self._fields_to_parse(fields)
+        if (engine or self.default_engine) == "rows":
+            rows = self._parse_rows(parsed_fields)
+            columns: Columns = {field: [row[field] for row in rows]
+                                for field in parsed_fields}
+        else:
+            columns = self._parse_columns(parsed_fields)
+        if "time" in columns:
+            seconds: List[Optional[Union[int, float]]] = []
+            if columns["time"]:
+                columns["time"], seconds = self._absolute_times(
+                    columns["time"])
+            if seconds_field:
+                columns[seconds_field] = seconds
+        columns = {field: columns[field] for field in fields}
+        if typed:
+            return {field: typed_column(values)
+                    for field, values in columns.items()}
+        return columns
+
+    @staticmethod
+    def _fields_to_parse(fields: Union[List[str], Tuple[str, ...]]
+                         ) -> Tuple[Optional[str], List[str]]:
+        """
+        :param fields: Fields given to `self.parse`.
+        :return: Tuple of ``time_seconds`` (None when it isn't in fields) and
+        fields that have to be parsed. ``time_seconds`` field is derived from
+        parsed times, so ``time`` is parsed instead of it.
+        """
+        seconds_field = "time_seconds" if "time_seconds" in fields else None
+        parsed_fields = [field for field in fields if field != "time_seconds"]
+        if seconds_field and "time" not in parsed_fields:
+            parsed_fields.append("time")
+        return seconds_field, parsed_fields
+
+    def _parse_columns(self, fields: Union[List[str], Tuple[str, ...]]
+                       ) -> Dict[str, List[Any]]:
+        """
+        Parses every field from the whole table (``columns`` engine of
+        `self.parse`).
+
+        :param fields: Table parsing methods of this class.
+        :raises UnexpectedParsingError: When parsed field values are longer
+        than table length.
+        :return: Fields mapped to parsed columns of table length.
+        """
+        columns = {}
         for field in fields:
-            if field != "class":
-                parsed_field_list = getattr(self, field)()
-            # special case when field is called class
-            else:
-                parsed_field_list = getattr(self, "class_")()
+            with self._timer(field, "columns"):
+                if field != "class":
+                    parsed_field_list = getattr(self, field)()
+                # special case when field is called class
+                else:
+                    parsed_field_list = getattr(self, "class_")()
 
             # Ensure parsed field list matches the number of rows
-            while len(parsed_field_list) < len(raw_table):
+            while len(parsed_field_list) < self.table_length:
                 parsed_field_list.append(None)
 
-            if len(parsed_field_list) != len(raw_table):
+            if len(parsed_field_list) != self.table_length:
                 message = f"Field '{field}' wasn't parsed correctly"
                 raise UnexpectedParsingError(message)
-
-            for row, parsed_value in zip(raw_table, parsed_field_list):
-                row[field] = parsed_value
-
-        self.table.extend(raw_table)
-
-        if "time" in fields and self.table:
-            self._make_times_absolute()
+            columns[field] = parsed_field_list
+        return columns
 
     def extend_table(self, field_name: str, values: List[Any]):
         """
@@ -174,43 +350,52 @@ class TableParser:
             values.append(func(text))
         return values
 
+    @property
+    def link_index(self) -> Dict[str, List[Tuple[Optional[int], str, str]]]:
+        """
+        Table links classified by `link_kinds` of their href path segments.
+        Every kind is mapped to list of tuples of row index (None when link
+        isn't in any row), href and text of its links in document order.
+        The index is built on first use by a single pass over table links,
+        links without href are skipped.
+        """
+        if self._link_index is None:
+            self._link_index = self._build_link_index()
+        return self._link_index
+
     def rider_url(self) -> List[str]:
-        return self._filter_a_elements("rider", True)
+        return self._link_column("rider_url")
 
     def rider_name(self) -> List[str]:
-        return self._filter_a_elements("rider", False)
+        return self._link_column("rider_name")
 
     def team_url(self) -> List[str]:
         try:
             return self.parse_extra_column("Team", str, get_href=True)
         except Exception:
-            return self._filter_a_elements("team", True,
-                lambda x: True if x.text() != "view" else False)
+            return self._filter_links("team", True, self._team_link_validator)
 
     def team_name(self) -> List[str]:
         try:
             return self.parse_extra_column("Team", str, get_href=False)
         except Exception:
-            return self._filter_a_elements("team", False,
-                lambda x: True if x.text() != "view" else False)
+            return self._filter_links("team", False,
+                                      self._team_link_validator)
 
     def stage_url(self) -> List[str]:
-        return self._filter_a_elements("race", True, extras = {"national-race"})
+        return self._link_column("stage_url")
 
     def stage_name(self) -> List[str]:
-        return self._filter_a_elements("race", False, extras = {"national-race"})
+        return self._link_column("stage_name")
 
     def nation_url(self) -> List[str]:
-        nations_urls = self._filter_a_elements("nation", True)
         # return only urls to nation overview, not `pcs-season-wins`
-        return [url for url in nations_urls if "pcs" not in url]
+        return self._link_column("nation_url")
 
     def nation_name(self) -> List[str]:
-        nations_texts = self._filter_a_elements("nation", False)
         # return text only when is not numeric, so doesn't represent number of
         # wins of the nation
-        return [text for text in nations_texts
-                if not text.isnumeric() and text != "-"]
+        return self._link_column("nation_name")
 
     def climb_url(self) -> List[str]:
         """
@@ -219,7 +404,7 @@ class TableParser:
 
         :return: List of all climb URLs from table.
         """
-        return self._filter_a_elements("location", True)
+        return self._link_column("climb_url")
 
     def climb_name(self) -> List[str]:
         """
@@ -228,7 +413,7 @@ class TableParser:
 
         :return: List of all climb names from table.
         """
-        return self._filter_a_elements("location", False)
+        return self._link_column("climb_name")
 
     def breakaway_kms(self) -> List[float]:
         """
@@ -236,53 +421,21 @@ class TableParser:
 
         :return: List breakaway kilometers.
         """
-        kms = []
-        for element in self.html_table.css(".ridername"):
-            res = 0
-            try:
-                title = element.css_first("div[title~=peloton").attrs['title']
-                for i in range(1, len(title) + 1):
-                    try:
-                        float(title[:i])
-                        res = float(title[:i])
-                    except ValueError:
-                        break
-            except AttributeError:
-              pass
-            kms.append(res)
-        return kms
+        return [self._breakaway_kms_value(element)
+                for element in self.html_table.css(".ridername")]
 
     def age(self) -> List[Optional[int]]:
         ages_elements = self.html_table.css(".age")
-        return [int(age_e.text()) if age_e.text() else None
-            for age_e in ages_elements]
+        return [self._age_value(age_e) for age_e in ages_elements]
 
     def nationality(self) -> List[str]:
         flags_elements = self.html_table.css(".flag")
-        flags = []
-        for flag_e in flags_elements:
-            if (flag_e.attributes['class'] and
-                    " " in flag_e.attributes['class']):
-                flags.append(flag_e.attributes['class'].split(" ")[1].upper())
-        return flags
+        flags = [self._nationality_value(flag_e) for flag_e in flags_elements]
+        return [flag for flag in flags if flag is not None]
 
     def time(self) -> List[Optional[str]]:
         times_elements = self.html_table.css(".time")
-        times = []
-        for i, time_e in enumerate(times_elements):
-            time_e_text = time_e.text(separator="\n").strip()
-            if not time_e_text or time_e_text == "-":
-                times.append(None)  # Handle empty or invalid times as None
-                continue
-            rider_time = None
-            for time_line in time_e_text.split("\n"):
-                if ",," not in time_line and "″" not in time_line:
-                    rider_time = time_line
-                    break
-            if rider_time:
-                rider_time = format_time(rider_time.replace(" ", ""))
-            times.append(rider_time)
-        return times
+        return [self._time_value(time_e) for time_e in times_elements]
 
     def bonus(self) -> List[str]:
         """
@@ -293,26 +446,7 @@ class TableParser:
         :return: List of bonuses.
         """
         bonuses_elements = self.html_table.css("tr > td.ar.cu600")
-        bonuses = []
-        for bonus_e in bonuses_elements:
-            bonus = bonus_e.text().replace("″", "").replace(" ", "")
-            if not bonus:
-                bonus = "0:00:00"
-            else:
-                seconds = "00"
-                minutes = "00"
-                splitted = bonus.split(":")
-                if len(splitted) > 1:
-                    minutes = splitted[0]
-                    if len(minutes) == 1:
-                        minutes = "0" + minutes
-                    seconds = splitted[1]
-                else:
-                    seconds = splitted[0]
-                    if len(seconds) == 1:
-                        seconds = "0" + seconds
-                bonus = f"0:{minutes}:{seconds}"
-            bonuses.append(bonus)
+        bonuses = [self._bonus_value(bonus_e) for bonus_e in bonuses_elements]
         if not bonuses:
             bonuses = ["0:00:00" for _ in range(self.table_length)]
         return bonuses
@@ -321,12 +455,9 @@ class TableParser:
         "p0", "p1", "p2", "p3", "p4", "p5"
     ]]:
         icons_elements = self.html_table.css(".icon.profile")
-        profiles = []
-        for icon_e in icons_elements:
-            classes = icon_e.attributes['class']
-            if classes and len(classes.split(" ")) >= 3:
-                profiles.append(classes.split(" ")[2])
-        return profiles
+        profiles = [self._profile_icon_value(icon_e)
+                    for icon_e in icons_elements]
+        return [profile for profile in profiles if profile is not None]
 
     def season(self) -> List[Optional[int]]:
         """
@@ -338,95 +469,40 @@ class TableParser:
         seasons_elements = self.html_table.css(".season")
         if not seasons_elements:
             seasons_elements = self.html_table.css("tr > td.fs11 > a")
-        seasons = []
-        for season_e in seasons_elements:
-            season_e_text = season_e.text()
-            if season_e_text.isnumeric():
-                seasons.append(int(season_e_text))
-            else:
-                seasons.append(None)
-        return seasons
+        return [self._season_value(season_e) for season_e in seasons_elements]
     
     def rider_number(self) -> List[Optional[int]]:
         bibs_elements = self.html_table.css(".bibs")
-        return [int(bib_e.text()) if bib_e.text().isnumeric() else None \
-            for bib_e in bibs_elements]
+        return [self._rider_number_value(bib_e) for bib_e in bibs_elements]
 
     def rank(self) -> List[Optional[int]]:
-        possible_columns = ["Rnk", "pos", "Result", "#"]
-        for column_name in possible_columns:
-            try:
-                return self.parse_extra_column(column_name,
-                    lambda x: int(x) if x.isnumeric() else None)
-            except ValueError:
-                pass
-        raise ValueError("Rank column wasn't found.")
+        return self._parse_header_field("rank")
 
     def removed_rank(self) -> List[Optional[int]]:
         """Parses rank values for results that have been removed (struck
         through). Returns the rank as int if removed, None otherwise."""
-        possible_columns = ["Rnk", "pos", "Result", "#"]
-        for column_name in possible_columns:
-            try:
-                index = self._get_column_index_from_header(column_name)
-                elements = self.html_table.css(
-                    f"{self.table_row_tag} > {self.row_column_tag}"
-                    f":nth-child({index + 1})")
-                results = []
-                for e in elements:
-                    s_tag = e.css_first("s")
-                    if s_tag:
-                        cleaned = s_tag.text().replace('\xa0', '').strip()
-                        results.append(
-                            int(cleaned) if cleaned.isnumeric() else None)
-                    else:
-                        results.append(None)
-                return results
-            except ValueError:
-                pass
-        raise ValueError("Rank column wasn't found.")
+        index = self._find_column_index(self.column_aliases["rank"], True)
+        elements = self.html_table.css(
+            f"{self.table_row_tag} > {self.row_column_tag}"
+            f":nth-child({index + 1})") # type: ignore
+        return [self._removed_rank_value(e) for e in elements]
 
     def status(self) -> List[Literal[
         "DF", "DNF", "DNS", "OTL", "DSQ"
     ]]:
-        return self.parse_extra_column("Rnk",
-            lambda x: "DF" if x.isnumeric() else x)
+        return self._parse_header_field("status")
 
     def prev_rank(self) -> List[Optional[int]]:
-        try:
-            return self.parse_extra_column("Prev",
-                lambda x: int(x) if x else None)
-        except ValueError:
-            return [None for _ in range(self.table_length)]
+        return self._parse_header_field("prev_rank")
 
     def uci_points(self) -> List[Optional[float]]:
-        try:
-            return self.parse_extra_column("UCI",
-                lambda x: float(x) if x and x.replace('.', '', 1).isdigit() else 0)
-        except ValueError:
-            return [0 for _ in range(self.table_length)]
+        return self._parse_header_field("uci_points")
 
     def pcs_points(self) -> List[Optional[int]]:
-        try:
-            return self.parse_extra_column("Pnt", lambda x: int(x) if x else 0)
-        except ValueError:
-            try:
-                return self.parse_extra_column("PCS points",
-                    lambda x: int(x) if x  and x.isdigit() else 0)
-            except ValueError:
-                return [0 for _ in range(self.table_length)]
+        return self._parse_header_field("pcs_points")
 
     def points(self) -> List[int]:
-        # Try different possible column names for points
-        possible_columns = ["Points", "Pnt", "PCS points"]
-        for column_name in possible_columns:
-            try:
-                return self.parse_extra_column(column_name, lambda x:
-                    int(x) if x and x.isdigit() else 0)
-            except ValueError:
-                continue
-        # If no points column found, return zeros
-        return [0 for _ in range(self.table_length)]
+        return self._parse_header_field("points")
 
     def class_(self) -> List[str]:
         """
@@ -436,26 +512,44 @@ class TableParser:
 
         :return: List of classes.
         """
-        return self.parse_extra_column("Class", str)
+        return self._parse_header_field("class")
 
     def first_places(self) -> List[Optional[int]]:
-        return self.parse_extra_column("Wins", lambda x:
-            int(x) if x.isnumeric() else 0)
+        return self._parse_header_field("first_places")
 
     def second_places(self) -> List[Optional[int]]:
-        return self.parse_extra_column("2nd", lambda x:
-            int(x) if x.isnumeric() else 0)
+        return self._parse_header_field("second_places")
 
     def third_places(self) -> List[Optional[int]]:
-        return self.parse_extra_column("3rd", lambda x:
-            int(x) if x.isnumeric() else 0)
+        return self._parse_header_field("third_places")
 
     def distance(self) -> List[float]:
-        return self.parse_extra_column("KMs", lambda x:
-            float(x) if x else None)
+        return self._parse_header_field("distance")
 
     def date(self) -> List[str]:
-        return self.parse_extra_column("Date", str)
+        return self._parse_header_field("date")
+
+    def column_index(self, column_name: str) -> Optional[int]:
+        """
+        Finds index of a column by its name from table header. Exact
+        (case-insensitive) matches are preferred, otherwise the first column
+        which header contains given name is returned. Results are memoized.
+
+        :param column_name: Column name or name of `column_aliases` group.
+        :return: Index of the column, None when not found or table doesn't
+        have a header.
+        """
+        search_text = column_name.lower().strip()
+        if search_text in self._column_index_cache:
+            return self._column_index_cache[search_text]
+        index = self.header_index.get(search_text)
+        if index is None:
+            for header_text, i in self._header_texts:
+                if search_text in header_text:
+                    index = i
+                    break
+        self._column_index_cache[search_text] = index
+        return index
 
     def rename_field(self, field_name: str, new_field_name: str) -> None:
         """
@@ -468,77 +562,520 @@ class TableParser:
             value = row.pop(field_name)
             row[new_field_name] = value
 
+    _header_fields: Dict[str, Tuple[Tuple[str, ...], Callable[[str], Any],
+                                    Any]] = {
+        "rank": (column_aliases["rank"],
+                 lambda x: int(x) if x.isnumeric() else None, _REQUIRED),
+        "status": (("Rnk",), lambda x: "DF" if x.isnumeric() else x,
+                   _REQUIRED),
+        "prev_rank": (("Prev",), lambda x: int(x) if x.isnumeric() else None,
+                      None),
+        "uci_points": (("UCI",), lambda x: float(x)
+                       if x and x.replace('.', '', 1).isdigit() else 0, 0),
+        "pcs_points": (column_aliases["pcs_points"],
+                       lambda x: int(x) if x and x.isdigit() else 0, 0),
+        "points": (column_aliases["points"],
+                   lambda x: int(x) if x and x.isdigit() else 0, 0),
+        "class": (("Class",), str, _REQUIRED),
+        "first_places": (("Wins",), lambda x: int(x) if x.isnumeric() else 0,
+                         _REQUIRED),
+        "second_places": (("2nd",), lambda x: int(x) if x.isnumeric() else 0,
+                          _REQUIRED),
+        "third_places": (("3rd",), lambda x: int(x) if x.isnumeric() else 0,
+                         _REQUIRED),
+        "distance": (("KMs",), lambda x: float(x) if x else None, _REQUIRED),
+        "date": (("Date",), str, _REQUIRED),
+    }
+    """
+    Fields parsed from a column found by table header. Values are tuples of
+    possible column names, function to call on column text and default value
+    when column isn't in header (`_REQUIRED` when error should be raised).
+    """
+
+    _link_fields: Dict[str, Tuple[str, bool, Callable[[str, str], bool]]] = {
+        "rider_url": ("rider", True, lambda href, text: True),
+        "rider_name": ("rider", False, lambda href, text: True),
+        "stage_url": ("race", True, lambda href, text: True),
+        "stage_name": ("race", False, lambda href, text: True),
+        "nation_url": ("nation", True, lambda href, text: "pcs" not in href),
+        "nation_name": ("nation", False,
+                        lambda href, text: not text.isnumeric() and
+                        text != "-"),
+        "climb_url": ("location", True, lambda href, text: True),
+        "climb_name": ("location", False, lambda href, text: True),
+    }
+    """
+    Fields parsed from links. Values are tuples of kind of the link (see
+    `link_kinds`), whether to get href (otherwise text) and validator called
+    with link's href and text.
+    """
+
+    _element_fields: Dict[str, Tuple[str, str, Any]] = {
+        "breakaway_kms": (".ridername", "_breakaway_kms_value", None),
+        "age": (".age", "_age_value", None),
+        "nationality": (".flag", "_nationality_value", None),
+        "time": (".time", "_time_value", None),
+        "bonus": ("tr > td.ar.cu600", "_bonus_value", "0:00:00"),
+        "profile_icon": (".icon.profile", "_profile_icon_value", None),
+        "rider_number": (".bibs", "_rider_number_value", None),
+    }
+    """
+    Fields parsed from the first row element matching a selector. Values are
+    tuples of the selector, name of value parsing method and default value
+    when element isn't in the row.
+    """
+
+    def _parse_rows(self, fields: Union[List[str], Tuple[str, ...]]
+                    ) -> List[Dict[str, Any]]:
+        """
+        Parses table row by row (``rows`` engine of `self.parse`). Header
+        columns are resolved and every needed selector is evaluated only once
+        for the whole table. Found elements are assigned to the rows they
+        belong to, so every row is then parsed in one pass.
+
+        :param fields: Fields to parse, same as `self.parse` fields.
+        :return: Parsed table.
+        """
+        selectors: Set[str] = set()
+        extractors = [(field, self._row_extractor(field, selectors))
+                      for field in fields]
+        with self._timer("(elements)", "rows"):
+            rows = self._row_contexts(selectors)
+        if self.instrumentation is not None:
+            # fields are extracted column by column, so they can be timed
+            columns = []
+            for field, extractor in extractors:
+                with self._timer(field, "rows"):
+                    columns.append([extractor(row) for row in rows])
+            return [dict(zip(fields, values)) for values in zip(*columns)]
+        return [{field: extractor(row) for field, extractor in extractors}
+                for row in rows]
+
+    def _row_contexts(self, selectors: Set[str]) -> List[_RowContext]:
+        """
+        Evaluates given selectors once for the whole table and assigns found
+        elements to the rows they belong to.
+
+        :param selectors: Selectors needed by row extractors.
+        :return: Contexts of table rows.
+        """
+        rows = [_RowContext(row_element) for row_element in self._rows]
+        row_ids = self._row_ids()
+        for selector in selectors:
+            if selector == "a":
+                for kind, links in self.link_index.items():
+                    for row_index, href, text in links:
+                        if row_index is not None:
+                            rows[row_index].links.setdefault(kind, []).append(
+                                (href, text))
+                continue
+            for element in self.html_table.css(selector):
+                row_index = self._element_row_index(element, row_ids)
+                if row_index is None:
+                    continue
+                row = rows[row_index]
+                if selector not in row.elements:
+                    row.elements[selector] = element
+        return rows
+
+    def _timer(self, field: str, engine: str) -> ContextManager[None]:
+        """
+        Times parsing of a field by `self.instrumentation` if it's set.
+
+        :param field: Parsed field.
+        :param engine: Engine parsing the field.
+        :return: Context manager timing its block.
+        """
+        if self.instrumentation is None:
+            return contextlib.nullcontext()
+        return self.instrumentation.timer(
+            "table_field_seconds", field=field, engine=engine)
+
+    def _row_ids(self) -> Dict[int, int]:
+        """
+        :return: Indexes of table rows mapped by `mem_id` of the rows.
+        """
+        return {row.mem_id: i for i, row in enumerate(self._rows)}
+
+    def _element_row_index(self, element: Node, row_ids: Dict[int, int]
+                           ) -> Optional[int]:
+        """
+        Finds the closest table row that contains given element.
+
+        :param element: Element from the table.
+        :param row_ids: Indexes of table rows mapped by their `mem_id`.
+        :return: Index of the table row, None when element isn't in any row.
+        """
+        node = element.parent
+        while node is not None and node.tag != self.html_table.tag:
+            if node.tag == self.table_row_tag and node.mem_id in row_ids:
+                return row_ids[node.mem_id]
+            node = node.parent
+        return None
+
+    def _build_link_index(self) -> Dict[
+            str, List[Tuple[Optional[int], str, str]]]:
+        """
+        Classifies all table links by `link_kinds` in one pass, see
+        `self.link_index`.
+
+        :return: Link index.
+        """
+        link_index: Dict[str, List[Tuple[Optional[int], str, str]]] = {
+            kind: [] for kind in self.link_kinds.values()}
+        row_ids = self._row_ids()
+        for a_element in self.a_elements:
+            href = a_element.attributes.get("href", None)
+            if not href:
+                continue  # Skip elements without href
+            kinds = {self.link_kinds[part] for part in href.split("/")
+                     if part in self.link_kinds}
+            if not kinds:
+                continue
+            link = (self._element_row_index(a_element, row_ids), href,
+                    a_element.text())
+            for kind in kinds:
+                link_index[kind].append(link)
+        return link_index
+
+    def _filter_links(self, kind: str, get_href: bool,
+                      validator: Callable[[str, str], bool]) -> List[str]:
+        """
+        Gets hrefs or texts of all table links of given kind.
+
+        :param kind: Kind of the links, see `link_kinds`.
+        :param get_href: Whether to get hrefs of links, otherwise texts.
+        :param validator: Function called with link's href and text, link is
+            skipped when False is returned.
+        :return: List of hrefs or texts.
+        """
+        return [href if get_href else text
+                for _, href, text in self.link_index[kind]
+                if validator(href, text)]
+
+    def _link_column(self, field: str) -> List[str]:
+        """
+        Parses field from `_link_fields` using the ``columns`` engine.
+
+        :param field: Name of the field.
+        :return: List with parsed values.
+        """
+        kind, get_href, validator = self._link_fields[field]
+        return self._filter_links(kind, get_href, validator)
+
+    @staticmethod
+    def _team_link_validator(href: str, text: str) -> bool:
+        """Skips `view` links when teams are parsed without a Team column."""
+        return text != "view"
+
+    def _row_extractor(self, field: str, selectors: Set[str]
+                       ) -> Callable[[_RowContext], Any]:
+        """
+        Makes function that parses given field from a table row.
+
+        :param field: Field to parse, same as `self.parse` fields.
+        :param selectors: Set to which selectors of elements needed for
+            parsing the field are added.
+        :raises ValueError: When field can't be parsed or required column
+            isn't in table header.
+        :return: Function taking `_RowContext` and returning parsed value.
+        """
+        if field in self._header_fields:
+            column_names, func, default = self._header_fields[field]
+            index = self._find_column_index(column_names,
+                                            default is _REQUIRED)
+            if index is None:
+                return lambda row: default
+            return lambda row: self._cell_value(row, index, func)
+        if field == "removed_rank":
+            column_names = self._header_fields["rank"][0]
+            index = self._find_column_index(column_names, True)
+            def removed_rank(row: _RowContext) -> Optional[int]:
+                if index >= len(row.cells):
+                    return None
+                return self._removed_rank_value(row.cells[index])
+            return removed_rank
+        if field in self._link_fields:
+            kind, get_href, validator = self._link_fields[field]
+            selectors.add("a")
+            return lambda row: self._link_value(row, kind, get_href,
+                                                validator)
+        if field in ("team_url", "team_name"):
+            get_href = field == "team_url"
+            try:
+                index = self._find_column_index(("Team",), False)
+            except ExpectedParsingError:
+                index = None
+            if index is not None:
+                return lambda row: self._cell_value(row, index, str,
+                                                    get_href=get_href)
+            selectors.add("a")
+            return lambda row: self._link_value(
+                row, "team", get_href, self._team_link_validator)
+        if field == "season":
+            selector = ".season"
+            if not self.html_table.css_first(selector):
+                selector = "tr > td.fs11 > a"
+            selectors.add(selector)
+            return lambda row: self._element_value(row, selector,
+                                                   self._season_value, None)
+        if field in self._element_fields:
+            selector, method_name, default = self._element_fields[field]
+            method = getattr(self, method_name)
+            selectors.add(selector)
+            return lambda row: self._element_value(row, selector, method,
+                                                   default)
+        raise ValueError(f"Field '{field}' can't be parsed by rows engine")
+
+    def _find_column_index(self, column_names: Tuple[str, ...],
+                           required: bool) -> Optional[int]:
+        """
+        Finds index of the first column from given columns that is in table
+        header.
+
+        :param column_names: Possible names of the column.
+        :param required: Whether to raise error when column isn't found.
+        :raises ExpectedParsingError: When table doesn't have a header.
+        :raises ValueError: When column is required and wasn't found.
+        :return: Index of the column, None when column wasn't found.
+        """
+        if self.header is None:
+            raise ExpectedParsingError(f"Can not parse '{column_names[0]}' " +
+                                       "column without table header")
+        for column_name in column_names:
+            index = self.column_index(column_name)
+            if index is not None:
+                return index
+        if required:
+            raise ValueError(f"'{column_names[0]}' column wasn't found.")
+        return None
+
+    def _parse_header_field(self, field: str) -> List[Any]:
+        """
+        Parses field from `_header_fields` using the ``columns`` engine.
+
+        :param field: Name of the field.
+        :raises ExpectedParsingError: When table doesn't have a header.
+        :raises ValueError: When field's column is required and isn't in
+        table header.
+        :return: List with parsed values.
+        """
+        column_names, func, default = self._header_fields[field]
+        index = self._find_column_index(column_names, default is _REQUIRED)
+        if index is None:
+            return [default for _ in range(self.table_length)]
+        return self.parse_extra_column(index, func)
+
+    def _cell_value(self, row: _RowContext, index: int, func: Callable,
+                    get_href: bool = False) -> Any:
+        """
+        Parses value of a row cell same way as `self.parse_extra_column`.
+
+        :param row: Table row.
+        :param index: Index of the cell (negative indexing works too).
+        :param func: Function to call on cell's text or href.
+        :param get_href: Whether to get href of the cell's link.
+        :return: Parsed value, None when row doesn't have the cell.
+        """
+        if index < 0:
+            index = self.row_length + index
+        cells = row.cells
+        if index >= len(cells) or cells[index].tag != self.row_column_tag:
+            return None
+        cell = cells[index]
+        if get_href:
+            a_element = cell.css_first("a")
+            text = a_element.attributes['href'] if a_element else ""
+        else:
+            text = cell.text(separator="")
+        return func(text)
+
+    @staticmethod
+    def _link_value(row: _RowContext, kind: str, get_href: bool,
+                    validator: Callable[[str, str], bool]) -> Optional[str]:
+        """
+        Finds the first row link of given kind.
+
+        :param row: Table row.
+        :param kind: Kind of the link, see `TableParser.link_kinds`.
+        :param get_href: Whether to get href of the link, otherwise text.
+        :param validator: Function called with link's href and text, link is
+            skipped when False is returned.
+        :return: Link's href or text, None when there is no such link.
+        """
+        for href, text in row.links.get(kind, ()):
+            if validator(href, text):
+                return href if get_href else text
+        return None
+
+    @staticmethod
+    def _element_value(row: _RowContext, selector: str,
+                       func: Callable[[Node], Any], default: Any) -> Any:
+        """
+        Parses value from the first row element matching given selector.
+
+        :param row: Table row.
+        :param selector: CSS selector of the element.
+        :param func: Function to call on the element.
+        :param default: Value when there is no such element in the row.
+        :return: Parsed value.
+        """
+        element = row.elements.get(selector)
+        if element is None:
+            return default
+        return func(element)
+
+    @staticmethod
+    def _breakaway_kms_value(element: Node) -> float:
+        res = 0
+        try:
+            title = element.css_first("div[title~=peloton").attrs['title']
+            for i in range(1, len(title) + 1):
+                try:
+                    float(title[:i])
+                    res = float(title[:i])
+                except ValueError:
+                    break
+        except AttributeError:
+            pass
+        return res
+
+    @staticmethod
+    def _age_value(age_e: Node) -> Optional[int]:
+        return int(age_e.text()) if age_e.text() else None
+
+    @staticmethod
+    def _nationality_value(flag_e: Node) -> Optional[str]:
+        classes = flag_e.attributes.get('class')
+        if classes and " " in classes:
+            return classes.split(" ")[1].upper()
+        return None
+
+    @staticmethod
+    def _time_value(time_e: Node) -> Optional[str]:
+        time_e_text = time_e.text(separator="\n").strip()
+        if not time_e_text or time_e_text == "-":
+            return None  # Handle empty or invalid times as None
+        rider_time = None
+        for time_line in time_e_text.split("\n"):
+            if ",," not in time_line and "″" not in time_line:
+                rider_time = time_line
+                break
+        if rider_time:
+            rider_time = format_time(rider_time.replace(" ", ""))
+        return rider_time
+
+    @staticmethod
+    def _bonus_value(bonus_e: Node) -> str:
+        bonus = bonus_e.text().replace("″", "").replace(" ", "")
+        if not bonus:
+            return "0:00:00"
+        seconds = "00"
+        minutes = "00"
+        splitted = bonus.split(":")
+        if len(splitted) > 1:
+            minutes = splitted[0]
+            if len(minutes) == 1:
+                minutes = "0" + minutes
+            seconds = splitted[1]
+        else:
+            seconds = splitted[0]
+            if len(seconds) == 1:
+                seconds = "0" + seconds
+        return f"0:{minutes}:{seconds}"
+
+    @staticmethod
+    def _profile_icon_value(icon_e: Node) -> Optional[str]:
+        classes = icon_e.attributes.get('class')
+        if classes and len(classes.split(" ")) >= 3:
+            return classes.split(" ")[2]
+        return None
+
+    @staticmethod
+    def _season_value(season_e: Node) -> Optional[int]:
+        season_e_text = season_e.text()
+        if season_e_text.isnumeric():
+            return int(season_e_text)
+        return None
+
+    @staticmethod
+    def _rider_number_value(bib_e: Node) -> Optional[int]:
+        return int(bib_e.text()) if bib_e.text().isnumeric() else None
+
+    @staticmethod
+    def _removed_rank_value(cell: Node) -> Optional[int]:
+        s_tag = cell.css_first("s")
+        if not s_tag:
+            return None
+        cleaned = s_tag.text().replace('\xa0', '').strip()
+        return int(cleaned) if cleaned.isnumeric() else None
+
     def _get_column_index_from_header(self, column_name: str) -> int:
         if self.header is None:
             raise ExpectedParsingError(
                 f"Can not parse '{column_name}' column without table header")
-        for i, column_name_e in enumerate(self.header.css("th")):
-            header_text = column_name_e.text().lower().strip()
-            search_text = column_name.lower().strip()
-            if search_text in header_text:
-                return i
-        raise ValueError(
-            f"'{column_name}' column isn't in table header")
+        index = self.column_index(column_name)
+        if index is None:
+            raise ValueError(
+                f"'{column_name}' column isn't in table header")
+        return index
 
-    def _make_times_absolute(self, time_field: str = "time") -> None:
+    def _make_times_absolute(self, time_field: str = "time",
+                             seconds_field: Optional[str] = None) -> None:
         """
-        Sums all times from table with first time from table. Table has to have
-        at least 2 rows.
+        Sums all times from table with first time from table. Times are
+        converted to seconds once, summed in a single pass and formatted back
+        to `H:MM:SS` format.
 
         :param time_field: Field which represents wanted time, defaults to
         `time`.
+        :param seconds_field: Field to which absolute times are set as counts
+        of seconds, when None times are set only to `time_field`.
         """
-        # reformat times from . separators to :
-        for row in self.table:
+        times, seconds = self._absolute_times(
+            [row[time_field] for row in self.table])
+        for row, time in zip(self.table, times):
+            row[time_field] = time
+        if seconds_field:
+            for row, row_seconds in zip(self.table, seconds):
+                row[seconds_field] = row_seconds
+
+    @staticmethod
+    def _absolute_times(times: List[Any]) -> Tuple[
+            List[str], List[Optional[Union[int, float]]]]:
+        """
+        Sums all times with the first time, see `self._make_times_absolute`.
+
+        :param times: Parsed times, the first one is absolute and others are
+        relative to it.
+        :return: Tuple of absolute times in `H:MM:SS` format and absolute
+        times as counts of seconds.
+        """
+        times = list(times)
+        seconds: List[Optional[Union[int, float]]] = []
+        for i, time in enumerate(times):
             try:
-                if "." in row[time_field]:
-                    [minutes, seconds] = row[time_field].split(".")
-                    row[time_field] = format_time(minutes + ":" + seconds[:2])
+                if ":" not in time and "." in time:
+                    # reformat times from . separators to :
+                    [minutes, secs] = time.split(".")
+                    time = format_time(minutes + ":" + secs[:2])
+                    times[i] = time
+                seconds.append(time_to_seconds(time))
             except Exception:
                 # mark bad times
-                row[time_field] = ""
-
-        first_time = self.table[0][time_field]
-        for i, row in enumerate(self.table[1:]):
-            if row[time_field]:
-                    row[time_field] = add_times(first_time, row[time_field])
+                times[i] = ""
+                seconds.append(None)
+
+        first_seconds = seconds[0] or 0
+        for i in range(1, len(seconds)):
+            if seconds[i] is not None:
+                seconds[i] = first_seconds + seconds[i]
+                times[i] = seconds_to_time(seconds[i])
+            elif i == 1:
+                seconds[i] = 0
+                times[i] = "0:00:00"
             else:
-                if i == 0:
-                    row[time_field] = "0:00:00"
-                else:
-                    # set same time as prev rider
-                    row[time_field] = self.table[1:][i - 1][time_field]
-
-
-    def _filter_a_elements(self, keyword: str, get_href: bool,
-                           validator: Callable = lambda x: True,
-                           extras: Optional[Set[str]] = None) -> List[str]:
-        """
-        Filters from all a elements these which has at the beggining of their
-        href given keyword and gets their href or text.
-
-        :param keyword: Keyword that element's href should have.
-        :param get_href: Whether to return the href of a element, when False
-        text is returned.
-        :param validator: Function to call on every a element. When returns
-        True element is added to result list, otherwise not.
-        :param extras: Extra keywords to match.
-        :return: List of all a elements texts or hrefs with given keyword.
-        """
-        if not extras:
-            extras = {keyword}
-        else:
-            extras.add(keyword)
-        filtered_values = []
-        for a_element in self.a_elements:
-            href = a_element.attributes.get('href', None)
-            if not href:
-                continue  # Skip elements without href
-            parts = set(href.split("/"))
-            for kwrd in extras:
-                if kwrd in parts:
-                    if get_href:
-                        filtered_values.append(href)
-                    else:
-                        filtered_values.append(a_element.text())
-        return filtered_values
+                # set same time as prev rider
+                seconds[i] = seconds[i - 1]
+                times[i] = times[i - 1]
+        return times, seconds
@@ -205,6 +205,18 @@ class Team(Scraper):
 
         :param args: Fields that should be contained in returned table. When
             no args are passed, all fields are parsed.
+
+            - nationality: Rider's nationality as 2 chars long country code.
+            - rider_name:
+            - rider_url:
+            - age: Rider's age.
+            - since: First day for rider in the team in ``MM-DD`` format.
+            - until: Last day for rider in the team in ``MM-DD`` format.
+            - career_points: Rider's career PCS points.
+            - ranking_points: Rider's PCS ranking points in the season.
+            - ranking_position: Rider's PCS ranking position in the season.
+
+        :raises ValueError: When one of args is of invalid value.
         :return: Table with wanted fields.
         """
         available_fields = (
@@ -228,7 +240,8 @@ class Team(Scraper):
         if not career_points_table_html:
             return []  # Return an empty list if the table is not found
             
-        table_parser = TableParser(career_points_table_html)
+        table_parser = TableParser(
+            career_points_table_html, self.instrumentation)
         career_points_fields = [field for field in fields if field in casual_fields]
         
         # Add rider_url to the table for table joining purposes
@@ -246,7 +259,7 @@ class Team(Scraper):
         if "age" in fields:
             ages_table_html = self.html.css_first("div.age.riderlistcont table")
             if ages_table_html:
-                ages_tp = TableParser(ages_table_html)
+                ages_tp = TableParser(ages_table_html, self.instrumentation)
                 ages_tp.parse(["rider_url"])
                 ages = ages_tp.parse_extra_column(2, lambda x: int(x[:2]) if x and x[:2].isdigit() else None)
                 ages_tp.extend_table("age", ages)
@@ -256,7 +269,8 @@ class Team(Scraper):
         if "ranking_position" in fields or "ranking_points" in fields:
             ranking_table_html = self.html.css_first("div.ranking.riderlistcont table")
             if ranking_table_html:
-                ranking_tp = TableParser(ranking_table_html)
+                ranking_tp = TableParser(
+                    ranking_table_html, self.instrumentation)
                 ranking_tp.parse(["rider_url"])
                 if "ranking_points" in fields:
                     points = ranking_tp.parse_extra_column(2, lambda x: int(x.replace("(", "").replace(")", "")) if x.replace("(", "").replace(")", "").isnumeric() else 0)
@@ -270,7 +284,8 @@ class Team(Scraper):
         if "since" in fields or "until" in fields:
             since_until_html_table = self.html.css_first("div.name.riderlistcont ul")
             if since_until_html_table:
-                since_tp = TableParser(since_until_html_table)
+                since_tp = TableParser(
+                    since_until_html_table, self.instrumentation)
                 since_tp.parse(["rider_url"])
                 if "since" in fields:
                     since_dates = since_tp.parse_extra_column(2, lambda x: get_day_month(x) if "as from" in x else "01-01")
@@ -294,16 +309,29 @@ class Team(Scraper):
         :return: Value of given label. Empty string when label is not in
             infolist.
         """
-        # Look for the infolist in the team page
-        infolist = self.html.css_first("ul.infolist")
-        if not infolist:
-            return ""
-        
-        for li in infolist.css("li"):
-            # Each li contains two divs - label and value
-            divs = li.css("div")
-            if len(divs) >= 2:
-                label_text = divs[0].text(strip=True)
-                if label.lower() in label_text.lower():
-                    return divs[1].text(strip=True)
-        return ""
\ No newline at end of file
+        label = label.lower()
+        for label_text, value in self._team_info().items():
+            if label in label_text.lower():
+                return value
+        return ""
+
+    def _team_info(self) -> Dict[str, str]:
+        """
+        Parses infolist of the team page once per HTML.
+
+        :return: Infolist labels mapped to their values in infolist order.
+        """
+        def parse_team_info() -> Dict[str, str]:
+            team_info: Dict[str, str] = {}
+            # Look for the infolist in the team page
+            infolist = self.html.css_first("ul.infolist")
+            if not infolist:
+                return team_info
+            for li in infolist.css("li"):
+                # Each li contains two divs - label and value
+                divs = li.css("div")
+                if len(divs) >= 2:
+                    team_info.setdefault(divs[0].text(strip=True),
+                                         divs[1].text(strip=True))
+            return team_info
+        return self._memoized("team_info", parse_team_info)
\ No newline at end of file
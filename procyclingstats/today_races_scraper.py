@@ -34,6 +34,18 @@ class TodayRaces(Scraper):
         # Pass the homepage URL (empty path resolves to BASE_URL)
         super().__init__("index.php", html=html, update_html=update_html)
 
+    @classmethod
+    def _create_unfetched(cls, url: str) -> "TodayRaces":
+        """
+        Overrides Scraper method. Given URL is ignored, because the homepage
+        is always used.
+
+        :param url: URL of procyclingstats page to parse.
+        :return: TodayRaces object which HTML has to be updated before
+            parsing.
+        """
+        return cls(update_html=False)
+
     def live_races(self) -> List[Dict[str, str]]:
         """
         Parse currently live races from homepage.
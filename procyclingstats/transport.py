@@ -0,0 +1,380 @@
+import abc
+import asyncio
+import gzip
+import io
+import os
+import zlib
+from typing import (IO, Any, Callable, Dict, Iterator, Mapping, Optional,
+                    Tuple)
+
+import requests
+
+
+class Transport(abc.ABC):
+    """
+    Base class of transports, which are sources of HTML pages used instead
+    of requests to procyclingstats. When set as `Scraper.transport` (or as
+    ``transport`` attribute of a scraping class or object), every page is
+    obtained by `fetch` method of the transport. Responses cache, rate
+    limiter and retries aren't used then.
+
+    Subclasses have to override `fetch` method.
+    """
+
+    @abc.abstractmethod
+    def fetch(self, url: str) -> str:
+        """
+        Gets HTML of given page.
+
+        :param url: Absolute URL of the page.
+        :raises ConnectionError: When the page isn't available.
+        :return: HTML as string.
+        """
+
+    async def fetch_async(self, url: str) -> str:
+        """
+        Asynchronous version of `fetch`. Calls `fetch` directly by default,
+        which is fine for transports reading local data.
+
+        :param url: Absolute URL of the page.
+        :raises ConnectionError: When the page isn't available.
+        :return: HTML as string.
+        """
+        return self.fetch(url)
+
+    @staticmethod
+    def relative_url(url: str) -> str:
+        """
+        Makes relative URL from given URL, so transports don't depend on the
+        host of absolute URLs.
+
+        :param url: Absolute or relative URL.
+        :return: Relative URL without leading and trailing slashes, e.g.
+            ``race/tour-de-france/2022/stage-21``.
+        """
+        if "://" in url:
+            url = "/".join(url.split("/")[3:])
+        return url.strip("/")
+
+
+class DictTransport(Transport):
+    """
+    Transport serving pages from a dict.
+
+    Usage:
+
+    >>> from procyclingstats import DictTransport, Rider
+    >>> Rider.transport = DictTransport({"rider/tadej-pogacar": html})
+    >>> Rider("rider/tadej-pogacar").nationality()
+    'SI'
+
+    :param pages: Absolute or relative URLs mapped to HTML of the pages.
+    """
+
+    def __init__(self, pages: Mapping[str, str]) -> None:
+        self.pages = {self.relative_url(url): html
+                      for url, html in pages.items()}
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(pages={len(self.pages)})"
+
+    def fetch(self, url: str) -> str:
+        html = self.pages.get(self.relative_url(url))
+        if html is None:
+            raise ConnectionError(f"Page not in transport: '{url}'")
+        return html
+
+
+class DirectoryTransport(Transport):
+    """
+    Transport serving pages from a directory with HTML files (e.g. a local
+    snapshot of procyclingstats). By default files are named the same way as
+    HTML fixtures, that is relative URL with slashes (and other characters
+    forbidden in filenames) replaced by underscores and ``.txt`` extension,
+    so ``tests/fixtures`` directory can be used as a transport.
+
+    Usage:
+
+    >>> from procyclingstats import DirectoryTransport, Scraper, Stage
+    >>> Scraper.transport = DirectoryTransport("tests/fixtures/")
+    >>> Stage("race/tour-de-france/2022/stage-21").distance()
+    115.6
+
+    :param path: Path to the directory.
+    :param extension: Extension of HTML files, defaults to ``.txt``.
+    :param url_to_filename: Function making filename (without extension)
+        from relative URL, defaults to `DirectoryTransport.url_to_filename`.
+    """
+
+    FORBIDDEN_CHARACTERS: str = '<>:"/\\|?*&='
+    """Characters of URLs replaced by underscores in filenames."""
+
+    def __init__(self, path: str, extension: str = ".txt",
+                 url_to_filename: Optional[Callable[[str], str]] = None
+                 ) -> None:
+        self.path = path
+        self.extension = extension
+        self._url_to_filename = url_to_filename or self.url_to_filename
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(path='{self.path}')"
+
+    def fetch(self, url: str) -> str:
+        filename = self._url_to_filename(self.relative_url(url))
+        path = os.path.join(self.path, filename + self.extension)
+        try:
+            with open(path, "r", encoding="utf-8") as html_file:
+                return html_file.read()
+        except FileNotFoundError as e:
+            raise ConnectionError(f"Page not in transport: '{url}'") from e
+
+    @classmethod
+    def url_to_filename(cls, url: str) -> str:
+        """
+        Makes filename from relative URL by replacing slashes and other
+        characters forbidden in filenames with underscores.
+
+        :param url: Relative URL.
+        :return: Filename without extension.
+        """
+        for character in cls.FORBIDDEN_CHARACTERS:
+            url = url.replace(character, "_")
+        return url
+
+
+class WARCTransport(Transport):
+    """
+    Transport serving pages from a WARC archive (``.warc`` or ``.warc.gz``
+    with every record compressed separately or whole file compressed). The
+    archive is indexed when the transport is created and records are read
+    only when they are fetched. When a page is archived more times, the last
+    record is used. Chunked responses and responses compressed by gzip or
+    deflate are decoded.
+
+    The last decompressed gzip member is kept in memory, so records of
+    archive compressed as a whole are fetched without decompressing it
+    again, but the whole decompressed archive is kept in memory then.
+    Archives with every record compressed separately (the usual ``.warc.gz``
+    format) are cheaper, only the fetched record is decompressed.
+
+    Usage:
+
+    >>> from procyclingstats import Scraper, WARCTransport
+    >>> Scraper.transport = WARCTransport("pcs-2024-07.warc.gz")
+
+    :param path: Path to the WARC file.
+    """
+
+    CHUNK_SIZE: int = 1 << 16
+    """Size of chunks read while indexing compressed archive."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._index: Dict[str, Tuple[Optional[int], int, int, str]] = {}
+        """
+        Relative URLs mapped to tuples of offset of gzip member (None when
+        archive isn't compressed), offset and length of record's block
+        (in uncompressed member) and type of the record.
+        """
+        with open(path, "rb") as warc_file:
+            if warc_file.read(2) == b"\x1f\x8b":
+                warc_file.seek(0)
+                for member_offset, member in self._gzip_members(warc_file):
+                    self._index_records(io.BytesIO(member), member_offset)
+            else:
+                warc_file.seek(0)
+                self._index_records(warc_file, None)
+        self._member: Tuple[Optional[int], bytes] = (None, b"")
+        """Offset and content of the last decompressed gzip member."""
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(path='{self.path}')"
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def fetch(self, url: str) -> str:
+        entry = self._index.get(self.relative_url(url))
+        if entry is None:
+            raise ConnectionError(f"Page not in transport: '{url}'")
+        member_offset, offset, length, record_type = entry
+        with open(self.path, "rb") as warc_file:
+            if member_offset is None:
+                warc_file.seek(offset)
+                block = warc_file.read(length)
+            else:
+                member = self._member_content(warc_file, member_offset)
+                block = member[offset:offset + length]
+        if record_type == "resource":
+            return block.decode("utf-8", errors="replace")
+        return self._http_body(url, block)
+
+    def _index_records(self, stream: IO[bytes],
+                       member_offset: Optional[int]) -> None:
+        """
+        Adds response and resource records from given stream to the index.
+
+        :param stream: Stream with WARC records.
+        :param member_offset: Offset of gzip member containing the stream,
+            None when archive isn't compressed.
+        :raises ValueError: When the stream isn't valid WARC.
+        """
+        while True:
+            version = stream.readline()
+            if not version:
+                return
+            if not version.strip():
+                continue
+            if not version.startswith(b"WARC/"):
+                raise ValueError(f"Invalid WARC record in '{self.path}'")
+            headers = {}
+            for line in iter(stream.readline, b""):
+                if not line.strip():
+                    break
+                name, _, value = line.decode("utf-8").partition(":")
+                headers[name.strip().lower()] = value.strip()
+            length = int(headers.get("content-length", 0))
+            offset = stream.tell()
+            stream.seek(length, io.SEEK_CUR)
+            record_type = headers.get("warc-type")
+            uri = headers.get("warc-target-uri", "").strip("<>")
+            if uri and record_type in ("response", "resource"):
+                self._index[self.relative_url(uri)] = (
+                    member_offset, offset, length, record_type)
+
+    def _member_content(self, warc_file: IO[bytes],
+                        member_offset: int) -> bytes:
+        """
+        Decompresses gzip member, the last decompressed member is reused.
+
+        :param warc_file: Compressed file opened in binary mode.
+        :param member_offset: Offset of the member in the file.
+        :return: Decompressed member.
+        """
+        cached_offset, member = self._member
+        if cached_offset != member_offset:
+            warc_file.seek(member_offset)
+            member = next(self._gzip_members(warc_file))[1]
+            self._member = (member_offset, member)
+        return member
+
+    def _gzip_members(self, warc_file: IO[bytes]
+                      ) -> Iterator[Tuple[int, bytes]]:
+        """
+        Decompresses gzip members from current position of the file.
+
+        :param warc_file: Compressed file opened in binary mode.
+        :return: Generator yielding tuples of member offset and decompressed
+            member.
+        """
+        offset = warc_file.tell()
+        data = b""
+        while True:
+            decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            member_offset = offset
+            parts = []
+            while not decompressor.eof:
+                data = data or warc_file.read(self.CHUNK_SIZE)
+                if not data:
+                    if parts:
+                        raise ValueError(
+                            f"Truncated gzip member in '{self.path}'")
+                    return
+                parts.append(decompressor.decompress(data))
+                consumed = len(data) - len(decompressor.unused_data)
+                offset += consumed
+                data = decompressor.unused_data
+            yield member_offset, b"".join(parts)
+
+    @staticmethod
+    def _http_body(url: str, block: bytes) -> str:
+        """
+        Gets body of HTTP response stored in a response record.
+
+        :param url: URL of the response.
+        :param block: Block of the response record.
+        :raises ConnectionError: When response status isn't 200.
+        :return: Decoded body.
+        """
+        head, _, body = block.partition(b"\r\n\r\n")
+        lines = head.decode("iso-8859-1").split("\r\n")
+        status = lines[0].split(" ")
+        if len(status) < 2 or status[1] != "200":
+            raise ConnectionError(
+                f"Archived response of '{url}' isn't successful: {lines[0]}")
+        headers = {}
+        for line in lines[1:]:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip().lower()
+
+        if headers.get("transfer-encoding") == "chunked":
+            body = WARCTransport._dechunk(body)
+        encoding = headers.get("content-encoding")
+        if encoding == "gzip":
+            body = gzip.decompress(body)
+        elif encoding == "deflate":
+            body = zlib.decompress(body)
+        charset = "utf-8"
+        for parameter in headers.get("content-type", "").split(";"):
+            name, _, value = parameter.strip().partition("=")
+            if name == "charset" and value:
+                charset = value.strip('"')
+        return body.decode(charset, errors="replace")
+
+    @staticmethod
+    def _dechunk(body: bytes) -> bytes:
+        """
+        :param body: Body with chunked transfer encoding.
+        :return: Decoded body.
+        """
+        chunks = []
+        position = 0
+        while True:
+            line_end = body.index(b"\r\n", position)
+            size = int(body[position:line_end].split(b";")[0], 16)
+            if size == 0:
+                return b"".join(chunks)
+            chunks.append(body[line_end + 2:line_end + 2 + size])
+            position = line_end + 2 + size + 2
+
+
+class HTTPTransport(Transport):
+    """
+    Transport making requests to a server serving procyclingstats pages, e.g.
+    a local stand-in server for tests or benchmarks. Host of the URLs is
+    replaced by `base_url`. Requests are made once without retries.
+
+    Usage:
+
+    >>> from procyclingstats import HTTPTransport, Scraper
+    >>> Scraper.transport = HTTPTransport("http://localhost:8000/")
+
+    :param base_url: URL of the server.
+    :param session: Session making requests, defaults to new
+        ``requests.Session``.
+    :param timeout: Timeout of requests in seconds, defaults to 30.
+    """
+
+    def __init__(self, base_url: str, session: Any = None,
+                 timeout: float = 30) -> None:
+        self.base_url = base_url.rstrip("/") + "/"
+        self.session = session if session is not None else requests.Session()
+        self.timeout = timeout
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(base_url='{self.base_url}')"
+
+    def fetch(self, url: str) -> str:
+        server_url = self.base_url + self.relative_url(url)
+        try:
+            response = self.session.get(server_url, timeout=self.timeout)
+        except requests.RequestException as e:
+            raise ConnectionError(f"Failed to fetch {server_url}: {e}") from e
+        if response.status_code != 200:
+            raise ConnectionError(
+                f"Failed to fetch {server_url}: {response.status_code}")
+        return response.text
+
+    async def fetch_async(self, url: str) -> str:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.fetch, url)
@@ -131,6 +131,46 @@ def add_times(time1: str, time2: str) -> str:
     tdelta = tdelta1 + tdelta2
     return timedelta_to_time(tdelta)
 
+def time_to_seconds(time: str) -> Union[int, float]:
+    """
+    Converts time in `H:MM:SS`, `M:SS` or `SS` format with optional fraction
+    of a second (e.g. `0:12:34.56`) to count of seconds.
+
+    :param time: Time to convert.
+    :raises ValueError: When time isn't in valid format.
+    :return: Count of seconds, float only when time has fraction of a second.
+    """
+    time = time.replace("*", "")
+    time_part, _, fraction = time.partition(".")
+    parts = time_part.split(":")
+    if len(parts) > 3 or not all(part.isdigit() for part in parts) or \
+            (fraction and not fraction.isdigit()):
+        raise ValueError(f"Invalid time format: {time}")
+    seconds = 0
+    for part in parts:
+        seconds = seconds * 60 + int(part)
+    if fraction:
+        return seconds + int(fraction) / 10 ** len(fraction)
+    return seconds
+
+def seconds_to_time(seconds: Union[int, float]) -> str:
+    """
+    Converts count of seconds to time in `H:MM:SS` format. Fraction of a
+    second is kept with millisecond precision, e.g. `0:12:34.56`.
+
+    :param seconds: Count of seconds to convert.
+    :return: Formatted time.
+    """
+    sign = "-" if seconds < 0 else ""
+    milliseconds = round(abs(seconds) * 1000)
+    seconds, milliseconds = divmod(milliseconds, 1000)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    time = f"{sign}{hours}:{minutes:02d}:{seconds:02d}"
+    if milliseconds:
+        time += "." + f"{milliseconds:03d}".rstrip("0")
+    return time
+
 # HTML parsing functions
 def parse_select(select_menu: Node) -> List[Dict[str, str]]:
     """
@@ -190,7 +230,7 @@ def join_tables(table1: List[Dict[str, Any]],
             table.append({**table2_dict[row[join_key]], **row})
     return table
 
-OPT_IN_FIELDS = ("removed_rank",)
+OPT_IN_FIELDS = ("removed_rank", "time_seconds")
 
 
 def parse_table_fields_args(args: Tuple[str],
@@ -20,4 +20,10 @@ setup(
         "requests",
         "selectolax"
     ],
+    extras_require={
+        "async": ["aiohttp"],
+        "http2": ["httpx[http2]"],
+        "parquet": ["pyarrow"],
+        "pandas": ["pandas"],
+    },
 )
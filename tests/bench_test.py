@@ -0,0 +1,42 @@
+import pytest
+
+from procyclingstats import Ranking
+from procyclingstats.bench import benchmark, benchmark_file, compare
+
+PATH = "tests/fixtures/rankings_individual.txt"
+
+
+def test_benchmark() -> None:
+    results = benchmark([PATH], repeat=1)
+    operations = results["rankings_individual"]
+    for operation in ("HTMLParser", "_html_valid", "construct",
+                      "individual_ranking", "parse"):
+        assert operations[operation]["seconds"] > 0
+        assert operations[operation]["peak_bytes"] >= 0
+    # team ranking isn't on individual ranking page
+    assert "team_ranking" not in operations
+
+    assert not compare(results, results)
+    slower = {"rankings_individual": {
+        "parse": {**operations["parse"],
+                  "seconds": operations["parse"]["seconds"] + 1}}}
+    assert compare(slower, results) == [
+        ("rankings_individual", "parse", operations["parse"]["seconds"],
+         operations["parse"]["seconds"] + 1)]
+
+
+def test_benchmark_construct_today_races(tmp_path) -> None:
+    path = tmp_path / "index.php.txt"
+    path.write_text('<ul class="hp3-livestats"><li class="live">'
+                    '<a href="race/tour-de-france/2024/stage-1">'
+                    '<span class="title">Tour de France</span></a></li></ul>')
+    operations = benchmark_file(str(path), repeat=1)
+    assert "construct" in operations and "live_races" in operations
+
+
+def test_benchmark_reports_errors(monkeypatch) -> None:
+    def broken(self, *args):
+        return {}["rank"]
+    monkeypatch.setattr(Ranking, "individual_ranking", broken)
+    with pytest.raises(RuntimeError):
+        benchmark([PATH], repeat=1)
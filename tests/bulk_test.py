@@ -0,0 +1,31 @@
+from procyclingstats import Scraper
+from procyclingstats.bulk import parse_files, path_to_url
+
+from .fixtures_utils import FixturesUtils
+
+FIXTURES = FixturesUtils("tests/fixtures/")
+URLS = ("race/tour-de-france/2022/stage-21", "rider/alberto-contador",
+        "rankings/individual")
+
+
+def test_path_to_url() -> None:
+    assert path_to_url("tests/fixtures/race_tour-de-france_2022_stage-21.txt"
+                       ) == "race/tour-de-france/2022/stage-21"
+
+
+def test_parse_files() -> None:
+    paths = [f"tests/fixtures/{FIXTURES.url_to_filename(url)}.txt"
+             for url in URLS]
+    expected = []
+    for url, path in zip(URLS, paths):
+        scraper_obj = Scraper._scraping_class_for(url)(
+            url, FIXTURES.get_html_fixture(url), False)
+        expected.append((path, scraper_obj.parse()))
+    assert list(parse_files(paths, workers=1)) == expected
+    assert list(parse_files(paths, workers=2, chunksize=1)) == expected
+
+
+def test_parse_files_errors() -> None:
+    path = "tests/fixtures/rider_alberto-contador.txt"
+    results = dict(parse_files({path: "unknown/page"}, workers=1))
+    assert isinstance(results[path], ValueError)
@@ -0,0 +1,83 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from procyclingstats import HTMLTreeCache, ResponseCache
+
+
+def test_ttl_rules() -> None:
+    cache = ResponseCache(":memory:", default_ttl=10)
+    base = "https://www.procyclingstats.com/"
+    assert cache.ttl(base) == 60
+    assert cache.ttl(base + "race/tour-de-france/1963/stage-1") == float("inf")
+    assert cache.ttl(base + "team/banesto-1997") == float("inf")
+    assert cache.ttl(base + "rider/tadej-pogacar") == 10
+
+
+def test_lookup_and_revalidation() -> None:
+    cache = ResponseCache(":memory:", default_ttl=0.05)
+    cache.store("url", "<html></html>", {"ETag": '"v1"'})
+    cached, fresh = cache.lookup("url")
+    assert fresh and cached.text == "<html></html>" # type: ignore
+    time.sleep(0.06)
+    cached, fresh = cache.lookup("url")
+    assert not fresh
+    assert cache.conditional_headers(cached) == {"If-None-Match": '"v1"'}
+    cache.revalidated(cached) # type: ignore
+    assert cache.lookup("url")[1]
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["revalidations"] == 1
+
+
+def test_counters_from_threads() -> None:
+    cache = ResponseCache(":memory:")
+    cache.store("url", "<html></html>")
+    def use_cache(i: int) -> None:
+        cached, _ = cache.lookup("url")
+        cache.revalidated(cached) # type: ignore
+        cache.store(str(i), "")
+    with ThreadPoolExecutor(8) as executor:
+        list(executor.map(use_cache, range(400)))
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["revalidations"]) == (
+        400, 401, 400)
+    cache.clear()
+    assert cache.stats()["hits"] == 0
+
+
+def test_size_based_eviction() -> None:
+    cache = ResponseCache(":memory:", max_bytes=25)
+    for i in range(5):
+        cache.store(str(i), "x" * 10)
+    assert cache.stats()["entries"] == 2
+    assert cache.get("0") is None
+    assert cache.get("4") is not None
+
+
+def test_tree_cache() -> None:
+    cache = HTMLTreeCache(max_bytes=50)
+    tree = cache.put("a", "<p>a</p>" + " " * 12)
+    tree.css_first("p").decompose()
+    assert cache.get("a").css_first("p").text() == "a" # type: ignore
+    cache.put("b", "<p>b</p>" + " " * 12)
+    cache.get("a")
+    cache.put("c", "<p>c</p>" + " " * 12)
+    assert "a" in cache and "b" not in cache and "c" in cache
+    cache.invalidate("a")
+    assert cache.get("a") is None
+    assert cache.stats() == {"hits": 2, "misses": 1, "entries": 1,
+                             "bytes": 20}
+
+
+def test_tree_cache_ttl() -> None:
+    cache = HTMLTreeCache(max_age=0.05)
+    base = "https://www.procyclingstats.com/"
+    assert cache.ttl(base) == 0.05
+    assert cache.ttl(base + "team/banesto-1997") == float("inf")
+    assert HTMLTreeCache(ttl=lambda url: 5).ttl(base) == 5
+    cache.put(base + "races.php", "<p>today</p>")
+    cache.put(base + "team/banesto-1997", "<p>team</p>")
+    assert cache.get(base + "races.php") is not None
+    time.sleep(0.06)
+    assert cache.get(base + "races.php") is None
+    assert cache.get(base + "team/banesto-1997") is not None
+    assert cache.stats()["entries"] == 1
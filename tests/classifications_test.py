@@ -0,0 +1,62 @@
+from procyclingstats import ClassificationsEngine, Stage
+from procyclingstats.classifications import RESULTS_FIELDS, verify
+from procyclingstats.utils import seconds_to_time, time_to_seconds
+
+from .fixtures_utils import FixturesUtils
+
+FIXTURES = FixturesUtils("tests/fixtures/")
+
+
+def rider(url, team, time, rank, bonus="0:00:00", status="DF", age=30):
+    return {"rider_url": f"rider/{url}", "team_url": f"team/{team}",
+            "time_seconds": time, "rank": rank, "bonus": bonus,
+            "status": status, "age": age}
+
+
+def test_add_stage() -> None:
+    engine = ClassificationsEngine(team_size=2)
+    engine.add_stage([
+        rider("a", "x", 100, 1, "0:00:10"), rider("b", "y", 100, 2, age=22),
+        rider("c", "x", 105, 3, age=21), rider("d", "y", 110, 4),
+        rider("e", "z", 120, 5)])
+    stage = engine.add_stage([
+        rider("b", "y", 200, 1, "0:00:10"), rider("c", "x", 200, 2),
+        rider("a", "x", 215, 3), rider("d", "y", 230, 4, status="DNF"),
+        rider("e", "z", 220, 5, "-0:00:30")])
+    assert [(row["rider_url"], row["time_seconds"], row["prev_rank"])
+            for row in stage.gc] == [("rider/b", 290, 2), ("rider/a", 305, 1),
+                                     ("rider/c", 305, 3), ("rider/e", 370, 5)]
+    assert stage.gc[0]["bonus"] == "0:00:10"
+    assert [row["rider_url"] for row in stage.youth] == ["rider/b",
+                                                         "rider/c"]
+    # team y has only one finisher of the second stage
+    assert [(row["team_url"], row["time_seconds"], row["rank"])
+            for row in stage.teams] == [("team/x", 620, 1)]
+
+
+def test_verify_with_parsed_gc() -> None:
+    url = "race/tour-de-france/2018/stage-19"
+    stage = Stage(url, FIXTURES.get_html_fixture(url), False)
+    results = stage.results(*RESULTS_FIELDS)
+    gc = stage.gc("rider_url", "rank", "time_seconds", "bonus")
+    # the first stage makes GC before the stage from parsed GC
+    stage_rows = {row["rider_url"]: row for row in results}
+    previous_results = []
+    for row in gc:
+        stage_row = stage_rows[row["rider_url"]]
+        stage_bonus = time_to_seconds(stage_row["bonus"])
+        bonus = time_to_seconds(row["bonus"])
+        previous_results.append({
+            **stage_row,
+            "rank": row["rank"],
+            "time_seconds": (row["time_seconds"] -
+                             stage_row["time_seconds"] + bonus),
+            "bonus": seconds_to_time(bonus - stage_bonus)
+        })
+    engine = ClassificationsEngine()
+    engine.add_stage(previous_results)
+    reconstructed = engine.add_stage(results).gc
+    assert verify(reconstructed, gc, ("rank", "time_seconds", "bonus")) == []
+    reconstructed[0]["time_seconds"] += 1
+    assert [mismatch.field for mismatch in verify(reconstructed, gc)] == [
+        "time_seconds"]
@@ -0,0 +1,63 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from procyclingstats import EntityIndex, RaceStartlist, Rider, Stage
+
+from .fixtures_utils import FixturesUtils
+
+FIXTURES = FixturesUtils("tests/fixtures/")
+STAGE_URL = "race/tour-de-france/2022/stage-21"
+
+
+def test_canonical_url() -> None:
+    assert EntityIndex.canonical_url(
+        "https://www.procyclingstats.com/race/tour-de-france/2022/gc"
+    ) == "race/tour-de-france/2022"
+    assert EntityIndex.kind(f"{STAGE_URL}/gc") == "stage"
+    assert EntityIndex.kind("rider/tadej-pogacar/statistics") == "rider"
+    assert EntityIndex.kind("team/uae-team-emirates-2022") == "team"
+
+
+def test_entity_index(tmp_path) -> None:
+    path = str(tmp_path / "entities.sqlite")
+    index = EntityIndex(path)
+    startlist_url = "race/tour-de-france/2022/startlist"
+    index.add_page(RaceStartlist(
+        startlist_url, FIXTURES.get_html_fixture(startlist_url), False))
+    stage = Stage(STAGE_URL, FIXTURES.get_html_fixture(STAGE_URL), False)
+    index.add_page(stage)
+    index.add_page(Rider("rider/alberto-contador", FIXTURES.get_html_fixture(
+        "rider/alberto-contador"), False))
+
+    results = stage.results("rider_url", "team_url", "rank")
+    encoded = index.encode(results)
+    assert set(encoded[0]) == {"rider_id", "team_id", "rank"}
+    assert index.decode(encoded) == results
+    assert index.url(encoded[0]["rider_id"]) == "rider/jasper-philipsen"
+    assert index.join(encoded[:1], "nationality", key="rider_id")[0][
+        "nationality"] == "BE"
+    assert index.get(STAGE_URL)["distance"] == 115.6
+    assert index.get("rider/alberto-contador/results")["nationality"] == "ES"
+    index.save()
+    index.close()
+
+    loaded = EntityIndex(path)
+    assert len(loaded) == len(index)
+    assert loaded.get(encoded[0]["team_id"]) == index.get(
+        encoded[0]["team_id"])
+    loaded.close()
+
+
+def test_join_and_add_from_threads() -> None:
+    index = EntityIndex()
+    def add(i: int) -> int:
+        return index.add(f"rider/rider-{i % 10}", name=f"Rider {i % 10}",
+                         **{f"attribute_{i}": i})
+    with ThreadPoolExecutor(8) as executor:
+        ids = list(executor.map(add, range(200)))
+    assert len(index) == 10
+    assert len(index.get(ids[0])) == 3 + 1 + 20 # type: ignore
+    table = [{"rider_id": ids[3]}, {"rider_id": 10}, {"rider_id": -1},
+             {"rider_url": "rider/unknown"}]
+    assert [row.get("rider_name") for row in index.join(
+        table[:3], "name", key="rider_id")] == ["Rider 3", None, None]
+    assert index.join(table[3:], "name")[0]["rider_name"] is None
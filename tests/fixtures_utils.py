@@ -6,6 +6,7 @@ from typing import Any, Dict, List, Optional, Type
 from procyclingstats import Scraper
 from procyclingstats.__main__ import get_corresponding_scraping_class
 from procyclingstats.errors import ExpectedParsingError
+from procyclingstats.transport import DirectoryTransport
 
 
 class FixturesUtils:
@@ -126,6 +127,16 @@ class FixturesUtils:
                 for f in html_files]
         return urls
 
+    def transport(self) -> DirectoryTransport:
+        """
+        Makes transport serving HTML fixtures, so scraper objects can be
+        created from fixtures' URLs without making requests.
+
+        :return: Transport reading HTML fixtures.
+        """
+        return DirectoryTransport(self.fixtures_path, ".txt",
+                                  self.url_to_filename)
+
     @staticmethod
     def url_to_filename(url: str) -> str:
         """
@@ -134,12 +145,7 @@ class FixturesUtils:
         :param url: Relative URL to convert filename from.
         :return: Filename without file type.
         """
-        # Forbidden on Windows: < > : " / \ | ? * and also replace & =
-        forbidden = '<>:"/\\|?*&='
-        filename = url
-        for ch in forbidden:
-            filename = filename.replace(ch, '_')
-        return filename
+        return DirectoryTransport.url_to_filename(url)
 
     @staticmethod
     def filename_to_url(filename: str) -> str:
@@ -0,0 +1,78 @@
+import csv
+import shutil
+
+import pytest
+
+from procyclingstats import Stage, TodayRaces
+from procyclingstats.ingest import URL_COLUMN, ingest, table_fields
+
+FIXTURES = ("race_tour-de-france_2022_stage-21",
+            "race_tour-de-france_2018_stage-3",
+            "team_banesto-1997")
+
+
+def read_csv(path):
+    with open(path, encoding="utf-8") as f:
+        return list(csv.reader(f))
+
+
+def test_ingest(tmp_path) -> None:
+    pages = tmp_path / "pages"
+    (pages / "stages").mkdir(parents=True)
+    for fixture in FIXTURES:
+        directory = pages / "stages" if "stage" in fixture else pages
+        shutil.copy(f"tests/fixtures/{fixture}.txt", directory)
+    (pages / "unknown_page.txt").write_text("<html></html>")
+
+    report = ingest(str(pages), str(tmp_path / "out"), workers=1)
+    assert list(report.errors) == [str(pages / "unknown_page.txt")]
+    with open(tmp_path / "out" / "stage_results.csv", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert report.files[str(tmp_path / "out" / "stage_results.csv")] == \
+        len(rows)
+    assert {row["page_url"] for row in rows} == {
+        "race/tour-de-france/2022/stage-21", "race/tour-de-france/2018/stage-3"}
+    assert list(rows[0]) == [URL_COLUMN, *table_fields(Stage, "results")]
+    assert rows[0]["rider_url"].startswith("rider/")
+    with open(tmp_path / "out" / "team.csv", encoding="utf-8") as f:
+        assert [row["page_url"] for row in csv.DictReader(f)] == [
+            "team/banesto-1997"]
+
+
+def test_ingest_schema_doesnt_depend_on_pages(tmp_path) -> None:
+    headers = []
+    for fixtures in (FIXTURES[:1], FIXTURES[1:2]):
+        pages = tmp_path / fixtures[0]
+        pages.mkdir()
+        for fixture in fixtures:
+            shutil.copy(f"tests/fixtures/{fixture}.txt", pages)
+        out = tmp_path / f"{fixtures[0]}_out"
+        report = ingest(str(pages), str(out), workers=1)
+        assert not report.errors
+        headers.append({path.name: read_csv(path)[0]
+                        for path in out.iterdir()})
+    assert headers[0] == headers[1]
+    assert "stage_climbs.csv" in headers[0]
+
+
+def test_table_fields() -> None:
+    assert table_fields(Stage, "distance") is None
+    assert "time_seconds" not in table_fields(Stage, "results") # type: ignore
+    assert table_fields(Stage, "results")[:2] == ( # type: ignore
+        "rider_name", "rider_url")
+    # page URL doesn't collide with fields of the tables
+    assert "url" in table_fields(TodayRaces, "live_races") # type: ignore
+    assert URL_COLUMN not in table_fields(TodayRaces, "live_races") # type: ignore
+
+
+def test_ingest_parquet(tmp_path) -> None:
+    pyarrow_parquet = pytest.importorskip("pyarrow.parquet")
+    pages = tmp_path / "pages"
+    pages.mkdir()
+    shutil.copy(f"tests/fixtures/{FIXTURES[0]}.txt", pages)
+    ingest(str(pages), str(tmp_path / "out"), "parquet", workers=1)
+    schema = pyarrow_parquet.read_schema(
+        tmp_path / "out" / "stage_results.parquet")
+    assert str(schema.field("rank").type) == "int64"
+    assert str(schema.field("uci_points").type) == "double"
+    assert str(schema.field("rider_name").type) == "string"
@@ -0,0 +1,70 @@
+from procyclingstats import Instrumentation, Scraper, Stage
+
+from .fixtures_utils import FixturesUtils
+
+FIXTURES = FixturesUtils("tests/fixtures/")
+URL = "race/tour-de-france/2022/stage-21"
+
+
+def test_instrumentation(monkeypatch) -> None:
+    events = []
+    instrumentation = Instrumentation(
+        hooks=[lambda name, value, labels: events.append(name)])
+    monkeypatch.setattr(Scraper, "instrumentation", instrumentation)
+    html = FIXTURES.get_html_fixture(URL)
+    monkeypatch.setattr(Scraper, "_make_request", lambda self, url: html)
+
+    Stage(URL).parse(fields=("results", "distance"))
+    metrics = instrumentation.as_dict()
+    for name in ("html_parser_seconds", "html_valid_seconds",
+                 "parsing_method_seconds", "table_field_seconds"):
+        assert name in metrics
+    assert {tuple(sorted(values["labels"].items()))
+            for values in metrics["parsing_method_seconds"]} == {
+        (("method", "distance"), ("scraper", "Stage")),
+        (("method", "results"), ("scraper", "Stage"))}
+    assert {"rider_url", "time"} <= {
+        values["labels"]["field"]
+        for values in metrics["table_field_seconds"]}
+    assert len(events) == sum(values["count"] for series in metrics.values()
+                              for values in series)
+
+    text = instrumentation.to_openmetrics()
+    assert "# TYPE procyclingstats_html_valid_seconds summary" in text
+    assert ('procyclingstats_parsing_method_seconds_count'
+            '{method="distance",scraper="Stage"} 1') in text
+    assert text.endswith("# EOF\n")
+    instrumentation.reset()
+    assert instrumentation.as_dict() == {}
+
+
+def test_instance_instrumentation(monkeypatch) -> None:
+    html = FIXTURES.get_html_fixture(URL)
+    monkeypatch.setattr(Scraper, "_make_request", lambda self, url: html)
+    stage = Stage(URL)
+    stage.instrumentation = Instrumentation()
+    stage.results("rider_url", "time")
+    fields = {values["labels"]["field"] for values in
+              stage.instrumentation.as_dict()["table_field_seconds"]}
+    assert {"rider_url", "time"} <= fields
+    assert Scraper.instrumentation is None
+
+
+def test_instrumentation_disabled_for_instance(monkeypatch) -> None:
+    instrumentation = Instrumentation()
+    monkeypatch.setattr(Scraper, "instrumentation", instrumentation)
+    html = FIXTURES.get_html_fixture(URL)
+    stage = Stage(URL, html, update_html=False)
+    stage.instrumentation = None
+    stage.results("rider_url", "time")
+    assert "table_field_seconds" not in instrumentation.as_dict()
+
+
+def test_openmetrics_counter() -> None:
+    instrumentation = Instrumentation()
+    instrumentation.observe("downloaded_bytes", 100, scraper='a"b')
+    instrumentation.observe("downloaded_bytes", 50, scraper='a"b')
+    assert instrumentation.to_openmetrics() == (
+        "# TYPE procyclingstats_downloaded_bytes counter\n"
+        'procyclingstats_downloaded_bytes_total{scraper="a\\"b"} 150\n'
+        "# EOF\n")
@@ -0,0 +1,44 @@
+from selectolax.parser import HTMLParser
+
+from procyclingstats import Race, Scraper
+
+from .fixtures_utils import FixturesUtils
+
+RACE_URL = "race/tour-de-france/2022"
+FIXTURES = FixturesUtils("tests/fixtures/")
+AVAILABLE_URLS = (
+    "race/tour-de-france/2022/stage-21",
+    "race/tour-de-france/2022/startlist",
+)
+
+
+def fetch_fixture(self, url: str) -> HTMLParser:
+    relative_url = url.replace(Scraper.BASE_URL, "")
+    if relative_url not in AVAILABLE_URLS:
+        raise ValueError(f"Page not available: '{relative_url}'")
+    return HTMLParser(FIXTURES.get_html_fixture(relative_url))
+
+
+def test_crawl(monkeypatch) -> None:
+    monkeypatch.setattr(Scraper, "fetch_html", fetch_fixture)
+    race = Race(RACE_URL, FIXTURES.get_html_fixture(RACE_URL), False)
+    bundle = race.crawl(concurrency=4, stage_fields=("gc",), climbs=False)
+
+    assert len(bundle["stages"]) == 21
+    last_stage = bundle["stages"][-1]
+    assert last_stage["error"] is None
+    assert last_stage["data"]["gc"][0]["rank"] == 1
+    assert bundle["stages"][0]["data"] is None
+    assert len(bundle["errors"]) == 20
+    assert bundle["startlist"]
+    assert bundle["climbs"] is None
+
+    fetched = []
+    def fetch_and_record(self, url: str) -> HTMLParser:
+        fetched.append(url)
+        return fetch_fixture(self, url)
+    monkeypatch.setattr(Scraper, "fetch_html", fetch_and_record)
+    resumed = race.crawl(stage_fields=("gc",), climbs=False, resume=bundle)
+    assert resumed["stages"][-1] is last_stage
+    assert resumed["startlist"] is bundle["startlist"]
+    assert len(fetched) == 20
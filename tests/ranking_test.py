@@ -0,0 +1,65 @@
+from selectolax.parser import HTMLParser
+
+from procyclingstats import Ranking, Scraper
+
+from .fixtures_utils import FixturesUtils
+
+FIXTURES = FixturesUtils("tests/fixtures/")
+
+
+def test_iter_all(monkeypatch) -> None:
+    url = "rankings/individual"
+    html = FIXTURES.get_html_fixture(url)
+    fetched = []
+    def fetch_html(self, url: str) -> HTMLParser:
+        fetched.append(url)
+        return HTMLParser(html)
+    monkeypatch.setattr(Scraper, "fetch_html", fetch_html)
+
+    ranking = Ranking(url, html, update_html=False)
+    first_page = ranking.individual_ranking("rider_url")
+    rows = list(ranking.iter_all("rider_url", concurrency=2, top_n=250))
+    assert len(rows) == 250
+    # every fetched page returns the fixture, so pages repeat
+    assert rows[:100] == first_page and rows[100:200] == first_page
+    # pages 2 and 3 are needed, at most `concurrency` pages are fetched ahead
+    assert 2 <= len(fetched) <= 4
+    assert "offset=100" in fetched[0]
+    assert fetched[0].startswith(Scraper.BASE_URL + url + "?")
+
+
+def test_iter_all_single_page(monkeypatch) -> None:
+    url = "rankings/races"
+    html = FIXTURES.get_html_fixture(url)
+    fetched = []
+    def fetch_html(self, url: str) -> HTMLParser:
+        fetched.append(url)
+        return HTMLParser(html)
+    monkeypatch.setattr(Scraper, "fetch_html", fetch_html)
+    monkeypatch.setattr(Ranking, "pages_select", lambda self: [])
+
+    ranking = Ranking(url, html, update_html=False)
+    assert list(ranking.iter_all()) == ranking.races_ranking()
+    assert not fetched
+    date = ranking.dates_select()[1]["value"]
+    assert list(ranking.iter_all(date=date)) == ranking.races_ranking()
+    assert len(fetched) == 1
+    assert f"date={date}" in fetched[0]
+
+
+def test_iter_dates(monkeypatch) -> None:
+    url = "rankings/races"
+    html = FIXTURES.get_html_fixture(url)
+    fetched = []
+    def fetch_html(self, url: str) -> HTMLParser:
+        fetched.append(url)
+        return HTMLParser(html)
+    monkeypatch.setattr(Scraper, "fetch_html", fetch_html)
+
+    ranking = Ranking(url, html, update_html=False)
+    dates = [option["value"] for option in ranking.dates_select()[:3]]
+    snapshots = list(ranking.iter_dates(dates=dates))
+    assert [date for date, _ in snapshots] == dates
+    assert snapshots[0][1] == ranking.races_ranking()
+    assert len(fetched) == 2
+    assert f"date={dates[1]}" in fetched[0]
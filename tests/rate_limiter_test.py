@@ -0,0 +1,115 @@
+import email.utils
+import random
+
+import pytest
+
+import procyclingstats.rate_limiter
+from procyclingstats import RateLimiter, ResponseCache, Scraper, Stage
+from procyclingstats.rate_limiter import jittered_backoff, parse_retry_after
+
+
+class FakeTime:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeTime:
+    fake_time = FakeTime()
+    monkeypatch.setattr(procyclingstats.rate_limiter, "time", fake_time)
+    return fake_time
+
+
+def test_token_bucket(clock) -> None:
+    limiter = RateLimiter(rate=2, burst=3, max_in_flight=None)
+    for _ in range(3):
+        assert limiter._try_acquire() == 0
+    assert limiter._try_acquire() == pytest.approx(0.5)
+    clock.sleep(0.5)
+    assert limiter._try_acquire() == 0
+    clock.sleep(100)
+    for _ in range(3):
+        assert limiter._try_acquire() == 0
+    assert limiter._try_acquire() > 0
+
+    start = clock.now
+    limiter.acquire()
+    assert clock.now - start == pytest.approx(0.5)
+    assert limiter.in_flight == 8
+
+
+def test_max_in_flight(clock) -> None:
+    limiter = RateLimiter(rate=100, burst=10, max_in_flight=2)
+    with limiter:
+        with limiter:
+            assert limiter.in_flight == 2
+            assert limiter._try_acquire() == RateLimiter.POLL_INTERVAL
+        assert limiter._try_acquire() == 0
+        limiter.release()
+    assert limiter.in_flight == 0
+
+
+def test_adaptive_rate(clock) -> None:
+    limiter = RateLimiter(rate=2, burst=1, min_rate=0.5)
+    limiter.blocked(retry_after=10)
+    assert limiter.rate == 1
+    assert limiter._try_acquire() == 10
+    limiter.blocked()
+    limiter.blocked()
+    assert limiter.rate == 0.5
+    for _ in range(30):
+        limiter.succeeded()
+    assert limiter.rate == 2
+    clock.sleep(10)
+    assert limiter._try_acquire() == 0
+
+    fixed = RateLimiter(rate=2, adaptive=False)
+    fixed.blocked()
+    assert fixed.rate == 2
+
+
+def test_retry_after(clock) -> None:
+    assert parse_retry_after("120") == 120
+    assert parse_retry_after(
+        email.utils.formatdate(clock.now + 30, usegmt=True)) == 30
+    assert parse_retry_after(
+        email.utils.formatdate(clock.now - 30, usegmt=True)) == 0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_jittered_backoff() -> None:
+    random.seed(1)
+    delays = [jittered_backoff(attempt, cap=5) for attempt in range(10)]
+    assert all(0 <= delay <= min(5, 2 ** attempt)
+               for attempt, delay in enumerate(delays))
+
+
+def test_revalidation_reported_as_success(monkeypatch) -> None:
+    class Response:
+        status_code = 304
+        text = ""
+        headers = {}
+
+    class Session:
+        def get(self, url, headers, timeout):
+            return Response()
+
+    url = Scraper.BASE_URL + "rider/tadej-pogacar"
+    stage = Stage("race/tour-de-france/2022/stage-21", update_html=False)
+    stage.cache = ResponseCache(":memory:", default_ttl=0)
+    stage.cache.store(url, "<cached/>")
+    stage.rate_limiter = RateLimiter(rate=2)
+    stage.rate_limiter.rate = 1
+    monkeypatch.setattr(Scraper, "_session", Session())
+    assert stage._make_request(url) == "<cached/>"
+    assert stage.rate_limiter.rate == 1.1
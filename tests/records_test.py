@@ -0,0 +1,36 @@
+import dataclasses
+
+from procyclingstats import Stage
+from procyclingstats.records import as_dicts, as_records, row_type
+
+from .fixtures_utils import FixturesUtils
+
+FIXTURES = FixturesUtils("tests/fixtures/")
+URL = "race/tour-de-france/2022/stage-21"
+
+
+def test_parse_records() -> None:
+    stage = Stage(URL, FIXTURES.get_html_fixture(URL), False)
+    table = stage.results()
+    records = stage.parse(records=True)["results"]
+    assert type(records[0]).__name__ == "ResultRow"
+    assert not hasattr(records[0], "__dict__")
+    assert records[0].rider_name == table[0]["rider_name"]
+    assert as_dicts(records) == table
+
+
+def test_as_records() -> None:
+    table = [{"name": "Tour de France", "class": "2.UWT"},
+             {"name": "Tour de Pologne", "class": "2.UWT"}]
+    records = as_records(table, "RaceRow")
+    assert records[0].class_ == "2.UWT"
+    assert type(records[0]) is row_type("RaceRow", ("name", "class"))
+    assert as_dicts(records) == table
+
+    @dataclasses.dataclass
+    class RaceRow:
+        name: str
+        class_: str
+
+    assert as_records(table, RaceRow)[1] == RaceRow("Tour de Pologne", "2.UWT")
+    assert as_dicts(as_records(table, RaceRow)) == table
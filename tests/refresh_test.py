@@ -0,0 +1,66 @@
+from procyclingstats import IncrementalRefresher, Scraper, TodayRaces
+
+from .fixtures_utils import FixturesUtils
+
+FIXTURES = FixturesUtils("tests/fixtures/")
+STAGE_URL = "race/tour-de-france/2022/stage-21"
+RIDER_URL = "rider/alberto-contador"
+TODAY_HTML = """
+<h3 class="black-info-title">Results today</h3>
+<ul class="hp2-results"><li class="race">
+  <div><a href="race/tour-de-france/2022/stage-21"><b>Tour de France</b></a></div>
+</li></ul>
+"""
+
+
+def test_refresh(monkeypatch) -> None:
+    pages = {url: FIXTURES.get_html_fixture(url)
+             for url in (STAGE_URL, RIDER_URL)}
+    fetched = []
+    def make_request(self, url: str) -> str:
+        fetched.append(url)
+        return pages[url.replace(Scraper.BASE_URL, "")]
+    monkeypatch.setattr(Scraper, "_make_request", make_request)
+    refresher = IncrementalRefresher(":memory:")
+
+    report = refresher.refresh([STAGE_URL, RIDER_URL])
+    assert report.refreshed == [STAGE_URL, RIDER_URL]
+    assert refresher.get(STAGE_URL)["distance"] == 115.6 # type: ignore
+
+    report = refresher.refresh([STAGE_URL, RIDER_URL])
+    assert report.unchanged == [STAGE_URL, RIDER_URL]
+    assert len(fetched) == 4
+
+    today = TodayRaces(TODAY_HTML, update_html=False)
+    assert today.finished_races()
+    report = refresher.refresh([STAGE_URL, RIDER_URL], today=today)
+    assert report.unchanged == [STAGE_URL]
+    assert report.skipped == [RIDER_URL]
+    assert len(fetched) == 5
+
+    pages[STAGE_URL] += "<!-- updated -->"
+    report = refresher.refresh([STAGE_URL, RIDER_URL], today=today)
+    assert report.refreshed == [STAGE_URL]
+    # Contador didn't ride the stage, so his page isn't dirty
+    assert report.skipped == [RIDER_URL]
+
+
+def test_refresh_other_pages_by_age(monkeypatch) -> None:
+    url = "rankings/individual"
+    html = FIXTURES.get_html_fixture(url)
+    fetched = []
+    def make_request(self, request_url: str) -> str:
+        fetched.append(request_url)
+        return html
+    monkeypatch.setattr(Scraper, "_make_request", make_request)
+    today = TodayRaces(TODAY_HTML, update_html=False)
+
+    refresher = IncrementalRefresher(":memory:", max_age=None)
+    assert refresher.refresh([url], today=today).refreshed == [url]
+    assert refresher.refresh([url], today=today).skipped == [url]
+    assert len(fetched) == 1
+
+    refresher = IncrementalRefresher(":memory:", max_age=0)
+    refresher.refresh([url], today=today)
+    assert refresher.refresh([url], today=today).unchanged == [url]
+    assert len(fetched) == 3
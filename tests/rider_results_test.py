@@ -0,0 +1,55 @@
+import threading
+
+from selectolax.parser import HTMLParser
+
+from procyclingstats import RiderResults, Scraper
+
+from .fixtures_utils import FixturesUtils
+
+URL = "rider/alberto-contador/results"
+
+
+def test_iter_career(monkeypatch) -> None:
+    html = FixturesUtils("tests/fixtures/").get_html_fixture(URL)
+    fetched = []
+    def fetch_html(self, url: str) -> HTMLParser:
+        fetched.append(url)
+        return HTMLParser(html)
+    monkeypatch.setattr(Scraper, "fetch_html", fetch_html)
+
+    results = RiderResults(URL, html, update_html=False)
+    pages_count = len(results.pages_select())
+    rows = list(RiderResults.iter_career("rider/alberto-contador", "rank",
+                                         concurrency=3))
+    # every page returns the same fixture, so all its rows are duplicates
+    assert rows == results.results("rank")
+    assert len(fetched) == pages_count
+    assert "offset=100" in fetched[1]
+
+    rows = RiderResults.iter_career("rider/alberto-contador", "rank",
+                                    seasons=["2017"])
+    next(rows)
+    assert "xseason=2017" in fetched[-1]
+
+
+def test_iter_career_seasons(monkeypatch) -> None:
+    html = FixturesUtils("tests/fixtures/").get_html_fixture(URL)
+    fetched = []
+    def fetch_html(self, url: str) -> HTMLParser:
+        fetched.append((url, threading.current_thread()))
+        return HTMLParser(html)
+    monkeypatch.setattr(Scraper, "fetch_html", fetch_html)
+
+    results = RiderResults(URL, html, update_html=False)
+    seasons = ["2017", "2016", "2015"]
+    rows = list(RiderResults.iter_career(
+        "rider/alberto-contador", "rank", concurrency=2, seasons=seasons))
+    # rows of all pages are the same, so they are yielded only once
+    assert rows == results.results("rank")
+    first_pages = [url for url, _ in fetched if "offset=0" in url]
+    assert [season for season in seasons
+            if any(f"xseason={season}" in url for url in first_pages)] == \
+        seasons
+    # only the rider's page is fetched by the consumer thread
+    assert [url for url, thread in fetched
+            if thread is threading.current_thread()] == [fetched[0][0]]
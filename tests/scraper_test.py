@@ -0,0 +1,246 @@
+import asyncio
+import time
+import types
+
+import pytest
+
+import procyclingstats.scraper
+from procyclingstats import DictTransport, ResponseCache, Scraper, Stage
+
+from .fixtures_utils import FixturesUtils
+
+URL = "race/tour-de-france/2022/stage-21"
+
+
+def create_stage() -> Stage:
+    html = FixturesUtils("tests/fixtures/").get_html_fixture(URL)
+    return Stage(URL, html, update_html=False)
+
+
+def test_parse_fields() -> None:
+    stage = create_stage()
+    parsed = stage.parse(fields=["date", "distance"])
+    assert parsed == {"date": stage.date(), "distance": stage.distance()}
+    with pytest.raises(ValueError):
+        stage.parse(fields=["update_html"])
+
+
+def test_lazy_parse() -> None:
+    stage = create_stage()
+    calls = []
+    stage.gc = lambda: calls.append("gc") # type: ignore
+    parsed = stage.parse(lazy=True)
+    assert "gc" in parsed and "date" in parsed
+    assert parsed["date"] == stage.date()
+    assert not calls
+    parsed["gc"]
+    parsed["gc"]
+    assert calls == ["gc"]
+    assert dict(parsed) == stage.parse() | {"gc": None}
+
+
+def test_parse_raises_key_error_of_parsing_method() -> None:
+    class BrokenStage(Stage):
+        def distance(self) -> float:
+            return {}["distance"]
+
+    html = FixturesUtils("tests/fixtures/").get_html_fixture(URL)
+    stage = BrokenStage(URL, html, update_html=False)
+    for none_when_unavailable in (True, False):
+        with pytest.raises(KeyError):
+            stage.parse(none_when_unavailable=none_when_unavailable)
+    parsed = stage.parse(none_when_unavailable=False, lazy=True)
+    with pytest.raises(KeyError):
+        "distance" in parsed # pylint: disable=pointless-statement
+    assert "invalid" not in parsed
+
+
+def test_memoized_lookups_invalidated_by_update_html() -> None:
+    stage = create_stage()
+    stage_info = stage._stage_info()
+    assert stage._stage_info() is stage_info
+    assert stage._table_html("gc") is stage._table_html("gc")
+    other_url = "race/tour-de-france/2018/stage-3"
+    other_html = FixturesUtils("tests/fixtures/").get_html_fixture(other_url)
+    other_stage = Stage(other_url, other_html, update_html=False)
+    stage.fetch_html = lambda url: other_stage.html # type: ignore
+    stage.update_html()
+    assert stage._stage_info() is not stage_info
+    assert stage.distance() == other_stage.distance()
+    assert stage.stage_type() == other_stage.stage_type()
+
+
+def test_configure_session(monkeypatch) -> None:
+    monkeypatch.setattr(Scraper, "_session", None)
+    session = Scraper.configure_session(pool_maxsize=32, max_retries=2)
+    assert Stage._get_session() is session
+    adapter = session.get_adapter(Scraper.BASE_URL)
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 32
+    assert adapter.max_retries.total == 2
+
+    class Response:
+        status_code = 200
+        text = "<html></html>"
+        headers = {}
+
+    class Session:
+        def get(self, url, headers, timeout):
+            return Response()
+
+    Scraper.configure_session(Session())
+    assert Stage(URL, update_html=False)._make_request(
+        Scraper.BASE_URL) == "<html></html>"
+
+
+class Response:
+    def __init__(self, status: int, text: str, headers=None) -> None:
+        self.status = self.status_code = status
+        self.text_value = text
+        self.headers = headers or {}
+
+    async def text(self) -> str:
+        return self.text_value
+
+    async def __aenter__(self) -> "Response":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        pass
+
+
+class AsyncSession:
+    def __init__(self, responses) -> None:
+        self.responses = list(responses)
+        self.requests_headers = []
+
+    def get(self, url, headers, timeout) -> Response:
+        self.requests_headers.append(headers)
+        return self.responses.pop(0)
+
+
+class SlowTransport(DictTransport):
+    def __init__(self, pages, delays) -> None:
+        super().__init__(pages)
+        self.delays = delays
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def fetch_async(self, url: str) -> str:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delays.get(self.relative_url(url), 0))
+        self.in_flight -= 1
+        return self.fetch(url)
+
+
+def test_create_async_without_aiohttp(monkeypatch) -> None:
+    monkeypatch.setattr(procyclingstats.scraper, "HAS_AIOHTTP", False)
+    html = FixturesUtils("tests/fixtures/").get_html_fixture(URL)
+
+    class Session:
+        def get(self, url, headers, timeout):
+            response = Response(200, html)
+            response.text = html # type: ignore
+            return response
+
+    monkeypatch.setattr(Scraper, "_session", Session())
+    stage = asyncio.run(Stage.create_async(URL))
+    assert stage.distance() == 115.6
+
+
+def test_create_many_async(monkeypatch) -> None:
+    html = FixturesUtils("tests/fixtures/").get_html_fixture(URL)
+    urls = [f"{URL}?v={i}" for i in range(6)]
+    transport = SlowTransport({url: html for url in urls},
+                              {url: 0.01 * (6 - i)
+                               for i, url in enumerate(urls)})
+    monkeypatch.setattr(Scraper, "transport", transport)
+    stages = asyncio.run(Stage.create_many_async(urls, concurrency=2))
+    assert [stage.relative_url() for stage in stages] == urls
+    assert transport.max_in_flight == 2
+
+    results = asyncio.run(Stage.create_many_async(
+        [urls[0], "race/tour-de-france/2022/stage-1"],
+        return_exceptions=True))
+    assert isinstance(results[0], Stage)
+    assert isinstance(results[1], ConnectionError)
+
+
+def test_make_request_async_retry_and_revalidation(monkeypatch) -> None:
+    fake_aiohttp = types.SimpleNamespace(
+        ClientTimeout=lambda total: None, ClientError=OSError)
+    monkeypatch.setattr(procyclingstats.scraper, "aiohttp", fake_aiohttp,
+                        raising=False)
+    monkeypatch.setattr(procyclingstats.scraper, "HAS_AIOHTTP", True)
+    stage = Stage(URL, update_html=False)
+    monkeypatch.setattr(stage, "_retry_delay", lambda *args, **kwargs: 0)
+
+    session = AsyncSession([Response(429, ""), Response(200, "<html/>")])
+    assert asyncio.run(stage._make_request_async(stage.url, session)) == \
+        "<html/>"
+    assert not session.responses
+
+    rider_url = Scraper.BASE_URL + "rider/tadej-pogacar"
+    stage.cache = ResponseCache(":memory:", default_ttl=0)
+    stage.cache.store(rider_url, "<cached/>", {"ETag": '"v1"'})
+    session = AsyncSession([Response(304, "")])
+    assert asyncio.run(stage._make_request_async(rider_url, session)) == \
+        "<cached/>"
+    assert session.requests_headers == [{"If-None-Match": '"v1"'}]
+    assert stage.cache.stats()["revalidations"] == 1
+
+
+def test_invalid_page_not_cached(monkeypatch) -> None:
+    html = FixturesUtils("tests/fixtures/").get_html_fixture(URL)
+    not_found = ('<div class="page-title"><div class="main">'
+                 '<h1>Page not found</h1></div></div>')
+
+    class Session:
+        def __init__(self) -> None:
+            self.texts = [not_found, html]
+
+        def get(self, url, headers, timeout):
+            response = Response(200, self.texts.pop(0))
+            response.text = response.text_value # type: ignore
+            return response
+
+    monkeypatch.setattr(Scraper, "_session", Session())
+    monkeypatch.setattr(Stage, "cache", ResponseCache(":memory:"))
+    with pytest.raises(ValueError):
+        Stage(URL)
+    assert Stage.cache.stats()["entries"] == 0 # type: ignore
+    assert Stage(URL).distance() == 115.6
+    # served from the cache, the session doesn't have more responses
+    assert Stage(URL).distance() == 115.6
+    assert Stage.cache.stats()["hits"] == 1 # type: ignore
+
+
+def test_fetch_many(monkeypatch) -> None:
+    html = FixturesUtils("tests/fixtures/").get_html_fixture(URL)
+    urls = [f"{URL}?v={i}" for i in range(5)]
+    pages = {url: html for url in urls}
+    del pages[urls[2]]
+    monkeypatch.setattr(Scraper, "transport", DictTransport(pages))
+    results = list(Stage.fetch_many(urls, max_workers=3))
+    assert isinstance(results[2], ConnectionError)
+    assert [result.relative_url() for i, result in enumerate(results)
+            if i != 2] == [url for i, url in enumerate(urls) if i != 2]
+
+
+def test_fetch_many_stopped_early(monkeypatch) -> None:
+    html = FixturesUtils("tests/fixtures/").get_html_fixture(URL)
+    urls = [f"{URL}?v={i}" for i in range(20)]
+    fetched = []
+
+    class RecordingTransport(DictTransport):
+        def fetch(self, url: str) -> str:
+            fetched.append(url)
+            return super().fetch(url)
+
+    monkeypatch.setattr(Scraper, "transport",
+                        RecordingTransport({url: html for url in urls}))
+    for stage in Stage.fetch_many(urls, max_workers=2):
+        assert stage.relative_url() == urls[0]
+        break
+    time.sleep(0.1)
+    assert len(fetched) <= 3
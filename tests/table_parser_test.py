@@ -0,0 +1,117 @@
+import array
+import math
+
+from selectolax.parser import HTMLParser
+
+from procyclingstats.columns import as_columns
+from procyclingstats.table_parser import TableParser
+
+from .fixtures_utils import FixturesUtils
+
+TABLE_HTML = """
+<table>
+  <thead><tr><th>Rnk</th><th>Rider</th><th>Age</th></tr></thead>
+  <tbody>
+    <tr><td>1</td><td><a href="rider/a">A</a></td><td class="age">25</td></tr>
+    <tr><td>2</td><td><a href="rider/b">B</a></td><td></td></tr>
+    <tr><td>3</td><td><a href="rider/c">C</a></td><td class="age">31</td></tr>
+  </tbody>
+</table>
+"""
+
+
+def parse_table(html: str, fields, engine: str):
+    table_parser = TableParser(HTMLParser(html).css_first("table"))
+    table_parser.parse(fields, engine=engine) # type: ignore
+    return table_parser.table
+
+
+def test_rows_engine_keeps_values_in_their_rows() -> None:
+    table = parse_table(TABLE_HTML, ["rank", "rider_url", "age"], "rows")
+    assert table == [
+        {"rank": 1, "rider_url": "rider/a", "age": 25},
+        {"rank": 2, "rider_url": "rider/b", "age": None},
+        {"rank": 3, "rider_url": "rider/c", "age": 31},
+    ]
+
+
+def test_engines_parse_same_stage_tables() -> None:
+    url = "race/tour-de-france/2022/stage-21"
+    html = FixturesUtils("tests/fixtures/").get_html_fixture(url)
+    table_html = HTMLParser(html).css_first(".resTab table.results")
+    fields = ["rider_name", "rider_url", "team_name", "team_url", "rank",
+              "prev_rank", "age", "nationality", "time", "bonus",
+              "pcs_points", "uci_points"]
+    columns = parse_table(table_html.html, fields, "columns")
+    rows = parse_table(table_html.html, fields, "rows")
+    assert columns == rows
+
+
+def test_header_index() -> None:
+    table_parser = TableParser(HTMLParser(TABLE_HTML).css_first("table"))
+    assert table_parser.header_index == {"rnk": 0, "rider": 1, "age": 2,
+                                         "rank": 0}
+    assert table_parser.column_index("Rider") == 1
+    assert table_parser.column_index("Prev") is None
+
+
+def test_link_index() -> None:
+    html = """
+    <table><tbody>
+      <tr><td><a href="race/a/2022/stage-1">S1</a></td>
+          <td><a href="nation/x">X</a></td></tr>
+      <tr><td><a href="national-race/b/2022">B</a></td>
+          <td><a href="nation/x/pcs-season-wins">3</a></td></tr>
+    </tbody></table>
+    """
+    table_parser = TableParser(HTMLParser(html).css_first("table"))
+    assert table_parser.link_index["race"] == [
+        (0, "race/a/2022/stage-1", "S1"), (1, "national-race/b/2022", "B")]
+    assert table_parser.stage_url() == ["race/a/2022/stage-1",
+                                        "national-race/b/2022"]
+    assert table_parser.nation_name() == ["X"]
+    table_parser.parse(["stage_name", "nation_url"], engine="rows")
+    assert table_parser.table == [
+        {"stage_name": "S1", "nation_url": "nation/x"},
+        {"stage_name": "B", "nation_url": None}]
+
+
+def test_time_seconds() -> None:
+    html = """
+    <table><tbody>
+      <tr><td class="time">3:05:12</td></tr>
+      <tr><td class="time">0:12</td></tr>
+      <tr><td class="time">-</td></tr>
+      <tr><td class="time">1:02:03</td></tr>
+    </tbody></table>
+    """
+    for engine in ("columns", "rows"):
+        table = parse_table(html, ["time", "time_seconds"], engine)
+        assert table == [
+            {"time": "3:05:12", "time_seconds": 11112},
+            {"time": "3:05:24", "time_seconds": 11124},
+            {"time": "3:05:24", "time_seconds": 11124},
+            {"time": "4:07:15", "time_seconds": 14835},
+        ]
+    assert parse_table(html, ["time_seconds"], "rows")[1] == {
+        "time_seconds": 11124}
+
+
+def test_to_columns() -> None:
+    fields = ["rank", "rider_name", "age", "time_seconds"]
+    html = TABLE_HTML.replace("<td>1</td>", '<td>1</td><td class="time">'
+                              "1:00:00</td>")
+    for engine in ("columns", "rows"):
+        table_parser = TableParser(HTMLParser(html).css_first("table"))
+        columns = table_parser.to_columns(
+            fields, engine=engine) # type: ignore
+        assert not table_parser.table
+        assert list(columns) == fields
+        assert columns["rank"] == array.array("q", [1, 2, 3])
+        assert columns["rider_name"] == ["A", "B", "C"]
+        assert columns["age"].typecode == "d"
+        assert sum(math.isnan(age) for age in columns["age"]) == 1
+        assert columns["time_seconds"] == array.array("q", [3600, 0, 0])
+    table = parse_table(html, fields, "columns")
+    assert as_columns(table, typed=False) == table_parser.to_columns(
+        fields, typed=False)
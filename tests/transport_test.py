@@ -0,0 +1,99 @@
+import gzip
+
+import pytest
+
+from procyclingstats import (DictTransport, HTTPTransport, Scraper, Stage,
+                             Transport, WARCTransport)
+
+from .fixtures_utils import FixturesUtils
+
+FIXTURES = FixturesUtils("tests/fixtures/")
+URL = "race/tour-de-france/2022/stage-21"
+
+
+def warc_record(url: str, block: bytes) -> bytes:
+    return (b"WARC/1.0\r\nWARC-Type: response\r\n" +
+            f"WARC-Target-URI: {Scraper.BASE_URL}{url}\r\n".encode() +
+            f"Content-Length: {len(block)}\r\n\r\n".encode() +
+            block + b"\r\n\r\n")
+
+
+def test_fixtures_transport(monkeypatch) -> None:
+    monkeypatch.setattr(Scraper, "transport", FIXTURES.transport())
+    assert Stage(URL).distance() == 115.6
+    with pytest.raises(ConnectionError):
+        Stage("race/tour-de-france/2022/stage-1")
+
+
+def test_transport_is_abstract() -> None:
+    with pytest.raises(TypeError):
+        Transport() # type: ignore
+
+
+def test_dict_transport() -> None:
+    stage = Stage(URL, update_html=False)
+    stage.transport = DictTransport(
+        {Scraper.BASE_URL + URL: FIXTURES.get_html_fixture(URL)})
+    stage.update_html()
+    assert stage.distance() == 115.6
+
+
+def test_warc_transport(tmp_path) -> None:
+    html = "<html><body>Pogačar</body></html>".encode()
+    chunked = f"{len(html):x}\r\n".encode() + html + b"\r\n0\r\n\r\n"
+    records = [
+        warc_record("rider/a", b"HTTP/1.1 200 OK\r\n"
+                    b"Content-Type: text/html; charset=utf-8\r\n\r\n" + html),
+        warc_record("rider/b", b"HTTP/1.1 200 OK\r\n"
+                    b"Transfer-Encoding: chunked\r\n\r\n" + chunked),
+        warc_record("rider/c", b"HTTP/1.1 404 Not Found\r\n\r\n"),
+    ]
+    plain = tmp_path / "pages.warc"
+    plain.write_bytes(b"".join(records))
+    compressed = tmp_path / "pages.warc.gz"
+    compressed.write_bytes(b"".join(gzip.compress(record)
+                                    for record in records))
+    for path in (plain, compressed):
+        transport = WARCTransport(str(path))
+        assert len(transport) == 3
+        for url in ("rider/a", "rider/b"):
+            assert transport.fetch(Scraper.BASE_URL + url) == html.decode()
+        for url in ("rider/c", "rider/d"):
+            with pytest.raises(ConnectionError):
+                transport.fetch(url)
+
+
+def test_warc_transport_compressed_as_whole(tmp_path, monkeypatch) -> None:
+    html = b"<html></html>"
+    path = tmp_path / "pages.warc.gz"
+    path.write_bytes(gzip.compress(b"".join(
+        warc_record(f"rider/{i}", b"HTTP/1.1 200 OK\r\n\r\n" + html)
+        for i in range(3))))
+    transport = WARCTransport(str(path))
+    decompressed = []
+    gzip_members = transport._gzip_members
+    def count_members(warc_file):
+        decompressed.append(warc_file.tell())
+        return gzip_members(warc_file)
+    monkeypatch.setattr(transport, "_gzip_members", count_members)
+    for i in (0, 2, 1, 0):
+        assert transport.fetch(f"rider/{i}") == html.decode()
+    assert decompressed == [0]
+
+
+def test_http_transport() -> None:
+    requested = []
+
+    class Response:
+        status_code = 200
+        text = "<html></html>"
+
+    class Session:
+        def get(self, url, timeout):
+            requested.append(url)
+            return Response()
+
+    transport = HTTPTransport("http://localhost:8000", Session())
+    assert transport.fetch(Scraper.BASE_URL + "rankings?offset=100") == \
+        "<html></html>"
+    assert requested == ["http://localhost:8000/rankings?offset=100"]